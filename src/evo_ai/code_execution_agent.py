@@ -44,38 +44,332 @@ pre-installed libraries like NumPy, Pandas, Matplotlib, etc. However,
 basic safety validation is still performed to block obviously dangerous operations.
 """
 
+import ast
+import asyncio
+import atexit
+import functools
+import hashlib
+import io
 import json
+import keyword
 import logging
 import os
+import re
+import textwrap
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+import tokenize
+import weakref
+from dataclasses import dataclass, field, fields, replace
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
 
-try:
-    from google import genai
-    from google.genai.types import Tool, ToolCodeExecution, GenerateContentConfig
-    VERTEX_AI_AVAILABLE = True
-except ImportError:
-    VERTEX_AI_AVAILABLE = False
-    print("Warning: Google Cloud AI Platform not installed. Install with: pip install google-cloud-aiplatform google-genai")
-
-# Load environment variables from .env file
-env_path = Path(__file__).parent / ".env"
-load_dotenv(dotenv_path=env_path)
+from .utils import LRUCache, pooled_http_options
 
-# Get environment variables
-PROJECT_ID = os.getenv("PROJECT_ID", "your-project-id")
-LOCATION = os.getenv("LOCATION", "us-central1")
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> Tuple[str, str]:
+    """
+    Load environment variables from the .env file on first use.
+    
+    Returns:
+        Tuple of (PROJECT_ID, LOCATION)
+    """
+    env_path = Path(__file__).parent / ".env"
+    load_dotenv(dotenv_path=env_path)
+    return os.getenv("PROJECT_ID", "your-project-id"), os.getenv("LOCATION", "us-central1")
+
+
+def __getattr__(name: str) -> str:
+    # PROJECT_ID and LOCATION are resolved lazily so importing this module does not read .env
+    if name == "PROJECT_ID":
+        return _load_env()[0]
+    if name == "LOCATION":
+        return _load_env()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Builtins that executed code may not reference
+_UNSAFE_CALLS = frozenset({"__import__", "compile", "exec", "eval"})
+# Attribute names flagged wherever they appear (e.g. `builtins.__import__`); `compile` is left out
+# so that `re.compile` stays allowed, as compiled code can only run through exec or eval
+_UNSAFE_ATTRIBUTES = _UNSAFE_CALLS - {"compile"}
+# Fallback scan for code that cannot be parsed into an AST
+_UNSAFE_CALL_RE = re.compile(r"\b(__import__|compile|exec|eval)\s*\(")
+# Error indicators in output produced without explicit execution results
+_ERROR_INDICATOR_RE = re.compile(r"error:|exception:|traceback|failed", re.IGNORECASE)
+
+# Constant wrapper around the code sent to Gemini
+_PROMPT_PREFIX = "Please execute the following Python code and return the results:\n\n```python\n"
+_PROMPT_SUFFIX = "\n```\n\nMake sure to execute the code and show the output."
+
+
+@dataclass(frozen=True, slots=True)
+class ExecutionResult:
+    """
+    Immutable result of a code execution request.
+    
+    Supports read access by key (``result["output"]``, ``"output" in result``, ``result.get(...)``)
+    so callers written against the previous dictionary results keep working. Results served
+    from the response cache are shared between callers; use ``to_dict()`` for a mutable copy.
+    """
+    success: bool
+    error: str
+    output: str
+    execution_time: float
+    code_executed: str = ""
+    generated_code: Sequence[Mapping[str, Any]] = field(default_factory=list)
+    execution_results: Sequence[Mapping[str, Any]] = field(default_factory=list)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key: str) -> bool:
+        return key in _EXECUTION_RESULT_FIELDS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as a new, mutable plain dictionary."""
+        return {
+            "success": self.success,
+            "error": self.error,
+            "output": self.output,
+            "execution_time": self.execution_time,
+            "code_executed": self.code_executed,
+            "generated_code": [dict(code) for code in self.generated_code],
+            "execution_results": [dict(result) for result in self.execution_results],
+        }
+
+
+_EXECUTION_RESULT_FIELDS = frozenset(f.name for f in fields(ExecutionResult))
+
+
+def _not_initialized_result() -> ExecutionResult:
+    """Result returned when the executor could not be initialized."""
+    return ExecutionResult(
+        success=False,
+        error="VertexAI Code Executor not properly initialized. Please install google-cloud-aiplatform and configure authentication.",
+        output="",
+        execution_time=0,
+    )
+
+
+def _execution_error_result(code: str, error: Exception, execution_time: float) -> ExecutionResult:
+    """Result returned when the GenAI request raised an exception."""
+    error_msg = f"Code execution failed: {str(error)}"
+    logger.error("Code execution failed: %s", error)
+    
+    return ExecutionResult(
+        success=False,
+        error=error_msg,
+        output="",
+        execution_time=execution_time,
+        code_executed=code,
+    )
+
+
+def _invalid_params_result(code: str, error: Exception) -> ExecutionResult:
+    """Result returned when the parameters cannot be bound to variables."""
+    logger.warning("Code execution rejected: %s", error)
+    
+    return ExecutionResult(
+        success=False,
+        error=f"Invalid code execution parameters: {error}",
+        output="",
+        execution_time=0,
+        code_executed=code,
+    )
+
+
+def _local_result(code: str) -> Optional[ExecutionResult]:
+    """
+    Answer trivially empty or literal-only code without contacting Gemini.
+    
+    Args:
+        code: Python code string to execute
+        
+    Returns:
+        ExecutionResult for empty code or code made only of constant expressions,
+        otherwise None.
+    """
+    stripped = code.strip()
+    if not stripped:
+        return ExecutionResult(success=True, error="", output="", execution_time=0, code_executed=code)
+    
+    try:
+        tree = ast.parse(stripped, mode="exec")
+    except SyntaxError:
+        return None
+    
+    if not all(isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) for node in tree.body):
+        return None
+    
+    output = "\n".join(repr(node.value.value) for node in tree.body)
+    return ExecutionResult(success=True, error="", output=output, execution_time=0, code_executed=code)
+
+
+class _ResponseCollector:
+    """
+    Collects streamed GenAI response chunks into the execute_python_code result.
+    Shared by the sync and async execution paths.
+    """
+
+    def __init__(self):
+        self.output_chunks: List[str] = []
+        self.execution_results: List[Dict[str, Any]] = []
+        self.code_executed: List[Dict[str, Any]] = []
+
+    def add(self, chunk: Any) -> None:
+        """
+        Extract text, executable code and execution results from one streamed chunk.
+        
+        Args:
+            chunk: A GenerateContentResponse chunk from the streaming API
+        """
+        # Bound methods are looked up once per chunk rather than once per part
+        append_output = self.output_chunks.append
+        append_code = self.code_executed.append
+        append_result = self.execution_results.append
+        
+        for candidate in chunk.candidates or ():
+            content = candidate.content
+            if content is None:
+                continue
+            for part in content.parts or ():
+                text = getattr(part, 'text', None)
+                if text:
+                    # Streamed text arrives as consecutive fragments of the same text
+                    append_output(text)
+                    continue
+                executable_code = getattr(part, 'executable_code', None)
+                if executable_code:
+                    append_code({
+                        "language": executable_code.language,
+                        "code": executable_code.code
+                    })
+                    append_output("\n")
+                    continue
+                code_execution_result = getattr(part, 'code_execution_result', None)
+                if code_execution_result:
+                    execution_output = code_execution_result.output
+                    append_result({
+                        "outcome": code_execution_result.outcome,
+                        "output": execution_output
+                    })
+                    # Keep each execution output on its own lines
+                    if execution_output:
+                        self.output_chunks.extend(("\n", execution_output, "\n"))
+
+    def result(self, code: str, execution_time: float) -> ExecutionResult:
+        """
+        Build the ExecutionResult from the collected parts.
+        
+        Args:
+            code: The Python code that was executed
+            execution_time: Elapsed time of the request in seconds
+            
+        Returns:
+            ExecutionResult containing execution results, output, and any errors
+        """
+        combined_output = "".join(self.output_chunks).strip()
+        
+        # Check if code execution was successful
+        # Success can be determined by:
+        # 1. Having execution_results with OUTCOME_OK
+        # 2. Having output content without execution_results (indicates successful execution)
+        success = False
+        
+        if self.execution_results:
+            # Check if any execution result has OUTCOME_OK. Outcomes are SDK enum members,
+            # compared by name; a plain string outcome is compared as is.
+            success = any(
+                getattr(result["outcome"], "name", result["outcome"]) == "OUTCOME_OK"
+                for result in self.execution_results
+            )
+        elif combined_output:
+            # If no execution_results but we have output, consider it successful
+            # unless the output contains obvious error indicators
+            success = _ERROR_INDICATOR_RE.search(combined_output) is None
+        
+        return ExecutionResult(
+            success=success,
+            error="" if success else "Code execution failed or produced errors",
+            output=combined_output,
+            execution_time=execution_time,
+            code_executed=code,
+            generated_code=self.code_executed,
+            execution_results=self.execution_results,
+        )
+
+
+def _ensure_env(project_id: str, location: str) -> None:
+    """
+    Set the Vertex AI environment variables read by the GenAI client, writing only
+    the ones that are unset or differ from the requested values.
+    
+    Args:
+        project_id: Google Cloud Project ID
+        location: Google Cloud location for Vertex AI services
+    """
+    for key, value in (
+        ('GOOGLE_CLOUD_PROJECT', project_id),
+        ('GOOGLE_CLOUD_LOCATION', location),
+        ('GOOGLE_GENAI_USE_VERTEXAI', 'True'),
+    ):
+        if os.environ.get(key) != value:
+            os.environ[key] = value
+
+
 class VertexAiCodeExecutor:
     """
     A secure Python code executor using Google GenAI SDK.
     Provides sandboxed execution environment for Python code using Gemini's code execution tool.
     """
+
+    MODEL_ID = "gemini-2.0-flash-001"
+
+    # Keep-alive connection pool limits for the GenAI HTTP transport
+    HTTP_LIMITS = {"max_connections": 64, "max_keepalive_connections": 32, "keepalive_expiry": 60}
+
+    # GenAI SDK modules, imported on first construction and shared by every executor
+    _genai = None
+    _types = None
+    # ToolCodeExecution carries no state, so a single Tool is shared by every executor
+    _code_execution_tool = None
+
+    @classmethod
+    def _import_sdk(cls) -> bool:
+        """
+        Import the Google GenAI SDK on first use and cache it on the class.
+        
+        Returns:
+            True if the SDK is available, False otherwise
+        """
+        if cls._genai is None:
+            try:
+                from google import genai
+                from google.genai import types
+            except ImportError:
+                logger.warning("Google Cloud AI Platform not installed. Install with: pip install google-cloud-aiplatform google-genai")
+                return False
+            cls._genai = genai
+            cls._types = types
+        return True
     
     def __init__(self, project_id: Optional[str] = None, location: str = "us-central1"):
         """
@@ -85,11 +379,12 @@ class VertexAiCodeExecutor:
             project_id: Google Cloud Project ID. If None, will use PROJECT_ID from .env file.
             location: Google Cloud location for Vertex AI services. If None, will use LOCATION from .env file.
         """
-        self.project_id = project_id or PROJECT_ID
-        self.location = location if location != "us-central1" else LOCATION
+        default_project_id, default_location = _load_env()
+        self.project_id = project_id or default_project_id
+        self.location = location if location != "us-central1" else default_location
         self.initialized = False
         
-        if not VERTEX_AI_AVAILABLE:
+        if not self._import_sdk():
             logger.error("Google Cloud AI Platform is not available. Cannot initialize VertexAiCodeExecutor.")
             return
             
@@ -99,26 +394,84 @@ class VertexAiCodeExecutor:
                 logger.warning("No valid project_id provided. Using default 'your-project-id'. Please set PROJECT_ID in .env file or pass project_id parameter.")
             
             # Set environment variables for Vertex AI
-            os.environ['GOOGLE_CLOUD_PROJECT'] = self.project_id
-            os.environ['GOOGLE_CLOUD_LOCATION'] = self.location
-            os.environ['GOOGLE_GENAI_USE_VERTEXAI'] = 'True'
+            _ensure_env(self.project_id, self.location)
             
-            # Initialize the GenAI client
-            self.client = genai.Client()
-            self.model_id = "gemini-2.0-flash-001"
+            # Initialize the GenAI client with pooled keep-alive connections for the sync and
+            # async transports, so cached executors reuse connections across requests
+            self.client = self._genai.Client(http_options=pooled_http_options(**self.HTTP_LIMITS))
+            if hasattr(self.client, "close"):
+                atexit.register(self.client.close)
+            # Async clients per event loop, see _async_client
+            self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+                weakref.WeakKeyDictionary()
+            )
+            self.model_id = self.MODEL_ID
             
-            # Create code execution tool
-            self.code_execution_tool = Tool(
-                code_execution=ToolCodeExecution()
+            # Create code execution tool once and share it across executors
+            if VertexAiCodeExecutor._code_execution_tool is None:
+                VertexAiCodeExecutor._code_execution_tool = self._types.Tool(
+                    code_execution=self._types.ToolCodeExecution()
+                )
+            self.code_execution_tool = VertexAiCodeExecutor._code_execution_tool
+            
+            # The generation config never changes, so it is built once per executor
+            self._gen_config = self._types.GenerateContentConfig(
+                tools=[self.code_execution_tool],
+                temperature=0.0,
             )
             
             self.initialized = True
-            logger.info(f"VertexAI Code Executor initialized for project: {self.project_id}, location: {self.location}")
+            logger.info("VertexAI Code Executor initialized for project: %s, location: %s", self.project_id, self.location)
         except Exception as e:
-            logger.error(f"Failed to initialize VertexAI: {e}")
+            logger.error("Failed to initialize VertexAI: %s", e)
             self.initialized = False
 
-    def execute_python_code(self, code: str, timeout: int = 30) -> Dict[str, Any]:
+    def _async_client(self) -> Any:
+        """
+        Return the GenAI async client for the running event loop, creating it on first use.
+        
+        The async transport's pooled connections belong to the loop that opened them, so
+        sharing self.client.aio would leave a later asyncio.run() with connections of a closed
+        loop. Each loop gets its own client, dropped once the loop is garbage collected.
+        
+        Returns:
+            The client's async API (Client.aio)
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            # Project and location are passed explicitly, since another executor may have
+            # changed the environment variables since this one was created
+            client = self._genai.Client(
+                vertexai=True,
+                project=self.project_id,
+                location=self.location,
+                http_options=pooled_http_options(**self.HTTP_LIMITS),
+            ).aio
+            self._async_clients[loop] = client
+        return client
+
+    def _generation_request(self, code: str) -> Dict[str, Any]:
+        """
+        Build the generate_content_stream arguments for executing code.
+        
+        Args:
+            code: Python code string to execute
+            
+        Returns:
+            Keyword arguments for the sync and async streaming calls
+        """
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Code to execute:\n%s\n%s\n%s", "-" * 50, code, "-" * 50)
+        
+        return {
+            "model": self.model_id,
+            # Create a prompt that instructs the model to execute the code
+            "contents": _PROMPT_PREFIX + code + _PROMPT_SUFFIX,
+            "config": self._gen_config,
+        }
+
+    def execute_python_code(self, code: str, timeout: int = 30) -> ExecutionResult:
         """
         Execute Python code using Google GenAI SDK with code execution tool.
         
@@ -127,113 +480,60 @@ class VertexAiCodeExecutor:
             timeout: Maximum execution time in seconds (note: Gemini has a built-in 30s limit)
             
         Returns:
-            Dictionary containing execution results, output, and any errors
+            ExecutionResult containing execution results, output, and any errors
         """
         if not self.initialized:
-            return {
-                "success": False,
-                "error": "VertexAI Code Executor not properly initialized. Please install google-cloud-aiplatform and configure authentication.",
-                "output": "",
-                "execution_time": 0
-            }
+            return _not_initialized_result()
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             logger.info("Executing Python code using Google GenAI Code Execution")
-            logger.info(f"Code to execute:\n{'-'*50}\n{code}\n{'-'*50}")
-            
-            # Create a prompt that instructs the model to execute the code
-            prompt = f"""Please execute the following Python code and return the results:
-
-```python
-{code}
-```
-
-Make sure to execute the code and show the output."""
-
-            # Generate content with code execution tool
-            response = self.client.models.generate_content(
-                model=self.model_id,
-                contents=prompt,
-                config=GenerateContentConfig(
-                    tools=[self.code_execution_tool],
-                    temperature=0.0,
-                )
-            )
-            
-            execution_time = time.time() - start_time
             
-            # Extract results from the response
-            output_text = ""
-            execution_results = []
-            code_executed = []
+            # Stream the response so parts are collected as the model emits them
+            collector = _ResponseCollector()
+            for chunk in self.client.models.generate_content_stream(**self._generation_request(code)):
+                collector.add(chunk)
             
-            for candidate in response.candidates:
-                for part in candidate.content.parts:
-                    if hasattr(part, 'text') and part.text:
-                        output_text += part.text + "\n"
-                    elif hasattr(part, 'executable_code') and part.executable_code:
-                        code_executed.append({
-                            "language": part.executable_code.language,
-                            "code": part.executable_code.code
-                        })
-                    elif hasattr(part, 'code_execution_result') and part.code_execution_result:
-                        execution_results.append({
-                            "outcome": part.code_execution_result.outcome,
-                            "output": part.code_execution_result.output
-                        })
+            return collector.result(code, time.perf_counter() - start_time)
             
-            # Combine all outputs
-            combined_output = output_text
-            if execution_results:
-                for result in execution_results:
-                    if result.get("output"):
-                        combined_output += result["output"] + "\n"
+        except Exception as e:
+            return _execution_error_result(code, e, time.perf_counter() - start_time)
+
+    async def execute_python_code_async(self, code: str, timeout: int = 30) -> ExecutionResult:
+        """
+        Asynchronously execute Python code using the GenAI async client.
+        Mirrors execute_python_code so several executions can overlap their network latency.
+        
+        Args:
+            code: Python code string to execute
+            timeout: Maximum execution time in seconds (note: Gemini has a built-in 30s limit)
             
-            # Check if code execution was successful
-            # Success can be determined by:
-            # 1. Having execution_results with OUTCOME_OK
-            # 2. Having output content without execution_results (indicates successful execution)
-            success = False
+        Returns:
+            ExecutionResult containing execution results, output, and any errors
+        """
+        if not self.initialized:
+            return _not_initialized_result()
+        
+        start_time = time.perf_counter()
+        
+        try:
+            logger.info("Executing Python code asynchronously using Google GenAI Code Execution")
             
-            if execution_results:
-                # Check if any execution result has OUTCOME_OK
-                success = any(
-                    str(result.get("outcome")).endswith("OUTCOME_OK") 
-                    for result in execution_results
-                )
-            elif output_text or combined_output:
-                # If no execution_results but we have output, consider it successful
-                # unless the output contains obvious error indicators
-                error_indicators = ["error:", "exception:", "traceback", "failed"]
-                has_errors = any(indicator in combined_output.lower() for indicator in error_indicators)
-                success = not has_errors
+            collector = _ResponseCollector()
+            response_stream = await self._async_client().models.generate_content_stream(
+                **self._generation_request(code)
+            )
+            async for chunk in response_stream:
+                collector.add(chunk)
             
-            return {
-                "success": success,
-                "error": "" if success else "Code execution failed or produced errors",
-                "output": combined_output.strip(),
-                "execution_time": execution_time,
-                "code_executed": code,
-                "generated_code": code_executed,
-                "execution_results": execution_results
-            }
+            return collector.result(code, time.perf_counter() - start_time)
             
         except Exception as e:
-            execution_time = time.time() - start_time
-            error_msg = f"Code execution failed: {str(e)}"
-            logger.error(error_msg)
-            
-            return {
-                "success": False,
-                "error": error_msg,
-                "output": "",
-                "execution_time": execution_time,
-                "code_executed": code
-            }
-
-    def validate_code_safety(self, code: str) -> Tuple[bool, str]:
+            return _execution_error_result(code, e, time.perf_counter() - start_time)
+
+    @staticmethod
+    def validate_code_safety(code: str) -> Tuple[bool, str]:
         """
         Validate if the code is safe to execute.
         Note: Gemini's code execution environment is already sandboxed,
@@ -245,51 +545,372 @@ Make sure to execute the code and show the output."""
         Returns:
             Tuple of (is_safe, reason)
         """
-        # List of potentially dangerous operations
-        dangerous_patterns = [
-            '__import__',
-            'compile(',
-            'exec(',
-            'eval(',
-        ]
-        
-        code_lower = code.lower()
+        try:
+            tree = ast.parse(code)
+        except SyntaxError:
+            match = _UNSAFE_CALL_RE.search(code)
+            if match:
+                return False, f"Potentially unsafe operation detected: {match.group(1)}"
+            return True, "Code appears safe for execution"
         
-        for pattern in dangerous_patterns:
-            if pattern in code_lower:
-                return False, f"Potentially unsafe operation detected: {pattern}"
+        # Any reference to the builtin is flagged (including aliasing such as `f = eval`, access
+        # through a module such as `builtins.eval` and `from builtins import eval`), but not
+        # matches inside strings, comments or attributes like `re.compile`
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name) and node.id in _UNSAFE_CALLS:
+                return False, f"Potentially unsafe operation detected: {node.id}"
+            if isinstance(node, ast.Attribute) and node.attr in _UNSAFE_ATTRIBUTES:
+                return False, f"Potentially unsafe operation detected: {node.attr}"
+            if isinstance(node, ast.ImportFrom):
+                for alias in node.names:
+                    if alias.name in _UNSAFE_CALLS:
+                        return False, f"Potentially unsafe operation detected: {alias.name}"
         
         return True, "Code appears safe for execution"
 
 
-def execute_code(code: str, project_id: Optional[str] = None) -> Dict[str, Any]:
+# Initialized executors keyed by (project_id, location), reused across execute_code calls.
+# execute_code_async resolves executors in worker threads, so creation is guarded by a lock.
+_EXECUTOR_CACHE: Dict[Tuple[str, str], VertexAiCodeExecutor] = {}
+_executor_lock = threading.Lock()
+
+
+def _get_executor(project_id: str, location: str) -> VertexAiCodeExecutor:
     """
-    Main function to execute Python code using Google GenAI Code Execution.
+    Return a cached VertexAiCodeExecutor for the given project and location.
+    
+    Only successfully initialized executors are cached, so a failed initialization
+    (e.g. missing credentials) is retried on the next call.
     
     Args:
-        code: Python code string to execute
+        project_id: Google Cloud Project ID
+        location: Google Cloud location for Vertex AI services
+        
+    Returns:
+        The cached or newly created executor
+    """
+    key = (project_id, location)
+    executor = _EXECUTOR_CACHE.get(key)
+    if executor is None:
+        with _executor_lock:
+            executor = _EXECUTOR_CACHE.get(key)
+            if executor is None:
+                executor = VertexAiCodeExecutor(project_id=project_id, location=location)
+                if executor.initialized:
+                    _EXECUTOR_CACHE[key] = executor
+    return executor
+
+
+# Bounded LRU cache of successful execution results, keyed by (code, project, model)
+RESPONSE_CACHE_MAXSIZE = 100
+RESPONSE_CACHE_TTL = 3600  # seconds
+_RESPONSE_CACHE: "LRUCache[str, ExecutionResult]" = LRUCache(RESPONSE_CACHE_MAXSIZE, ttl=RESPONSE_CACHE_TTL)
+
+
+def _canonicalize_code(code: str) -> str:
+    """
+    Normalize code for cache keys so formatting-only variants map to the same entry.
+    
+    Dedents and strips the code and drops comments and blank lines. The remaining lines are
+    kept as written: re-emitting the tokens would also rewrite the spacing inside f-string
+    fields on Python 3.12+, where f"{x = }" and f"{x=}" print different output. Code that
+    cannot be tokenized is returned dedented and stripped. The canonical form is only used
+    for hashing; the original code is what gets executed.
+    
+    Args:
+        code: Python code string
+        
+    Returns:
+        Canonical form of the code
+    """
+    code = textwrap.dedent(code).strip()
+    lines = code.splitlines()
+    blank_rows = set()
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(code).readline):
+            row, col = token.start
+            if token.type == tokenize.COMMENT:
+                lines[row - 1] = lines[row - 1][:col]
+            elif token.type == tokenize.NL:
+                blank_rows.add(row)
+    except (tokenize.TokenError, SyntaxError):
+        return code
+    # NL also ends lines inside brackets, so only rows left empty are dropped
+    return "\n".join(
+        line.rstrip()
+        for row, line in enumerate(lines, start=1)
+        if row not in blank_rows or line.strip()
+    )
+
+
+def _response_cache_key(code: str, project_id: str, model_id: str, params_json: str = "") -> str:
+    """
+    Build the response cache key from a digest of the canonical code and the encoded parameters,
+    plus project and model. The parameters are hashed as is, without tokenizing them.
+    """
+    digest = hashlib.blake2b(_canonicalize_code(code).encode(), digest_size=16)
+    if params_json:
+        digest.update(b"\0" + params_json.encode())
+    return f"{digest.hexdigest()}:{project_id}:{model_id}"
+
+
+# Names used by the binding preamble itself (see _bind_params), so parameters cannot take them
+_RESERVED_PARAM_NAMES = frozenset({"json", "_params"})
+
+
+def _encode_params(params: Optional[Mapping[str, Any]]) -> str:
+    """
+    Encode execute_code parameters as a JSON object, or "" when there are none.
+    
+    Raises:
+        ValueError: If a parameter name is not a valid variable name or is used by the bindings
+        TypeError: If a parameter value is not JSON-serializable
+    """
+    if not params:
+        return ""
+    for name in params:
+        if not isinstance(name, str) or not name.isidentifier() or keyword.iskeyword(name):
+            raise ValueError(f"Parameter name is not a valid variable name: {name!r}")
+        if name in _RESERVED_PARAM_NAMES:
+            raise ValueError(f"Parameter name is reserved for the parameter bindings: {name!r}")
+    if orjson is not None:
+        return orjson.dumps(params, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(params, separators=(",", ":"), default=_json_default)
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert NumPy arrays and scalars for json.dumps, matching orjson's OPT_SERIALIZE_NUMPY."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _preamble_end(code: str) -> int:
+    """
+    Return the number of leading lines holding the module docstring and `from __future__`
+    imports, which must stay at the top of the code.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return 0
+    end = 0
+    for index, node in enumerate(tree.body):
+        is_docstring = (
+            index == 0
+            and isinstance(node, ast.Expr)
+            and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str)
+        )
+        if not (is_docstring or (isinstance(node, ast.ImportFrom) and node.module == "__future__")):
+            break
+        end = node.end_lineno
+    return end
+
+
+def _bind_params(code: str, params: Optional[Mapping[str, Any]], params_json: str) -> str:
+    """
+    Insert a decode of the encoded parameters and an assignment per name into code, after its
+    docstring and `from __future__` imports.
+    """
+    if not params_json:
+        return code
+    bindings = "".join(f"{name} = _params[{name!r}]\n" for name in params)
+    preamble = f"import json\n_params = json.loads({params_json!r})\n{bindings}del _params\n"
+    lines = code.splitlines(keepends=True)
+    end = _preamble_end(code)
+    if end and not lines[end - 1].endswith("\n"):
+        lines[end - 1] += "\n"
+    return "".join(lines[:end]) + preamble + "".join(lines[end:])
+
+
+def _get_cached_response(key: str) -> Optional[ExecutionResult]:
+    """
+    Return the cached result for key, or None on a miss or expired entry.
+    
+    The cached result is returned as is; it is immutable, so no copy is needed.
+    """
+    return _RESPONSE_CACHE.get(key)
+
+
+def _store_cached_response(key: str, result: ExecutionResult) -> None:
+    """Store a read-only copy of result (without its execution time), evicting the least recently used entry."""
+    cached = replace(
+        result,
+        execution_time=0,
+        generated_code=tuple(MappingProxyType(dict(code)) for code in result.generated_code),
+        execution_results=tuple(MappingProxyType(dict(r)) for r in result.execution_results),
+    )
+    _RESPONSE_CACHE.set(key, cached)
+
+
+def _prepare_execution(
+    code: str, project_id: Optional[str], params_json: str = ""
+) -> Tuple[VertexAiCodeExecutor, str, Optional[ExecutionResult]]:
+    """
+    Resolve the executor, validate the code and look up the response cache.
+    
+    Args:
+        code: Python code string to execute, without the parameter bindings
         project_id: Optional Google Cloud Project ID. If None, will use PROJECT_ID from .env file.
+        params_json: Parameters encoded by _encode_params
         
     Returns:
-        Dictionary containing execution results
+        Tuple of (executor, cache_key, early_result). early_result is set when the code was
+        blocked, trivially answerable or a cached result is available, in which case nothing
+        needs to be executed.
     """
-    # Use global PROJECT_ID if no project_id provided
-    effective_project_id = project_id or PROJECT_ID
-    executor = VertexAiCodeExecutor(project_id=effective_project_id)
+    # Use PROJECT_ID from the .env file if no project_id provided
+    default_project_id, location = _load_env()
+    effective_project_id = project_id or default_project_id
+    executor = _get_executor(effective_project_id, location)
     
     # Validate code safety first
     is_safe, safety_reason = executor.validate_code_safety(code)
     
     if not is_safe:
-        logger.warning(f"Code execution blocked: {safety_reason}")
-        return {
-            "success": False,
-            "error": f"Code execution blocked for safety: {safety_reason}",
-            "output": "",
-            "execution_time": 0
-        }
+        logger.warning("Code execution blocked: %s", safety_reason)
+        return executor, "", ExecutionResult(
+            success=False,
+            error=f"Code execution blocked for safety: {safety_reason}",
+            output="",
+            execution_time=0,
+        )
+    
+    # Empty and literal-only code is answered locally, skipping the RPC
+    local_result = _local_result(code)
+    if local_result is not None:
+        return executor, "", local_result
+    
+    # Identical code for the same project and model returns the cached result
+    cache_key = _response_cache_key(code, effective_project_id, getattr(executor, "model_id", ""), params_json)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        logger.info("Returning cached code execution result")
+    
+    return executor, cache_key, cached
+
+
+def execute_code(
+    code: str, project_id: Optional[str] = None, params: Optional[Mapping[str, Any]] = None
+) -> ExecutionResult:
+    """
+    Main function to execute Python code using Google GenAI Code Execution.
+    
+    Data passed as params is bound to variables before the code runs, so the code itself can stay
+    constant instead of embedding the data as literals. Safety checks and cache canonicalization
+    then only process the code.
+    
+    Args:
+        code: Python code string to execute
+        project_id: Optional Google Cloud Project ID. If None, will use PROJECT_ID from .env file.
+        params: Optional JSON-serializable values, bound to variables of the same names
+        
+    Returns:
+        ExecutionResult containing execution results
+    """
+    try:
+        params_json = _encode_params(params)
+    except (TypeError, ValueError) as e:
+        return _invalid_params_result(code, e)
+    executor, cache_key, early_result = _prepare_execution(code, project_id, params_json)
+    if early_result is not None:
+        return early_result
+    
+    result = executor.execute_python_code(_bind_params(code, params, params_json))
+    
+    # Only successful executions are cached so transient failures are retried
+    if result.success:
+        _store_cached_response(cache_key, result)
+    
+    return result
+
+
+async def execute_code_async(
+    code: str, project_id: Optional[str] = None, params: Optional[Mapping[str, Any]] = None
+) -> ExecutionResult:
+    """
+    Asynchronous counterpart of execute_code using the GenAI async client.
+    
+    Args:
+        code: Python code string to execute
+        project_id: Optional Google Cloud Project ID. If None, will use PROJECT_ID from .env file.
+        params: Optional JSON-serializable values, bound to variables of the same names
+        
+    Returns:
+        ExecutionResult containing execution results
+    """
+    try:
+        params_json = _encode_params(params)
+    except (TypeError, ValueError) as e:
+        return _invalid_params_result(code, e)
+    # Creating an executor loads credentials and validation parses the code, so both run in a
+    # worker thread instead of blocking the event loop
+    executor, cache_key, early_result = await asyncio.to_thread(_prepare_execution, code, project_id, params_json)
+    if early_result is not None:
+        return early_result
+    
+    result = await executor.execute_python_code_async(_bind_params(code, params, params_json))
+    
+    # Only successful executions are cached so transient failures are retried
+    if result.success:
+        _store_cached_response(cache_key, result)
+    
+    return result
+
+
+async def execute_many(
+    codes: List[str],
+    project_id: Optional[str] = None,
+    max_concurrency: int = 8,
+    params: Optional[Sequence[Optional[Mapping[str, Any]]]] = None,
+) -> List[ExecutionResult]:
+    """
+    Execute several Python code strings concurrently.
+    
+    Gemini code execution is network-bound, so running the requests concurrently makes a batch
+    take roughly as long as its slowest request instead of the sum of all of them.
+    
+    Args:
+        codes: Python code strings to execute
+        project_id: Optional Google Cloud Project ID. If None, will use PROJECT_ID from .env file.
+        max_concurrency: Maximum number of requests in flight at once
+        params: Optional parameters for each code string, in the same order as codes
+        
+    Returns:
+        Execution results in the same order as codes
+        
+    Raises:
+        ValueError: If params does not have one entry per code string
+    """
+    if params is None:
+        params = [None] * len(codes)
+    elif len(params) != len(codes):
+        raise ValueError(f"Expected {len(codes)} params entries, got {len(params)}")
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _bounded(code: str, code_params: Optional[Mapping[str, Any]]) -> ExecutionResult:
+        async with semaphore:
+            return await execute_code_async(code, project_id, code_params)
+    
+    return await asyncio.gather(*(_bounded(code, code_params) for code, code_params in zip(codes, params)))
+
+
+def result_to_json(result: ExecutionResult) -> bytes:
+    """
+    Serialize an execution result to JSON, using orjson when it is installed.
     
-    return executor.execute_python_code(code)
+    SDK enums such as the execution outcome are written as their string values.
+    
+    Args:
+        result: ExecutionResult returned by execute_code
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(result.to_dict(), default=str)
+    return json.dumps(result.to_dict(), default=str).encode()
 
 
 def create_sample_test_code() -> str:
@@ -369,4 +990,7 @@ if __name__ == "__main__":
         print(result['output'])
     else:
         print("Error:")
-        print(result['error']) 
\ No newline at end of file
+        print(result['error'])
+    
+    print("Raw result:")
+    print(result_to_json(result).decode())
@@ -3,935 +3,554 @@ Fake API responses for testing the Evo AI Agent.
 This module contains realistic geological data for testing agent functionality.
 """
 
-from typing import Any, Dict, List
-
-# Fake API response for get_list_of_objects (latest versions only)
-FAKE_OBJECTS_LIST: List[Dict[str, Any]] = [
-    {
-        "id": "obj_001",
-        "name": "thalanga_local_drillholes_dt",
-        "object_type": "downhole-collection",
-        "created_date": "2024-01-15T10:30:00Z",
-        "created_by": "john.smith@seequent.com",
-        "description": "Downhole collection for Thalanga local drilling data",
-        "version": "latest",
-        "assays": ["gold", "silver", "copper", "zinc"]
-    },
-    {
-        "id": "obj_002", 
-        "name": "thalanga_local_drillholes_e_sm",
-        "object_type": "downhole-collection",
-        "created_date": "2024-01-20T14:45:00Z",
-        "created_by": "jane.doe@seequent.com",
-        "description": "Enhanced downhole collection with detailed assays",
-        "version": "latest",
-        "assays": ["gold", "silver", "copper", "lead", "zinc", "iron"]
-    },
-    {
-        "id": "obj_003",
-        "name": "surface_geology_pointset",
-        "object_type": "pointset",
-        "created_date": "2024-01-25T09:15:00Z",
-        "created_by": "mike.johnson@seequent.com",
-        "description": "Surface geology sampling points",
-        "version": "latest",
-        "attributes": ["formation", "rock_type", "alteration"]
-    },
-    {
-        "id": "obj_004",
-        "name": "mineral_occurrences_pointset",
-        "object_type": "pointset",
-        "created_date": "2024-02-01T11:20:00Z",
-        "created_by": "sarah.wilson@seequent.com",
-        "description": "Mineral occurrence locations and characteristics",
-        "version": "latest",
-        "attributes": ["mineral_type", "grade", "tonnage"]
-    },
-    {
-        "id": "obj_005",
-        "name": "exploration_drillholes_main",
-        "object_type": "downhole-collection",
-        "created_date": "2024-02-10T16:00:00Z",
-        "created_by": "david.brown@seequent.com",
-        "description": "Main exploration drilling program results",
-        "version": "latest",
-        "assays": ["gold", "silver", "copper", "molybdenum", "uranium"]
-    },
-    {
-        "id": "obj_006",
-        "name": "structural_measurements_pointset",
-        "object_type": "pointset",
-        "created_date": "2024-02-15T13:30:00Z",
-        "created_by": "emma.taylor@seequent.com",
-        "description": "Structural geology measurements and orientations",
-        "version": "latest",
-        "attributes": ["dip", "strike", "structure_type", "confidence"]
-    }
-]
+import json
+import sys
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
+import numpy as np
 
-# Fake API response for get_list_of_objects_all_versions (includes version history)
-FAKE_OBJECTS_ALL_VERSIONS: List[Dict[str, Any]] = [
-    {
-        "id": "obj_001",
-        "name": "thalanga_local_drillholes_dt",
-        "object_type": "downhole-collection",
-        "versions": [
-            {
-                "version_id": "v1",
-                "created_date": "2024-01-10T08:00:00Z",
-                "created_by": "john.smith@seequent.com",
-                "description": "Initial version"
-            },
-            {
-                "version_id": "v2",
-                "created_date": "2024-01-15T10:30:00Z",
-                "created_by": "john.smith@seequent.com",
-                "description": "Updated with additional assays"
-            }
-        ],
-        "total_versions": 2,
-        "latest_version": "v2"
-    },
-    {
-        "id": "obj_002",
-        "name": "thalanga_local_drillholes_e_sm",
-        "object_type": "downhole-collection",
-        "versions": [
-            {
-                "version_id": "v1",
-                "created_date": "2024-01-18T12:00:00Z",
-                "created_by": "jane.doe@seequent.com",
-                "description": "Initial enhanced version"
-            },
-            {
-                "version_id": "v2",
-                "created_date": "2024-01-20T14:45:00Z",
-                "created_by": "jane.doe@seequent.com",
-                "description": "Added lead and iron assays"
-            },
-            {
-                "version_id": "v3",
-                "created_date": "2024-01-25T16:15:00Z",
-                "created_by": "jane.doe@seequent.com",
-                "description": "Quality control and validation updates"
-            }
-        ],
-        "total_versions": 3,
-        "latest_version": "v3"
-    },
-    {
-        "id": "obj_003",
-        "name": "surface_geology_pointset",
-        "object_type": "pointset",
-        "versions": [
-            {
-                "version_id": "v1",
-                "created_date": "2024-01-25T09:15:00Z",
-                "created_by": "mike.johnson@seequent.com",
-                "description": "Initial surface geology data"
-            }
-        ],
-        "total_versions": 1,
-        "latest_version": "v1"
-    },
-    {
-        "id": "obj_004",
-        "name": "mineral_occurrences_pointset",
-        "object_type": "pointset",
-        "versions": [
-            {
-                "version_id": "v1",
-                "created_date": "2024-02-01T11:20:00Z",
-                "created_by": "sarah.wilson@seequent.com",
-                "description": "Initial mineral occurrences"
-            },
-            {
-                "version_id": "v2",
-                "created_date": "2024-02-05T15:30:00Z",
-                "created_by": "sarah.wilson@seequent.com",
-                "description": "Added tonnage estimates"
-            }
-        ],
-        "total_versions": 2,
-        "latest_version": "v2"
-    }
-]
-
-
-# Fake detailed object information database for get_objects_info
-FAKE_OBJECTS_DATABASE: Dict[str, Dict[str, Any]] = {
+# Shared identity fields for each fake object, merged into every record that describes it
+_HEADERS: Mapping[str, Mapping[str, str]] = {
     "thalanga_local_drillholes_dt": {
         "id": "obj_001",
         "name": "thalanga_local_drillholes_dt",
-        "object_type": "downhole-collection",
-        "description": "Downhole collection for Thalanga local drilling data",
-        "created_date": "2024-01-15T10:30:00Z",
-        "created_by": "john.smith@seequent.com",
-        "bounding_box": {
-            "min_x": 345000.0,
-            "max_x": 347500.0,
-            "min_y": 6785000.0,
-            "max_y": 6787500.0,
-            "min_z": -500.0,
-            "max_z": 50.0
-        },
-        "dimensions": {
-            "length": 2500.0,  # max_x - min_x
-            "width": 2500.0,   # max_y - min_y
-            "depth": 550.0     # max_z - min_z
-        },
-        "assays": [
-            {
-                "element": "gold",
-                "min_value": 0.001,
-                "max_value": 15.8,
-                "average_value": 2.3,
-                "unit": "g/t"
-            },
-            {
-                "element": "silver",
-                "min_value": 0.5,
-                "max_value": 145.2,
-                "average_value": 18.7,
-                "unit": "g/t"
-            },
-            {
-                "element": "copper",
-                "min_value": 0.01,
-                "max_value": 3.2,
-                "average_value": 0.8,
-                "unit": "%"
-            },
-            {
-                "element": "zinc",
-                "min_value": 0.05,
-                "max_value": 8.9,
-                "average_value": 2.1,
-                "unit": "%"
-            }
-        ],
-        "collections": {
-            "holes": 45,
-            "intervals": 1250,
-            "total_length": 12500.0
-        }
+        "object_type": "downhole-collection"
     },
     "thalanga_local_drillholes_e_sm": {
         "id": "obj_002",
         "name": "thalanga_local_drillholes_e_sm",
-        "object_type": "downhole-collection",
-        "description": "Enhanced downhole collection with detailed assays",
-        "created_date": "2024-01-20T14:45:00Z",
-        "created_by": "jane.doe@seequent.com",
-        "bounding_box": {
-            "min_x": 344500.0,
-            "max_x": 348000.0,
-            "min_y": 6784500.0,
-            "max_y": 6788000.0,
-            "min_z": -600.0,
-            "max_z": 75.0
-        },
-        "dimensions": {
-            "length": 3500.0,  # max_x - min_x
-            "width": 3500.0,   # max_y - min_y
-            "depth": 675.0     # max_z - min_z
-        },
-        "assays": [
-            {
-                "element": "gold",
-                "min_value": 0.005,
-                "max_value": 22.4,
-                "average_value": 3.1,
-                "unit": "g/t"
-            },
-            {
-                "element": "silver",
-                "min_value": 0.2,
-                "max_value": 189.6,
-                "average_value": 25.3,
-                "unit": "g/t"
-            },
-            {
-                "element": "copper",
-                "min_value": 0.008,
-                "max_value": 4.1,
-                "average_value": 1.2,
-                "unit": "%"
-            },
-            {
-                "element": "lead",
-                "min_value": 0.02,
-                "max_value": 6.7,
-                "average_value": 1.8,
-                "unit": "%"
-            },
-            {
-                "element": "zinc",
-                "min_value": 0.03,
-                "max_value": 12.3,
-                "average_value": 3.4,
-                "unit": "%"
-            },
-            {
-                "element": "iron",
-                "min_value": 2.1,
-                "max_value": 35.8,
-                "average_value": 18.2,
-                "unit": "%"
-            }
-        ],
-        "collections": {
-            "holes": 62,
-            "intervals": 1845,
-            "total_length": 18750.0
-        }
+        "object_type": "downhole-collection"
     },
     "surface_geology_pointset": {
         "id": "obj_003",
         "name": "surface_geology_pointset",
-        "object_type": "pointset",
-        "description": "Surface geology sampling points",
-        "created_date": "2024-01-25T09:15:00Z",
-        "created_by": "mike.johnson@seequent.com",
-        "bounding_box": {
-            "min_x": 344000.0,
-            "max_x": 349000.0,
-            "min_y": 6784000.0,
-            "max_y": 6789000.0,
-            "min_z": -50.0,
-            "max_z": 250.0
-        },
-        "dimensions": {
-            "length": 5000.0,  # max_x - min_x
-            "width": 5000.0,   # max_y - min_y
-            "depth": 300.0     # max_z - min_z
-        },
-        "attributes": [
-            {
-                "name": "formation",
-                "type": "categorical",
-                "values": ["Thalanga Formation", "Cambrian Volcanics", "Ordovician Sediments"],
-                "dominant_value": "Thalanga Formation"
-            },
-            {
-                "name": "rock_type",
-                "type": "categorical",
-                "values": ["Basalt", "Rhyolite", "Sedimentary", "Volcanic Breccia"],
-                "dominant_value": "Basalt"
-            },
-            {
-                "name": "alteration",
-                "type": "categorical",
-                "values": ["Fresh", "Weak", "Moderate", "Strong", "Intense"],
-                "dominant_value": "Moderate"
-            }
-        ],
-        "collections": {
-            "points": 134,
-            "area_coverage": 25.0  # km²
-        }
+        "object_type": "pointset"
     },
     "mineral_occurrences_pointset": {
         "id": "obj_004",
         "name": "mineral_occurrences_pointset",
-        "object_type": "pointset",
-        "description": "Mineral occurrence locations and characteristics",
-        "created_date": "2024-02-01T11:20:00Z",
-        "created_by": "sarah.wilson@seequent.com",
-        "bounding_box": {
-            "min_x": 340000.0,
-            "max_x": 355000.0,
-            "min_y": 6780000.0,
-            "max_y": 6795000.0,
-            "min_z": -100.0,
-            "max_z": 400.0
-        },
-        "dimensions": {
-            "length": 15000.0,  # max_x - min_x
-            "width": 15000.0,   # max_y - min_y
-            "depth": 500.0      # max_z - min_z
-        },
-        "attributes": [
-            {
-                "name": "mineral_type",
-                "type": "categorical",
-                "values": ["Pyrite", "Chalcopyrite", "Galena", "Sphalerite", "Magnetite"],
-                "dominant_value": "Pyrite"
-            },
-            {
-                "name": "grade",
-                "type": "numerical",
-                "min_value": 0.1,
-                "max_value": 25.6,
-                "average_value": 4.2,
-                "unit": "g/t Au equivalent"
-            },
-            {
-                "name": "tonnage",
-                "type": "numerical",
-                "min_value": 1000.0,
-                "max_value": 50000.0,
-                "average_value": 12500.0,
-                "unit": "tonnes"
-            }
-        ],
-        "collections": {
-            "points": 89,
-            "area_coverage": 225.0  # km²
-        }
+        "object_type": "pointset"
     },
     "exploration_drillholes_main": {
         "id": "obj_005",
         "name": "exploration_drillholes_main",
-        "object_type": "downhole-collection",
-        "description": "Main exploration drilling program results",
-        "created_date": "2024-02-10T16:00:00Z",
-        "created_by": "david.brown@seequent.com",
-        "bounding_box": {
-            "min_x": 342000.0,
-            "max_x": 350000.0,
-            "min_y": 6782000.0,
-            "max_y": 6790000.0,
-            "min_z": -800.0,
-            "max_z": 100.0
-        },
-        "dimensions": {
-            "length": 8000.0,  # max_x - min_x
-            "width": 8000.0,   # max_y - min_y
-            "depth": 900.0     # max_z - min_z
-        },
-        "assays": [
-            {
-                "element": "gold",
-                "min_value": 0.002,
-                "max_value": 35.7,
-                "average_value": 4.8,
-                "unit": "g/t"
-            },
-            {
-                "element": "silver",
-                "min_value": 0.1,
-                "max_value": 278.9,
-                "average_value": 32.1,
-                "unit": "g/t"
-            },
-            {
-                "element": "copper",
-                "min_value": 0.005,
-                "max_value": 5.6,
-                "average_value": 1.4,
-                "unit": "%"
-            },
-            {
-                "element": "molybdenum",
-                "min_value": 0.001,
-                "max_value": 0.15,
-                "average_value": 0.02,
-                "unit": "%"
-            },
-            {
-                "element": "uranium",
-                "min_value": 0.5,
-                "max_value": 125.0,
-                "average_value": 15.8,
-                "unit": "ppm"
-            }
-        ],
-        "collections": {
-            "holes": 78,
-            "intervals": 2340,
-            "total_length": 23400.0
-        }
+        "object_type": "downhole-collection"
     },
     "structural_measurements_pointset": {
         "id": "obj_006",
         "name": "structural_measurements_pointset",
-        "object_type": "pointset",
-        "description": "Structural geology measurements and orientations",
-        "created_date": "2024-02-15T13:30:00Z",
-        "created_by": "emma.taylor@seequent.com",
-        "bounding_box": {
-            "min_x": 343000.0,
-            "max_x": 348000.0,
-            "min_y": 6783000.0,
-            "max_y": 6788000.0,
-            "min_z": -200.0,
-            "max_z": 300.0
-        },
-        "dimensions": {
-            "length": 5000.0,  # max_x - min_x
-            "width": 5000.0,   # max_y - min_y
-            "depth": 500.0     # max_z - min_z
-        },
-        "attributes": [
-            {
-                "name": "dip",
-                "type": "numerical",
-                "min_value": 5.0,
-                "max_value": 90.0,
-                "average_value": 45.2,
-                "unit": "degrees"
-            },
-            {
-                "name": "strike",
-                "type": "numerical",
-                "min_value": 0.0,
-                "max_value": 360.0,
-                "average_value": 180.0,
-                "unit": "degrees"
-            },
-            {
-                "name": "structure_type",
-                "type": "categorical",
-                "values": ["Bedding", "Foliation", "Fracture", "Fault", "Vein"],
-                "dominant_value": "Bedding"
-            },
-            {
-                "name": "confidence",
-                "type": "categorical",
-                "values": ["Low", "Medium", "High"],
-                "dominant_value": "High"
-            }
-        ],
-        "collections": {
-            "points": 256,
-            "area_coverage": 25.0  # km²
-        }
+        "object_type": "pointset"
     }
 }
+_HEADERS = MappingProxyType({name: MappingProxyType(header) for name, header in _HEADERS.items()})
 
 
-# Fake detailed version information for get_object_versions_info
-FAKE_OBJECT_VERSIONS_INFO: Dict[str, Dict[str, Any]] = {
-    "thalanga_local_drillholes_dt": {
-        "id": "obj_001",
-        "name": "thalanga_local_drillholes_dt",
-        "object_type": "downhole-collection",
-        "total_versions": 2,
-        "versions": [
-            {
-                "version_id": "v1",
-                "created_date": "2024-01-10T08:00:00Z",
-                "created_by": "john.smith@seequent.com",
-                "description": "Initial version",
-                "file_size": 125456,
-                "file_size_unit": "bytes",
-                "changes": [
-                    "Initial upload of drilling data",
-                    "Basic assay results for gold and silver",
-                    "Collar and survey information"
-                ],
-                "validation_status": "passed",
-                "data_quality": {
-                    "completeness": 85.2,
-                    "accuracy": 92.1,
-                    "consistency": 89.5
-                }
-            },
-            {
-                "version_id": "v2",
-                "created_date": "2024-01-15T10:30:00Z",
-                "created_by": "john.smith@seequent.com",
-                "description": "Updated with additional assays",
-                "file_size": 156789,
-                "file_size_unit": "bytes",
-                "changes": [
-                    "Added copper and zinc assay results",
-                    "Updated quality control flags",
-                    "Enhanced metadata information"
-                ],
-                "validation_status": "passed",
-                "data_quality": {
-                    "completeness": 94.6,
-                    "accuracy": 94.8,
-                    "consistency": 92.3
-                }
-            }
-        ]
-    },
-    "thalanga_local_drillholes_e_sm": {
-        "id": "obj_002",
-        "name": "thalanga_local_drillholes_e_sm",
-        "object_type": "downhole-collection",
-        "total_versions": 3,
-        "versions": [
-            {
-                "version_id": "v1",
-                "created_date": "2024-01-18T12:00:00Z",
-                "created_by": "jane.doe@seequent.com",
-                "description": "Initial enhanced version",
-                "file_size": 198432,
-                "file_size_unit": "bytes",
-                "changes": [
-                    "Enhanced drilling data with detailed assays",
-                    "Multi-element analysis results",
-                    "Improved spatial accuracy"
-                ],
-                "validation_status": "passed",
-                "data_quality": {
-                    "completeness": 88.7,
-                    "accuracy": 91.2,
-                    "consistency": 87.9
-                }
-            },
-            {
-                "version_id": "v2",
-                "created_date": "2024-01-20T14:45:00Z",
-                "created_by": "jane.doe@seequent.com",
-                "description": "Added lead and iron assays",
-                "file_size": 234567,
-                "file_size_unit": "bytes",
-                "changes": [
-                    "Added lead and iron assay results",
-                    "Updated detection limits",
-                    "Enhanced QA/QC procedures"
-                ],
-                "validation_status": "passed",
-                "data_quality": {
-                    "completeness": 91.5,
-                    "accuracy": 93.7,
-                    "consistency": 90.8
-                }
-            },
-            {
-                "version_id": "v3",
-                "created_date": "2024-01-25T16:15:00Z",
-                "created_by": "jane.doe@seequent.com",
-                "description": "Quality control and validation updates",
-                "file_size": 245123,
-                "file_size_unit": "bytes",
-                "changes": [
-                    "Comprehensive quality control review",
-                    "Updated validation criteria",
-                    "Enhanced metadata standards"
-                ],
-                "validation_status": "passed",
-                "data_quality": {
-                    "completeness": 96.8,
-                    "accuracy": 96.3,
-                    "consistency": 94.7
-                }
-            }
-        ]
-    },
-    "surface_geology_pointset": {
-        "id": "obj_003",
-        "name": "surface_geology_pointset",
-        "object_type": "pointset",
-        "total_versions": 1,
-        "versions": [
-            {
-                "version_id": "v1",
-                "created_date": "2024-01-25T09:15:00Z",
-                "created_by": "mike.johnson@seequent.com",
-                "description": "Initial surface geology data",
-                "file_size": 67890,
-                "file_size_unit": "bytes",
-                "changes": [
-                    "Initial surface geology sampling points",
-                    "Rock type and formation classifications",
-                    "Alteration intensity mapping"
-                ],
-                "validation_status": "passed",
-                "data_quality": {
-                    "completeness": 89.3,
-                    "accuracy": 88.6,
-                    "consistency": 91.2
-                }
-            }
-        ]
-    },
-    "mineral_occurrences_pointset": {
-        "id": "obj_004",
-        "name": "mineral_occurrences_pointset",
-        "object_type": "pointset",
-        "total_versions": 2,
-        "versions": [
-            {
-                "version_id": "v1",
-                "created_date": "2024-02-01T11:20:00Z",
-                "created_by": "sarah.wilson@seequent.com",
-                "description": "Initial mineral occurrences",
-                "file_size": 45678,
-                "file_size_unit": "bytes",
-                "changes": [
-                    "Initial mineral occurrence locations",
-                    "Basic grade and mineral type information",
-                    "Preliminary resource estimates"
-                ],
-                "validation_status": "passed",
-                "data_quality": {
-                    "completeness": 83.4,
-                    "accuracy": 87.9,
-                    "consistency": 85.6
-                }
-            },
-            {
-                "version_id": "v2",
-                "created_date": "2024-02-05T15:30:00Z",
-                "created_by": "sarah.wilson@seequent.com",
-                "description": "Added tonnage estimates",
-                "file_size": 52341,
-                "file_size_unit": "bytes",
-                "changes": [
-                    "Added detailed tonnage estimates",
-                    "Enhanced resource calculations",
-                    "Improved confidence classifications"
-                ],
-                "validation_status": "passed",
-                "data_quality": {
-                    "completeness": 92.1,
-                    "accuracy": 91.8,
-                    "consistency": 89.4
-                }
-            }
-        ]
-    },
-    "exploration_drillholes_main": {
-        "id": "obj_005",
-        "name": "exploration_drillholes_main",
-        "object_type": "downhole-collection",
-        "total_versions": 1,
-        "versions": [
-            {
-                "version_id": "v1",
-                "created_date": "2024-02-10T16:00:00Z",
-                "created_by": "david.brown@seequent.com",
-                "description": "Main exploration drilling program results",
-                "file_size": 312456,
-                "file_size_unit": "bytes",
-                "changes": [
-                    "Comprehensive exploration drilling dataset",
-                    "Multi-element assay results",
-                    "Advanced geochemical analysis"
-                ],
-                "validation_status": "passed",
-                "data_quality": {
-                    "completeness": 97.2,
-                    "accuracy": 95.6,
-                    "consistency": 96.8
-                }
-            }
-        ]
-    },
-    "structural_measurements_pointset": {
-        "id": "obj_006",
-        "name": "structural_measurements_pointset",
-        "object_type": "pointset",
-        "total_versions": 1,
-        "versions": [
-            {
-                "version_id": "v1",
-                "created_date": "2024-02-15T13:30:00Z",
-                "created_by": "emma.taylor@seequent.com",
-                "description": "Structural geology measurements and orientations",
-                "file_size": 78234,
-                "file_size_unit": "bytes",
-                "changes": [
-                    "Structural geology measurements",
-                    "Dip and strike orientations",
-                    "Structural confidence ratings"
-                ],
-                "validation_status": "passed",
-                "data_quality": {
-                    "completeness": 93.7,
-                    "accuracy": 90.4,
-                    "consistency": 88.9
+def _intern_strings(obj: Any) -> None:
+    """
+    Intern every key and string value in a nested fixture structure in place, so object and
+    attribute names used as lookup keys hash once and compare by identity.
+    """
+    if isinstance(obj, dict):
+        items = list(obj.items())
+        obj.clear()
+        for key, value in items:
+            if isinstance(value, str):
+                value = sys.intern(value)
+            else:
+                _intern_strings(value)
+            obj[sys.intern(key)] = value
+    elif isinstance(obj, list):
+        for index, value in enumerate(obj):
+            if isinstance(value, str):
+                obj[index] = sys.intern(value)
+            else:
+                _intern_strings(value)
+
+
+# Compact rows for get_list_of_objects: (name, created_date, created_by, description,
+# field holding the object's data columns, column names)
+_RAW_OBJECTS: Tuple[Tuple[str, str, str, str, str, Tuple[str, ...]], ...] = (
+    ("thalanga_local_drillholes_dt", "2024-01-15T10:30:00Z", "john.smith@seequent.com",
+     "Downhole collection for Thalanga local drilling data",
+     "assays", ("gold", "silver", "copper", "zinc")),
+    ("thalanga_local_drillholes_e_sm", "2024-01-20T14:45:00Z", "jane.doe@seequent.com",
+     "Enhanced downhole collection with detailed assays",
+     "assays", ("gold", "silver", "copper", "lead", "zinc", "iron")),
+    ("surface_geology_pointset", "2024-01-25T09:15:00Z", "mike.johnson@seequent.com",
+     "Surface geology sampling points",
+     "attributes", ("formation", "rock_type", "alteration")),
+    ("mineral_occurrences_pointset", "2024-02-01T11:20:00Z", "sarah.wilson@seequent.com",
+     "Mineral occurrence locations and characteristics",
+     "attributes", ("mineral_type", "grade", "tonnage")),
+    ("exploration_drillholes_main", "2024-02-10T16:00:00Z", "david.brown@seequent.com",
+     "Main exploration drilling program results",
+     "assays", ("gold", "silver", "copper", "molybdenum", "uranium")),
+    ("structural_measurements_pointset", "2024-02-15T13:30:00Z", "emma.taylor@seequent.com",
+     "Structural geology measurements and orientations",
+     "attributes", ("dip", "strike", "structure_type", "confidence")),
+)
+
+
+# One shared tuple per distinct list of column names, see _canon()
+_CANON_COLUMN_LISTS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _canon(names: Iterable[str]) -> Tuple[str, ...]:
+    """Return the shared, interned tuple for a list of assay element or attribute names."""
+    key = tuple(sys.intern(name) for name in names)
+    return _CANON_COLUMN_LISTS.setdefault(key, key)
+
+
+def _expand(row: Tuple[str, str, str, str, str, Tuple[str, ...]]) -> Dict[str, Any]:
+    """Build a get_list_of_objects record from a compact _RAW_OBJECTS row."""
+    name, created_date, created_by, description, columns_field, columns = row
+    return {
+        **_HEADERS[name],
+        "created_date": created_date,
+        "created_by": created_by,
+        "description": description,
+        "version": "latest",
+        columns_field: _canon(columns),
+    }
+
+
+# Fake API response for get_list_of_objects (latest versions only)
+FAKE_OBJECTS_LIST: List[Dict[str, Any]] = [_expand(row) for row in _RAW_OBJECTS]
+
+# Repeated values (object types, authors, units, statuses) share one string object each
+_intern_strings(FAKE_OBJECTS_LIST)
+
+# Lookup indexes over FAKE_OBJECTS_LIST, built once at import
+_OBJECTS_BY_ID: Dict[str, Dict[str, Any]] = {obj["id"]: obj for obj in FAKE_OBJECTS_LIST}
+_OBJECTS_BY_NAME: Dict[str, Dict[str, Any]] = {obj["name"]: obj for obj in FAKE_OBJECTS_LIST}
+
+
+def get_object_by_id(object_id: str) -> Optional[Dict[str, Any]]:
+    """Return the latest-version object with the given id, or None if it does not exist."""
+    return _OBJECTS_BY_ID.get(object_id)
+
+
+def get_object_by_name(name: str) -> Optional[Dict[str, Any]]:
+    """Return the latest-version object with the given name, or None if it does not exist."""
+    return _OBJECTS_BY_NAME.get(name)
+
+
+@dataclass(frozen=True, slots=True)
+class AssayStat:
+    """Summary statistics for one assay element of a downhole collection."""
+    element: str
+    min_value: float
+    max_value: float
+    average_value: float
+    unit: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a plain dictionary."""
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class DataQuality:
+    """Data quality scores (percentages) of an object version."""
+    completeness: float
+    accuracy: float
+    consistency: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a plain dictionary."""
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class VersionSummary:
+    """One entry of an object's version history."""
+    version_id: str
+    created_date: str
+    created_by: str
+    description: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a plain dictionary."""
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class Version(VersionSummary):
+    """Detailed information about one object version."""
+    file_size: int
+    file_size_unit: str
+    changes: Tuple[str, ...]
+    validation_status: str
+    data_quality: DataQuality
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a plain dictionary."""
+        record = asdict(self)
+        record["changes"] = list(self.changes)
+        return record
+
+
+# The larger fixtures live in fake_data.json next to this module. They are loaded on first
+# use and cached, so importing this module only pays for FAKE_OBJECTS_LIST. Records in the
+# file omit the _HEADERS fields, which are merged back in when a fixture is built. The legacy
+# FAKE_* names resolve through __getattr__.
+_FIXTURES_PATH = Path(__file__).with_name("fake_data.json")
+
+
+@lru_cache(maxsize=1)
+def _load_fixtures() -> Dict[str, Any]:
+    """Read and parse fake_data.json once, interning its repeated string values."""
+    with _FIXTURES_PATH.open("rb") as f:
+        fixtures = json.load(f)
+    _intern_strings(fixtures)
+    return fixtures
+
+
+def _with_headers(records: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Merge the shared identity fields into each record, keyed by object name."""
+    return {name: {**_HEADERS[name], **record} for name, record in records.items()}
+
+
+def _by_created_date(version: Dict[str, Any]) -> str:
+    """Sort key for version records; ISO 8601 UTC timestamps sort chronologically as strings."""
+    return version["created_date"]
+
+
+@lru_cache(maxsize=1)
+def _version_summaries() -> Dict[str, Tuple[VersionSummary, ...]]:
+    """Version history records per object name, oldest first."""
+    return {
+        name: tuple(VersionSummary(**version) for version in sorted(record["versions"], key=_by_created_date))
+        for name, record in _load_fixtures()["objects_all_versions"].items()
+    }
+
+
+@lru_cache(maxsize=1)
+def _version_details() -> Dict[str, Tuple[Version, ...]]:
+    """Detailed version records per object name, oldest first."""
+    return {
+        name: tuple(
+            Version(
+                **{
+                    **version,
+                    "changes": tuple(version["changes"]),
+                    "data_quality": DataQuality(**version["data_quality"]),
                 }
-            }
-        ]
+            )
+            for version in sorted(record["versions"], key=_by_created_date)
+        )
+        for name, record in _load_fixtures()["object_versions_info"].items()
     }
-} 
 
-# Fake table data for collections attributes
-# Data is organized by object_name and collections_attribute
-FAKE_TABLE_DATA: Dict[str, Dict[str, List[float]]] = {
-    "thalanga_local_drillholes_dt": {
-        "gold": [
-            0.125, 0.087, 0.156, 0.092, 0.203, 0.078, 0.145, 0.112, 0.089, 0.167,
-            0.134, 0.098, 0.176, 0.143, 0.087, 0.198, 0.156, 0.089, 0.123, 0.178,
-            0.145, 0.092, 0.234, 0.156, 0.089, 0.167, 0.134, 0.098, 0.187, 0.123,
-            0.156, 0.089, 0.145, 0.198, 0.123, 0.087, 0.167, 0.134, 0.156, 0.089,
-            0.203, 0.145, 0.098, 0.187, 0.156, 0.123, 0.089, 0.167, 0.145, 0.134
-        ],
-        "silver": [
-            12.5, 8.7, 15.6, 9.2, 20.3, 7.8, 14.5, 11.2, 8.9, 16.7,
-            13.4, 9.8, 17.6, 14.3, 8.7, 19.8, 15.6, 8.9, 12.3, 17.8,
-            14.5, 9.2, 23.4, 15.6, 8.9, 16.7, 13.4, 9.8, 18.7, 12.3,
-            15.6, 8.9, 14.5, 19.8, 12.3, 8.7, 16.7, 13.4, 15.6, 8.9,
-            20.3, 14.5, 9.8, 18.7, 15.6, 12.3, 8.9, 16.7, 14.5, 13.4
-        ],
-        "copper": [
-            1.25, 0.87, 1.56, 0.92, 2.03, 0.78, 1.45, 1.12, 0.89, 1.67,
-            1.34, 0.98, 1.76, 1.43, 0.87, 1.98, 1.56, 0.89, 1.23, 1.78,
-            1.45, 0.92, 2.34, 1.56, 0.89, 1.67, 1.34, 0.98, 1.87, 1.23,
-            1.56, 0.89, 1.45, 1.98, 1.23, 0.87, 1.67, 1.34, 1.56, 0.89,
-            2.03, 1.45, 0.98, 1.87, 1.56, 1.23, 0.89, 1.67, 1.45, 1.34
-        ],
-        "zinc": [
-            5.25, 3.87, 6.56, 4.92, 7.03, 3.78, 5.45, 4.12, 3.89, 6.67,
-            5.34, 4.98, 6.76, 5.43, 3.87, 7.98, 5.56, 3.89, 4.23, 6.78,
-            5.45, 4.92, 8.34, 5.56, 3.89, 6.67, 5.34, 4.98, 7.87, 4.23,
-            5.56, 3.89, 5.45, 7.98, 4.23, 3.87, 6.67, 5.34, 5.56, 3.89,
-            7.03, 5.45, 4.98, 7.87, 5.56, 4.23, 3.89, 6.67, 5.45, 5.34
-        ]
-    },
-    "thalanga_local_drillholes_e_sm": {
-        "gold": [
-            0.342, 0.156, 0.287, 0.198, 0.423, 0.134, 0.276, 0.189, 0.156, 0.298,
-            0.234, 0.167, 0.312, 0.245, 0.156, 0.387, 0.276, 0.189, 0.223, 0.356,
-            0.267, 0.198, 0.434, 0.276, 0.189, 0.298, 0.234, 0.167, 0.367, 0.223,
-            0.276, 0.189, 0.267, 0.387, 0.223, 0.156, 0.298, 0.234, 0.276, 0.189,
-            0.423, 0.267, 0.167, 0.367, 0.276, 0.223, 0.189, 0.298, 0.267, 0.234
-        ],
-        "silver": [
-            24.2, 15.6, 28.7, 19.8, 42.3, 13.4, 27.6, 18.9, 15.6, 29.8,
-            23.4, 16.7, 31.2, 24.5, 15.6, 38.7, 27.6, 18.9, 22.3, 35.6,
-            26.7, 19.8, 43.4, 27.6, 18.9, 29.8, 23.4, 16.7, 36.7, 22.3,
-            27.6, 18.9, 26.7, 38.7, 22.3, 15.6, 29.8, 23.4, 27.6, 18.9,
-            42.3, 26.7, 16.7, 36.7, 27.6, 22.3, 18.9, 29.8, 26.7, 23.4
-        ],
-        "copper": [
-            2.42, 1.56, 2.87, 1.98, 4.23, 1.34, 2.76, 1.89, 1.56, 2.98,
-            2.34, 1.67, 3.12, 2.45, 1.56, 3.87, 2.76, 1.89, 2.23, 3.56,
-            2.67, 1.98, 4.34, 2.76, 1.89, 2.98, 2.34, 1.67, 3.67, 2.23,
-            2.76, 1.89, 2.67, 3.87, 2.23, 1.56, 2.98, 2.34, 2.76, 1.89,
-            4.23, 2.67, 1.67, 3.67, 2.76, 2.23, 1.89, 2.98, 2.67, 2.34
-        ],
-        "lead": [
-            8.42, 5.56, 8.87, 6.98, 12.23, 4.34, 8.76, 6.89, 5.56, 9.98,
-            8.34, 6.67, 10.12, 8.45, 5.56, 11.87, 8.76, 6.89, 7.23, 10.56,
-            8.67, 6.98, 13.34, 8.76, 6.89, 9.98, 8.34, 6.67, 11.67, 7.23,
-            8.76, 6.89, 8.67, 11.87, 7.23, 5.56, 9.98, 8.34, 8.76, 6.89,
-            12.23, 8.67, 6.67, 11.67, 8.76, 7.23, 6.89, 9.98, 8.67, 8.34
-        ],
-        "zinc": [
-            12.42, 8.56, 12.87, 9.98, 16.23, 7.34, 12.76, 9.89, 8.56, 13.98,
-            12.34, 9.67, 14.12, 12.45, 8.56, 15.87, 12.76, 9.89, 11.23, 14.56,
-            12.67, 9.98, 17.34, 12.76, 9.89, 13.98, 12.34, 9.67, 15.67, 11.23,
-            12.76, 9.89, 12.67, 15.87, 11.23, 8.56, 13.98, 12.34, 12.76, 9.89,
-            16.23, 12.67, 9.67, 15.67, 12.76, 11.23, 9.89, 13.98, 12.67, 12.34
-        ],
-        "iron": [
-            45.2, 38.6, 47.8, 41.2, 52.3, 35.4, 46.7, 39.8, 38.6, 48.9,
-            45.3, 40.7, 49.1, 45.8, 38.6, 51.2, 46.7, 39.8, 43.2, 49.6,
-            46.2, 41.2, 54.3, 46.7, 39.8, 48.9, 45.3, 40.7, 50.7, 43.2,
-            46.7, 39.8, 46.2, 51.2, 43.2, 38.6, 48.9, 45.3, 46.7, 39.8,
-            52.3, 46.2, 40.7, 50.7, 46.7, 43.2, 39.8, 48.9, 46.2, 45.3
-        ]
-    },
-    "exploration_drillholes_main": {
-        "gold": [
-            0.567, 0.234, 0.498, 0.312, 0.678, 0.189, 0.445, 0.298, 0.234, 0.512,
-            0.389, 0.278, 0.534, 0.423, 0.234, 0.598, 0.445, 0.298, 0.367, 0.556,
-            0.434, 0.312, 0.687, 0.445, 0.298, 0.512, 0.389, 0.278, 0.587, 0.367,
-            0.445, 0.298, 0.434, 0.598, 0.367, 0.234, 0.512, 0.389, 0.445, 0.298,
-            0.678, 0.434, 0.278, 0.587, 0.445, 0.367, 0.298, 0.512, 0.434, 0.389
-        ],
-        "silver": [
-            34.7, 23.4, 49.8, 31.2, 67.8, 18.9, 44.5, 29.8, 23.4, 51.2,
-            38.9, 27.8, 53.4, 42.3, 23.4, 59.8, 44.5, 29.8, 36.7, 55.6,
-            43.4, 31.2, 68.7, 44.5, 29.8, 51.2, 38.9, 27.8, 58.7, 36.7,
-            44.5, 29.8, 43.4, 59.8, 36.7, 23.4, 51.2, 38.9, 44.5, 29.8,
-            67.8, 43.4, 27.8, 58.7, 44.5, 36.7, 29.8, 51.2, 43.4, 38.9
-        ],
-        "copper": [
-            3.67, 2.34, 4.98, 3.12, 6.78, 1.89, 4.45, 2.98, 2.34, 5.12,
-            3.89, 2.78, 5.34, 4.23, 2.34, 5.98, 4.45, 2.98, 3.67, 5.56,
-            4.34, 3.12, 6.87, 4.45, 2.98, 5.12, 3.89, 2.78, 5.87, 3.67,
-            4.45, 2.98, 4.34, 5.98, 3.67, 2.34, 5.12, 3.89, 4.45, 2.98,
-            6.78, 4.34, 2.78, 5.87, 4.45, 3.67, 2.98, 5.12, 4.34, 3.89
-        ],
-        "molybdenum": [
-            0.123, 0.089, 0.156, 0.098, 0.187, 0.067, 0.134, 0.112, 0.089, 0.145,
-            0.121, 0.095, 0.167, 0.134, 0.089, 0.178, 0.134, 0.112, 0.123, 0.156,
-            0.145, 0.098, 0.198, 0.134, 0.112, 0.145, 0.121, 0.095, 0.167, 0.123,
-            0.134, 0.112, 0.145, 0.178, 0.123, 0.089, 0.145, 0.121, 0.134, 0.112,
-            0.187, 0.145, 0.095, 0.167, 0.134, 0.123, 0.112, 0.145, 0.145, 0.121
-        ],
-        "uranium": [
-            0.0045, 0.0023, 0.0067, 0.0034, 0.0089, 0.0019, 0.0056, 0.0041, 0.0023, 0.0072,
-            0.0051, 0.0038, 0.0078, 0.0063, 0.0023, 0.0084, 0.0056, 0.0041, 0.0049, 0.0076,
-            0.0058, 0.0034, 0.0095, 0.0056, 0.0041, 0.0072, 0.0051, 0.0038, 0.0081, 0.0049,
-            0.0056, 0.0041, 0.0058, 0.0084, 0.0049, 0.0023, 0.0072, 0.0051, 0.0056, 0.0041,
-            0.0089, 0.0058, 0.0038, 0.0081, 0.0056, 0.0049, 0.0041, 0.0072, 0.0058, 0.0051
-        ]
-    },
-    "surface_geology_pointset": {
-        "formation": [
-            1.0, 2.0, 1.0, 3.0, 2.0, 1.0, 3.0, 2.0, 1.0, 2.0,
-            3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 1.0,
-            3.0, 2.0, 1.0, 3.0, 2.0, 1.0, 3.0, 2.0, 1.0, 2.0,
-            1.0, 3.0, 2.0, 1.0, 3.0, 2.0, 1.0, 3.0, 2.0, 1.0,
-            2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0
-        ],
-        "rock_type": [
-            1.0, 2.0, 3.0, 4.0, 1.0, 2.0, 3.0, 4.0, 1.0, 2.0,
-            3.0, 4.0, 1.0, 2.0, 3.0, 4.0, 1.0, 2.0, 3.0, 4.0,
-            1.0, 2.0, 3.0, 4.0, 1.0, 2.0, 3.0, 4.0, 1.0, 2.0,
-            3.0, 4.0, 1.0, 2.0, 3.0, 4.0, 1.0, 2.0, 3.0, 4.0,
-            1.0, 2.0, 3.0, 4.0, 1.0, 2.0, 3.0, 4.0, 1.0, 2.0
-        ],
-        "alteration": [
-            0.15, 0.23, 0.08, 0.45, 0.32, 0.17, 0.29, 0.12, 0.38, 0.26,
-            0.19, 0.41, 0.07, 0.34, 0.28, 0.13, 0.47, 0.21, 0.35, 0.09,
-            0.42, 0.18, 0.31, 0.25, 0.06, 0.39, 0.16, 0.44, 0.22, 0.33,
-            0.11, 0.48, 0.24, 0.37, 0.14, 0.30, 0.05, 0.43, 0.20, 0.36,
-            0.27, 0.10, 0.46, 0.19, 0.40, 0.15, 0.32, 0.08, 0.41, 0.23
-        ]
-    },
-    "mineral_occurrences_pointset": {
-        "mineral_type": [
-            1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0,
-            2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0,
-            3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 3.0,
-            1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0,
-            2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0
-        ],
-        "grade": [
-            2.45, 1.67, 3.89, 2.12, 4.23, 1.34, 2.78, 1.89, 3.45, 2.67,
-            1.98, 4.12, 1.56, 3.34, 2.89, 1.78, 4.45, 2.23, 3.67, 1.45,
-            4.78, 2.01, 3.12, 2.56, 1.89, 4.34, 1.67, 3.78, 2.34, 3.89,
-            1.23, 4.56, 2.78, 3.45, 1.90, 2.67, 1.12, 4.23, 2.45, 3.56,
-            2.89, 1.34, 4.67, 2.12, 3.78, 1.56, 2.98, 1.78, 4.12, 2.34
-        ],
-        "tonnage": [
-            125.4, 87.6, 189.3, 112.8, 203.5, 76.2, 145.7, 98.4, 167.9, 134.2,
-            156.8, 201.3, 89.7, 178.5, 145.2, 92.1, 234.6, 123.8, 189.4, 87.3,
-            212.7, 98.5, 167.2, 134.9, 78.6, 198.3, 112.4, 203.8, 145.7, 189.2,
-            93.5, 234.1, 156.8, 178.3, 101.2, 167.9, 76.8, 201.5, 134.6, 189.7,
-            145.3, 89.4, 223.8, 112.7, 198.5, 87.9, 167.4, 98.2, 201.3, 134.8
-        ]
-    },
-    "structural_measurements_pointset": {
-        "dip": [
-            35.2, 42.8, 28.7, 51.3, 39.6, 33.9, 47.2, 31.5, 44.8, 38.1,
-            29.6, 48.7, 35.4, 41.2, 33.8, 46.9, 30.7, 43.5, 37.2, 32.1,
-            49.8, 36.3, 40.7, 34.5, 45.1, 31.9, 42.6, 38.8, 33.4, 47.3,
-            35.7, 41.9, 29.2, 44.6, 37.5, 32.8, 48.1, 34.2, 43.7, 39.4,
-            31.6, 46.8, 35.9, 40.3, 33.7, 45.5, 30.1, 42.9, 38.6, 34.8
-        ],
-        "strike": [
-            125.4, 087.6, 189.3, 112.8, 203.5, 076.2, 145.7, 098.4, 167.9, 134.2,
-            156.8, 201.3, 089.7, 178.5, 145.2, 092.1, 234.6, 123.8, 189.4, 087.3,
-            212.7, 098.5, 167.2, 134.9, 078.6, 198.3, 112.4, 203.8, 145.7, 189.2,
-            093.5, 234.1, 156.8, 178.3, 101.2, 167.9, 076.8, 201.5, 134.6, 189.7,
-            145.3, 089.4, 223.8, 112.7, 198.5, 087.9, 167.4, 098.2, 201.3, 134.8
-        ],
-        "structure_type": [
-            1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0,
-            2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0,
-            3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 3.0,
-            1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0,
-            2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0
-        ],
-        "confidence": [
-            0.85, 0.92, 0.78, 0.89, 0.93, 0.81, 0.88, 0.76, 0.91, 0.87,
-            0.82, 0.94, 0.79, 0.86, 0.90, 0.83, 0.95, 0.77, 0.89, 0.84,
-            0.96, 0.80, 0.87, 0.91, 0.75, 0.93, 0.85, 0.88, 0.82, 0.90,
-            0.78, 0.94, 0.86, 0.89, 0.81, 0.92, 0.76, 0.95, 0.87, 0.83,
-            0.89, 0.79, 0.93, 0.85, 0.88, 0.82, 0.91, 0.77, 0.94, 0.86
-        ]
+
+@lru_cache(maxsize=1)
+def _versions_by_id() -> Dict[str, Dict[str, Version]]:
+    """Detailed version records per object name, keyed by version id."""
+    return {
+        name: {version.version_id: version for version in versions}
+        for name, versions in _version_details().items()
+    }
+
+
+@lru_cache(maxsize=1)
+def _assay_stats() -> Dict[str, Tuple[AssayStat, ...]]:
+    """Assay statistics records per object name."""
+    return {
+        name: tuple(AssayStat(**assay) for assay in record.get("assays", ()))
+        for name, record in _load_fixtures()["objects_database"].items()
+    }
+
+
+def get_version_history(name: str) -> Tuple[VersionSummary, ...]:
+    """Return the version history records of the named object, oldest first, or an empty tuple."""
+    return _version_summaries().get(name, ())
+
+
+def get_versions(name: str) -> Tuple[Version, ...]:
+    """Return the detailed version records of the named object, oldest first, or an empty tuple."""
+    return _version_details().get(name, ())
+
+
+@lru_cache(maxsize=1)
+def _version_dates() -> Dict[str, List[str]]:
+    """Creation dates parallel to the sorted detailed version records, for binary search."""
+    return {
+        name: [version.created_date for version in versions]
+        for name, versions in _version_details().items()
     }
-} 
\ No newline at end of file
+
+
+def versions_before(name: str, iso_date: str) -> Tuple[Version, ...]:
+    """
+    Return the detailed version records of the named object created up to iso_date.
+    
+    Args:
+        name: Object name
+        iso_date: ISO 8601 date or timestamp, e.g. "2024-02-01" or "2024-01-15T10:30:00Z".
+            A plain date excludes versions created on that day.
+        
+    Returns:
+        Matching version records, oldest first
+    """
+    index = bisect_right(_version_dates().get(name, ()), iso_date)
+    return get_versions(name)[:index]
+
+
+def get_assay_elements(name: str) -> Tuple[str, ...]:
+    """Return the assay element names of the named object, sharing the tuple used in FAKE_OBJECTS_LIST."""
+    return _canon(assay.element for assay in get_assay_stats(name))
+
+
+def get_latest_version(name: str) -> Optional[Version]:
+    """Return the most recent detailed version record of the named object, or None."""
+    versions = get_versions(name)
+    return versions[-1] if versions else None
+
+
+def get_version(name: str, version_id: str) -> Optional[Version]:
+    """Return the detailed record of one version of the named object, or None."""
+    return _versions_by_id().get(name, {}).get(version_id)
+
+
+def get_assay_stats(name: str) -> Tuple[AssayStat, ...]:
+    """Return the assay statistics records of the named object, or an empty tuple."""
+    return _assay_stats().get(name, ())
+
+
+@lru_cache(maxsize=1)
+def get_objects_all_versions() -> Tuple[Dict[str, Any], ...]:
+    """
+    Return the fake get_list_of_objects_all_versions response (includes version history).
+    
+    The tuple is shared between calls; its records must not be modified.
+    """
+    objects = _with_headers(_load_fixtures()["objects_all_versions"])
+    for name, record in objects.items():
+        record["versions"] = [version.to_dict() for version in get_version_history(name)]
+    return tuple(objects.values())
+
+
+@lru_cache(maxsize=1)
+def _versions_by_name() -> Dict[str, Dict[str, Any]]:
+    """Lookup index over get_objects_all_versions() by object name."""
+    return {obj["name"]: obj for obj in get_objects_all_versions()}
+
+
+def get_object_versions_by_name(name: str) -> Optional[Dict[str, Any]]:
+    """Return the version history entry for the named object, or None if it does not exist."""
+    return _versions_by_name().get(name)
+
+
+# Bounding boxes are stored as flat float64 arrays in this order; dimensions are derived from them
+_BOUNDING_BOX_KEYS = ("min_x", "max_x", "min_y", "max_y", "min_z", "max_z")
+_DIMENSION_KEYS = ("length", "width", "depth")
+
+
+def dims(bbox: np.ndarray) -> np.ndarray:
+    """Return the (length, width, depth) extents of a (min_x, max_x, min_y, max_y, min_z, max_z) box."""
+    return bbox[1::2] - bbox[0::2]
+
+
+@lru_cache(maxsize=1)
+def get_bounding_boxes() -> Mapping[str, np.ndarray]:
+    """Return each object's bounding box as a float64 array, keyed by object name. The mapping and arrays are read-only."""
+    boxes = {}
+    for name, record in _load_fixtures()["objects_database"].items():
+        bbox = np.asarray(record["bounding_box"], dtype=np.float64)
+        bbox.flags.writeable = False
+        boxes[name] = bbox
+    return MappingProxyType(boxes)
+
+
+@lru_cache(maxsize=None)
+def get_dimensions(name: str) -> Optional[Mapping[str, float]]:
+    """
+    Return the length, width and depth of the named object's bounding box, computed on first
+    access and cached, or None if the object does not exist. The mapping is read-only.
+    """
+    bbox = get_bounding_boxes().get(name)
+    if bbox is None:
+        return None
+    return MappingProxyType(dict(zip(_DIMENSION_KEYS, dims(bbox).tolist())))
+
+
+@lru_cache(maxsize=1)
+def get_objects_database() -> Mapping[str, Dict[str, Any]]:
+    """
+    Return the fake detailed object information database for get_objects_info.
+    
+    The bounding_box and dimensions entries are expanded from the bounding box arrays, so the
+    records stay plain JSON-serializable dicts. The returned mapping is read-only.
+    """
+    objects = _with_headers(_load_fixtures()["objects_database"])
+    for name, bbox in get_bounding_boxes().items():
+        record = objects[name]
+        expanded = {}
+        for key, value in record.items():
+            if key == "bounding_box":
+                expanded[key] = dict(zip(_BOUNDING_BOX_KEYS, bbox.tolist()))
+                expanded["dimensions"] = dict(get_dimensions(name))
+            elif key == "assays":
+                expanded[key] = [assay.to_dict() for assay in get_assay_stats(name)]
+            else:
+                expanded[key] = value
+        objects[name] = expanded
+    return MappingProxyType(objects)
+
+
+@lru_cache(maxsize=1)
+def get_object_versions_info() -> Mapping[str, Dict[str, Any]]:
+    """Return the fake detailed version information for get_object_versions_info, read-only."""
+    versions_info = _with_headers(_load_fixtures()["object_versions_info"])
+    for name, record in versions_info.items():
+        record["versions"] = [version.to_dict() for version in get_versions(name)]
+    return MappingProxyType(versions_info)
+
+
+@lru_cache(maxsize=1)
+def _inverted_indexes() -> Dict[str, Dict[str, Tuple[str, ...]]]:
+    """Map assay elements, attribute names and object types to the ids of the objects that have them."""
+    by_element: Dict[str, List[str]] = defaultdict(list)
+    by_attribute: Dict[str, List[str]] = defaultdict(list)
+    by_object_type: Dict[str, List[str]] = defaultdict(list)
+    for obj in get_objects_database().values():
+        object_id = obj["id"]
+        by_object_type[obj["object_type"]].append(object_id)
+        for assay in obj.get("assays", ()):
+            by_element[assay["element"]].append(object_id)
+        for attribute in obj.get("attributes", ()):
+            by_attribute[attribute["name"]].append(object_id)
+    # Stored as tuples so the shared id lists cannot be modified by a caller
+    return {
+        "element": {element: tuple(ids) for element, ids in by_element.items()},
+        "attribute": {attribute: tuple(ids) for attribute, ids in by_attribute.items()},
+        "object_type": {object_type: tuple(ids) for object_type, ids in by_object_type.items()},
+    }
+
+
+def find_objects_with_element(element: str) -> Tuple[str, ...]:
+    """Return the ids of the objects with assays for the given element."""
+    return _inverted_indexes()["element"].get(element, ())
+
+
+def find_objects_with_attribute(attribute: str) -> Tuple[str, ...]:
+    """Return the ids of the objects with the given point attribute."""
+    return _inverted_indexes()["attribute"].get(attribute, ())
+
+
+def find_objects_by_type(object_type: str) -> Tuple[str, ...]:
+    """Return the ids of the objects of the given object type."""
+    return _inverted_indexes()["object_type"].get(object_type, ())
+
+
+@lru_cache(maxsize=1)
+def _element_averages() -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """Per assay element, object ids aligned with their average values as columnar arrays."""
+    ids: Dict[str, List[str]] = defaultdict(list)
+    averages: Dict[str, List[float]] = defaultdict(list)
+    for name, header in _HEADERS.items():
+        for assay in get_assay_stats(name):
+            ids[assay.element].append(header["id"])
+            averages[assay.element].append(assay.average_value)
+    return {
+        element: (np.array(ids[element], dtype=object), np.array(averages[element], dtype=np.float64))
+        for element in ids
+    }
+
+
+def filter_by_average(element: str, threshold: float) -> List[str]:
+    """
+    Return the ids of the objects whose average assay value for element exceeds threshold.
+    
+    Args:
+        element: Assay element, e.g. "gold"
+        threshold: Exclusive lower bound, in the element's unit
+        
+    Returns:
+        Matching object ids, or an empty list if no object has assays for element
+    """
+    columns = _element_averages().get(element)
+    if columns is None:
+        return []
+    ids, averages = columns
+    return ids[averages > threshold].tolist()
+
+
+@lru_cache(maxsize=1)
+def get_table_data() -> Mapping[str, Mapping[str, np.ndarray]]:
+    """
+    Return the fake table data for collections attributes, organized by object_name and
+    collections_attribute, as contiguous float64 arrays so statistics run as vectorized
+    NumPy reductions.
+    
+    The mappings and arrays are read-only.
+    """
+    return MappingProxyType({
+        object_name: MappingProxyType({
+            attribute: _read_only_column(values)
+            for attribute, values in attributes.items()
+        })
+        for object_name, attributes in _load_fixtures()["table_data"].items()
+    })
+
+
+def _read_only_column(values: Any) -> np.ndarray:
+    """
+    Build a non-writeable float64 column from a literal list, or from a
+    {"cycle": [...], "length": n} spec for columns that repeat a short pattern.
+    """
+    if isinstance(values, dict):
+        column = np.resize(np.asarray(values["cycle"], dtype=np.float64), values["length"])
+    else:
+        column = np.asarray(values, dtype=np.float64)
+    column.flags.writeable = False
+    return column
+
+
+def _summarize(column: np.ndarray) -> Mapping[str, Union[float, int]]:
+    """Min/max/mean/n of a table column, as a read-only mapping."""
+    return MappingProxyType({
+        "min": float(column.min()),
+        "max": float(column.max()),
+        "mean": float(column.mean()),
+        "n": int(column.size),
+    })
+
+
+@lru_cache(maxsize=1)
+def get_table_statistics() -> Mapping[str, Mapping[str, Mapping[str, Union[float, int]]]]:
+    """Return min/max/mean/n per table attribute, computed once since the fixtures never change."""
+    return MappingProxyType({
+        object_name: MappingProxyType({
+            attribute: _summarize(column) for attribute, column in attributes.items()
+        })
+        for object_name, attributes in get_table_data().items()
+    })
+
+
+def get_table_stats(object_name: str, attribute: str) -> Optional[Mapping[str, Union[float, int]]]:
+    """Return the precomputed min/max/mean/n for an object attribute, or None if it does not exist."""
+    return get_table_statistics().get(object_name, {}).get(attribute)
+
+
+_LAZY_FIXTURES = {
+    "FAKE_OBJECTS_ALL_VERSIONS": get_objects_all_versions,
+    "FAKE_OBJECTS_DATABASE": get_objects_database,
+    "FAKE_OBJECT_VERSIONS_INFO": get_object_versions_info,
+    "FAKE_TABLE_DATA": get_table_data,
+    "FAKE_TABLE_STATS": get_table_statistics,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy FAKE_* fixture names to their cached builders."""
+    builder = _LAZY_FIXTURES.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return builder()
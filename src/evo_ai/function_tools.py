@@ -2,14 +2,33 @@
 Function tools for the Evo AI Agent following Google ADK specification.
 """
 
+import asyncio
+import functools
+import hashlib
+import inspect
 import json
 import logging
+import logging.handlers
 import re
 import os
-from typing import Any, Dict, List, Optional, Tuple
+import random
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
 
 
 from .llm_utils import (
@@ -21,23 +40,40 @@ from .llm_utils import (
     download_table_data_from_api,
     extract_object_and_attribute,
     create_dataframe_from_fake_data,
+    generate_fast_chart,
     generate_simple_chart,
     create_error_figure,
     save_chart_file
 )
 from .rag_utils import init_workspace_rag_engine
+from .utils import LRUCache
 
 # Configure logging to both console and file
 logger = logging.getLogger(__name__)
 
-# Create logs directory if it doesn't exist
+# The logs directory is created when something is first written to it, not at import
 logs_dir = Path("logs")
-logs_dir.mkdir(exist_ok=True)
 
-# Configure file handler
-file_handler = logging.FileHandler(logs_dir / "evo_ai.log")
+
+class _LogFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that creates its directory when the file is first opened."""
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
+# Configure file handler: the log file is opened on the first record and rotated at 10 MB
+file_handler = _LogFileHandler(
+    logs_dir / "evo_ai.log", maxBytes=10_000_000, backupCount=3, delay=True
+)
 file_handler.setLevel(logging.INFO)
 
+# Buffer file records and write them in batches; errors flush the buffer immediately
+buffered_file_handler = logging.handlers.MemoryHandler(
+    capacity=256, flushLevel=logging.ERROR, target=file_handler
+)
+
 # Configure console handler
 console_handler = logging.StreamHandler()
 console_handler.setLevel(logging.INFO)
@@ -47,14 +83,276 @@ formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(messag
 file_handler.setFormatter(formatter)
 console_handler.setFormatter(formatter)
 
-# Add handlers to logger
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+# Add handlers to logger, once: a reimport of this module must not duplicate every record
+if not any(isinstance(h, logging.handlers.MemoryHandler) for h in logger.handlers):
+    logger.addHandler(buffered_file_handler)
+    logger.addHandler(console_handler)
 logger.setLevel(logging.INFO)
+# The console handler already covers the root logger's job
+logger.propagate = False
 
-# Initialize the RAG engine
+# The RAG engine is initialized on the first get_rag_info call rather than at import
 gcp_resource_id = "workspace_Thalanga demo complete_f4cfac01-21ef-4f3b-8c0c-26b97fa7303e"
-rag_engine = init_workspace_rag_engine(gcp_resource_id)
+
+
+_rag_engine = None
+_rag_engine_lock = threading.Lock()
+
+
+def _get_rag_engine():
+    """
+    Initialize the workspace RAG engine on first use and share it.
+    
+    Only an engine with a corpus is kept, so a failed initialization (e.g. missing
+    credentials or an unreachable corpus) is retried on the next call. The lock keeps
+    concurrent first calls, which run in worker threads, from initializing it twice.
+    """
+    global _rag_engine
+    if _rag_engine is None:
+        with _rag_engine_lock:
+            if _rag_engine is None:
+                rag_engine = init_workspace_rag_engine(gcp_resource_id)
+                if rag_engine is not None and rag_engine.has_corpus():
+                    _rag_engine = rag_engine
+                return rag_engine
+    return _rag_engine
+
+
+# Memoized tool results. The workspace data behind the tools is immutable, so repeat
+# questions are answered from this LRU cache instead of awaiting the API layer again.
+TOOL_CACHE_MAXSIZE = 256
+_tool_cache: "LRUCache[Tuple[Hashable, ...], Any]" = LRUCache(TOOL_CACHE_MAXSIZE)
+
+
+def _get_cached_tool_result(key: Tuple[Hashable, ...]) -> Optional[Any]:
+    """Return the cached result for key, or None on a miss."""
+    return _tool_cache.get(key)
+
+
+def _store_tool_result(key: Tuple[Hashable, ...], result: Any) -> None:
+    """Store result under key, evicting the least recently used entry."""
+    _tool_cache.set(key, result)
+
+
+def invalidate_objects_cache() -> None:
+    """Drop the cached object lists so the next list tool call fetches them again."""
+    _tool_cache.pop(("get_list_of_objects",), None)
+    _tool_cache.pop(("get_list_of_objects_all_versions",), None)
+
+
+# The extraction only depends on the prompt and the immutable fake data, so repeat prompts
+# are answered from this cache
+_extract_object_and_attribute = functools.lru_cache(maxsize=1024)(extract_object_and_attribute)
+
+
+def _dump(obj: Any) -> bytes:
+    """Serialize tool metadata to JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode()
+
+
+def _load(data: bytes) -> Any:
+    """Parse JSON written by _dump."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Rendered charts are content-addressed by object, attribute and normalized prompt, so a
+# repeated request reuses the PNG instead of generating and rendering the chart again
+CHART_CACHE_DIR = Path("generated_charts") / "cache"
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _chart_cache_path(object_name: str, attribute_name: str, user_prompt: str) -> Path:
+    """Return the cached PNG path for a chart request."""
+    normalized_prompt = _WHITESPACE_RE.sub(" ", user_prompt.lower()).strip()
+    key = hashlib.blake2b(
+        f"{object_name}|{attribute_name}|{normalized_prompt}".encode(), digest_size=8
+    ).hexdigest()
+    return CHART_CACHE_DIR / f"chart_{key}.png"
+
+
+# Transient API failures are retried with exponential backoff and full jitter, so concurrent
+# callers that failed together do not retry in lockstep
+API_RETRY_ATTEMPTS = 3
+API_RETRY_INITIAL_DELAY = 0.1
+API_RETRY_MAX_DELAY = 2.0
+# Errors worth retrying: connection failures and timeouts, including httpx's own transport
+# errors, which do not derive from the builtin ones. Anything else (bad arguments, missing
+# objects, bugs, other OS errors such as a missing file) is raised on the first attempt.
+API_RETRY_EXCEPTIONS: Tuple[Type[BaseException], ...] = (ConnectionError, TimeoutError)
+if httpx is not None:
+    API_RETRY_EXCEPTIONS += (httpx.TimeoutException, httpx.NetworkError)
+# Separate generator, so code seeding the global random module can't make retry delays predictable
+_retry_random = random.Random()
+
+
+async def _call_api(fetch: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Call an API function, retrying transient failures (API_RETRY_EXCEPTIONS) up to
+    API_RETRY_ATTEMPTS times in total.
+    
+    Args:
+        fetch: API function to call; its result is awaited if it returns an awaitable
+        *args: Positional arguments for fetch
+        **kwargs: Keyword arguments for fetch
+        
+    Returns:
+        The API response
+        
+    Raises:
+        Exception: A non-transient error immediately, or the last transient error once every
+            attempt has failed
+    """
+    for attempt in range(API_RETRY_ATTEMPTS):
+        try:
+            result = fetch(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        except API_RETRY_EXCEPTIONS as e:
+            if attempt == API_RETRY_ATTEMPTS - 1:
+                raise
+            delay = min(API_RETRY_MAX_DELAY, API_RETRY_INITIAL_DELAY * 2 ** attempt)
+            delay = _retry_random.uniform(0, delay)
+            logger.warning(
+                "API call %s failed (attempt %s of %s), retrying in %.2fs: %s",
+                getattr(fetch, "__name__", fetch), attempt + 1, API_RETRY_ATTEMPTS, delay, e,
+            )
+            await asyncio.sleep(delay)
+
+
+# Maximum number of per-object API requests in flight for one tool call
+OBJECT_FETCH_CONCURRENCY = 10
+
+
+async def _gather_per_object(
+    tool_name: str,
+    fetch: Callable[[List[str]], Any],
+    object_names: List[str],
+) -> List[Dict[str, Any]]:
+    """
+    Fetch information for each object concurrently, one API request per object name.
+    
+    Args:
+        tool_name: Name of the calling tool, used in the cache key
+        fetch: API function taking a list of object names
+        object_names: Object names to fetch, in response order
+        
+    Returns:
+        The flattened per-object responses, in the order of object_names
+    """
+    semaphore = asyncio.Semaphore(OBJECT_FETCH_CONCURRENCY)
+    
+    async def fetch_one(object_name: str) -> List[Dict[str, Any]]:
+        # Each object is cached on its own so it hits the API once per session
+        cache_key = (tool_name, sys.intern(object_name))
+        result = _get_cached_tool_result(cache_key)
+        if result is None:
+            async with semaphore:
+                result = await _call_api(fetch, [object_name])
+            _store_tool_result(cache_key, result)
+        return result
+    
+    results = await asyncio.gather(*(fetch_one(object_name) for object_name in object_names))
+    return [item for result in results for item in result]
+
+
+# Persistent cache of get_rag_info answers, so identical questions over identical retrieved
+# context skip the LLM call across restarts. Bump RAG_CACHE_VERSION to invalidate old entries.
+# EVO_AI_RAG_CACHE_TTL sets an expiry in seconds; unset or 0 keeps entries indefinitely.
+RAG_CACHE_VERSION = "v1"
+RAG_CACHE_PATH = logs_dir / "rag_cache.sqlite3"
+try:
+    RAG_CACHE_TTL = float(os.getenv("EVO_AI_RAG_CACHE_TTL") or 0)
+except ValueError:
+    logger.warning(
+        "Ignoring invalid EVO_AI_RAG_CACHE_TTL %r; cached answers will not expire", os.getenv("EVO_AI_RAG_CACHE_TTL")
+    )
+    RAG_CACHE_TTL = 0.0
+_rag_cache_conn: Optional[sqlite3.Connection] = None
+# The cache is read and written from worker threads (via asyncio.to_thread); the lock serializes
+# use of the shared connection and its creation
+_rag_cache_lock = threading.Lock()
+
+
+def _rag_cache() -> sqlite3.Connection:
+    """Open the RAG answer cache on first use. Callers must hold _rag_cache_lock."""
+    global _rag_cache_conn
+    if _rag_cache_conn is None:
+        RAG_CACHE_PATH.parent.mkdir(exist_ok=True)
+        _rag_cache_conn = sqlite3.connect(RAG_CACHE_PATH, check_same_thread=False)
+        _rag_cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS rag_cache (key TEXT PRIMARY KEY, response TEXT NOT NULL, expires_at REAL)"
+        )
+    return _rag_cache_conn
+
+
+def _rag_cache_key(query: str, retrieved_context: Any) -> str:
+    """Hash the query and retrieved context into a versioned cache key."""
+    digest = hashlib.blake2b(f"{query}||{retrieved_context}".encode(), digest_size=16).hexdigest()
+    return f"{RAG_CACHE_VERSION}:{digest}"
+
+
+def _get_cached_rag_response(key: str) -> Optional[str]:
+    """Return the cached answer for key, or None on a miss, expired entry or cache error."""
+    try:
+        with _rag_cache_lock:
+            row = _rag_cache().execute("SELECT response, expires_at FROM rag_cache WHERE key = ?", (key,)).fetchone()
+    except sqlite3.Error as e:
+        logger.warning("RAG cache lookup failed: %s", e)
+        return None
+    if row is None:
+        return None
+    response, expires_at = row
+    if expires_at is not None and expires_at < time.time():
+        return None
+    return response
+
+
+def _store_rag_response(key: str, response: str) -> None:
+    """Store an answer, honouring RAG_CACHE_TTL."""
+    expires_at = time.time() + RAG_CACHE_TTL if RAG_CACHE_TTL > 0 else None
+    try:
+        with _rag_cache_lock, _rag_cache() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO rag_cache (key, response, expires_at) VALUES (?, ?, ?)",
+                (key, response, expires_at),
+            )
+    except sqlite3.Error as e:
+        logger.warning("RAG cache store failed: %s", e)
+
+
+# Prompt for get_rag_info; only the query and the retrieved context vary per call
+_RAG_PROMPT_TEMPLATE = """
+    Your task is to answer a question.
+    I will provide you with a question and, if available, results from a knowledge retrieval system. 
+
+    The 'Retrieval Results' section below contains a series of text excerpts retrieved from various documents. Each excerpt is formatted as follows:
+
+    ---
+    Document: [Name of the Document]
+    Content: [Relevant text excerpt from the document]
+    ---
+
+    Always provide the name of the document from which you source your information in your answer. 
+
+
+    **Question:** {query}
+
+    **Instructions:**
+
+    1.  **Analyze the Retrieval Results:** First, examine the 'Retrieval Results' section below.
+    2.  **Use Retrieval Results If Available:** **Always** prioritize using information 'Retrieval Results' to formulate your response. Again, always provide the name of the document if its information is used.
+    3.  **Use Your Own Knowledge if no Retrieval Results:** **Crucially, if the 'Retrieval Results' section is empty or states 'No results found', you MUST use your own internal knowledge to answer the question.** Do not simply say you cannot answer.
+    4.  **Utilize both supplied and internal knowledge:** You are permitted to utilize internal knowledge in your response, ONLY if retrieved information is insufficient.
+    5.  **Acknowledge Knowledge Gaps:** If neither the retrieval results nor your own knowledge provides a sufficient answer, only then state that you cannot provide a response.
+
+    **Retrieval Results:**
+    {retrieved_context}
+    """
 
 
 async def download_assay_data(object_name: str, collections_attribute: Optional[str] = None) -> List[float]:
@@ -73,13 +371,25 @@ async def download_assay_data(object_name: str, collections_attribute: Optional[
         List[float]: A list of float values representing the assay data.
     """
     
-    logger.info(f"Downloading assay data for object: {object_name}, attribute: {collections_attribute}")
+    logger.info("Downloading assay data for object: %s, attribute: %s", object_name, collections_attribute)
     
-    api_response = await download_table_data_from_api(object_name, collections_attribute)
+    # Interned so the cache key matches the fixture names by identity
+    object_name = sys.intern(object_name)
+    cache_key = ("download_assay_data", object_name, collections_attribute)
+    cached = _get_cached_tool_result(cache_key)
+    if cached is not None:
+        logger.info("Returning cached assay data with %s values", len(cached))
+        return list(cached)
     
-    logger.info(f"Successfully downloaded assay data with {len(api_response)} values")
+    # Stored as a tuple so the cached values cannot be modified by a caller, who gets a list copy
+    api_response = tuple(
+        await _call_api(download_table_data_from_api, object_name, collections_attribute)
+    )
+    _store_tool_result(cache_key, api_response)
     
-    return api_response
+    logger.info("Successfully downloaded assay data with %s values", len(api_response))
+    
+    return list(api_response)
 
 
 def generate_chart(user_prompt: str) -> Dict[str, Any]:
@@ -98,50 +408,66 @@ def generate_chart(user_prompt: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: A dictionary containing chart details and file paths (JSON-serializable).
     """
-    logger.info(f"Generating chart for user prompt: {user_prompt}")
+    logger.info("Generating chart for user prompt: %s", user_prompt)
     
     try:
         # Extract object name and attribute from user prompt
-        object_name, attribute_name = extract_object_and_attribute(user_prompt)
-        
-        # Get data from our structured fake data
-        df = create_dataframe_from_fake_data(object_name, attribute_name, user_prompt)
+        object_name, attribute_name = _extract_object_and_attribute(user_prompt)
         
-        logger.info(f"Created dataframe with shape: {df.shape}")
-        logger.info(f"Dataframe columns: {list(df.columns)}")
+        cached_png = _chart_cache_path(object_name, attribute_name, user_prompt)
+        cached_info = cached_png.with_suffix(".json")
+        if cached_png.exists() and cached_info.exists():
+            logger.info("Reusing cached chart: %s", cached_png)
+            chart_info = _load(cached_info.read_bytes())
+            chart_info["user_request"] = user_prompt
+        else:
+            # Get data from our structured fake data
+            df = create_dataframe_from_fake_data(object_name, attribute_name, user_prompt)
+            
+            logger.info("Created dataframe with shape: %s", df.shape)
+            logger.info("Dataframe columns: %s", list(df.columns))
+            
+            # Common chart requests are built locally; everything else is generated with
+            # secure VertexAI code execution
+            plotly_figure = generate_fast_chart(df, user_prompt)
+            if plotly_figure is None:
+                plotly_figure = generate_simple_chart(df, user_prompt, attribute_name)
+
+            # Save the chart file (PNG only)
+            CHART_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            png_filename = save_chart_file(plotly_figure, user_prompt, png_filename=str(cached_png))
+            
+            # Prepare chart information (all JSON-serializable)
+            chart_info = {
+                "chart_type": "plotly.graph_objects.Figure",
+                "data_shape": list(df.shape),
+                "columns_used": list(df.columns),
+                "user_request": user_prompt,
+                "object_name": object_name,
+                "attribute_name": attribute_name,
+                "png_file": png_filename,
+                "data_points": len(df),
+                "success": True
+            }
+            
+            # Keep the metadata next to the PNG, unless rendering fell back to an error note
+            if png_filename == str(cached_png):
+                cached_info.write_bytes(_dump(chart_info))
         
-        # Generate the chart using secure VertexAI code execution
-        plotly_figure = generate_simple_chart(df, user_prompt, attribute_name)
-
-        # Save the chart file (PNG only)
-        png_filename = save_chart_file(plotly_figure, user_prompt)
-        
-        # Prepare chart information (all JSON-serializable)
-        chart_info = {
-            "chart_type": "plotly.graph_objects.Figure",
-            "data_shape": list(df.shape),
-            "columns_used": list(df.columns),
-            "user_request": user_prompt,
-            "object_name": object_name,
-            "attribute_name": attribute_name,
-            "png_file": png_filename,
-            "data_points": len(df),
-            "success": True
-        }
-        
-        logger.info(f"Successfully generated and saved chart: {chart_info}")
+        logger.info("Successfully generated and saved chart: %s", chart_info)
         
+        png_filename = chart_info["png_file"]
         return {
             "chart_info": chart_info,
             "success": True,
             "message": f"Chart generated successfully for {object_name}.{attribute_name}! File saved: {png_filename}",
             "png_path": png_filename,
-            "data_points": len(df),
-            "columns_count": len(df.columns)
+            "data_points": chart_info["data_points"],
+            "columns_count": len(chart_info["columns_used"])
         }
         
     except Exception as e:
-        logger.error(f"Error generating chart: {e}")
+        logger.error("Error generating chart: %s", e)
         return {
             "chart_info": None,
             "success": False,
@@ -168,12 +494,18 @@ async def get_list_of_objects() -> List[str]:
     
     logger.info("Getting list of objects from workspace")
     
-    # Call the placeholder API function
-    api_response = await get_list_of_objects_from_api(all_versions=False)
+    cache_key = ("get_list_of_objects",)
+    api_response = _get_cached_tool_result(cache_key)
+    if api_response is None:
+        # Call the placeholder API function
+        # Stored as a tuple so callers cannot reorder or drop cached entries, and each gets a
+        # list copy. The object dicts inside are shared, not copied, and must not be modified.
+        api_response = tuple(await _call_api(get_list_of_objects_from_api, all_versions=False))
+        _store_tool_result(cache_key, api_response)
     
-    logger.info(f"Retrieved {len(api_response)} objects from workspace (fake data)")
+    logger.info("Retrieved %s objects from workspace (fake data)", len(api_response))
     
-    return api_response
+    return list(api_response)
 
 
 async def get_list_of_objects_all_versions() -> List[str]:
@@ -187,12 +519,18 @@ async def get_list_of_objects_all_versions() -> List[str]:
     
     logger.info("Getting list of objects with all versions from workspace")
     
-    # Call the placeholder API function
-    api_response = await get_list_of_objects_from_api(all_versions=True)
+    cache_key = ("get_list_of_objects_all_versions",)
+    api_response = _get_cached_tool_result(cache_key)
+    if api_response is None:
+        # Call the placeholder API function
+        # Stored as a tuple so callers cannot reorder or drop cached entries, and each gets a
+        # list copy. The object dicts inside are shared, not copied, and must not be modified.
+        api_response = tuple(await _call_api(get_list_of_objects_from_api, all_versions=True))
+        _store_tool_result(cache_key, api_response)
     
-    logger.info(f"Retrieved {len(api_response)} objects with all versions from workspace (fake data)")
+    logger.info("Retrieved %s objects with all versions from workspace (fake data)", len(api_response))
     
-    return api_response
+    return list(api_response)
 
 
 async def get_objects_info(object_names: List[str]) -> List[Dict[str, Any]]:
@@ -210,12 +548,12 @@ async def get_objects_info(object_names: List[str]) -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: Detailed information about the requested objects.
     """
     
-    logger.info(f"Getting detailed information for objects: {object_names}")
+    logger.info("Getting detailed information for objects: %s", object_names)
     
-    # Call the placeholder API function
-    api_response = await get_objects_info_from_api(object_names)
+    # Call the placeholder API function once per object, concurrently
+    api_response = await _gather_per_object("get_objects_info", get_objects_info_from_api, object_names)
     
-    logger.info(f"Retrieved detailed information for {len(api_response)} objects (fake data)")
+    logger.info("Retrieved detailed information for %s objects (fake data)", len(api_response))
     
     return api_response
 
@@ -234,12 +572,14 @@ async def get_object_versions_info(object_names: List[str]) -> List[Dict[str, An
         List[Dict[str, Any]]: Detailed version information for the requested objects.
     """
     
-    logger.info(f"Getting version information for objects: {object_names}")
+    logger.info("Getting version information for objects: %s", object_names)
     
-    # Call the placeholder API function
-    api_response = await get_object_versions_info_from_api(object_names)
+    # Call the placeholder API function once per object, concurrently
+    api_response = await _gather_per_object(
+        "get_object_versions_info", get_object_versions_info_from_api, object_names
+    )
     
-    logger.info(f"Retrieved version information for {len(api_response)} objects (fake data)")
+    logger.info("Retrieved version information for %s objects (fake data)", len(api_response))
     
     return api_response
 
@@ -265,42 +605,30 @@ async def get_rag_info(query: str) -> str:
         str: The response from the domain-specific information API.
     """
     
-    logger.info(f"Getting RAG information for query: {query}")
+    logger.info("Getting RAG information for query: %s", query)
 
-    if not rag_engine.has_corpus():
+    # First-use initialization talks to Vertex AI, so keep it off the event loop
+    rag_engine = await asyncio.to_thread(_get_rag_engine)
+    if rag_engine is None or not rag_engine.has_corpus():
         return "Workspace has no associated corpus."
     
-    retrieved_context = rag_engine.query(query)
-
-    conditional_RAG_prompt = f"""
-    Your task is to answer a question.
-    I will provide you with a question and, if available, results from a knowledge retrieval system. 
-
-    The 'Retrieval Results' section below contains a series of text excerpts retrieved from various documents. Each excerpt is formatted as follows:
-
-    ---
-    Document: [Name of the Document]
-    Content: [Relevant text excerpt from the document]
-    ---
-
-    Always provide the name of the document from which you source your information in your answer. 
-
-
-    **Question:** {query}
-
-    **Instructions:**
-
-    1.  **Analyze the Retrieval Results:** First, examine the 'Retrieval Results' section below.
-    2.  **Use Retrieval Results If Available:** **Always** prioritize using information 'Retrieval Results' to formulate your response. Again, always provide the name of the document if its information is used.
-    3.  **Use Your Own Knowledge if no Retrieval Results:** **Crucially, if the 'Retrieval Results' section is empty or states 'No results found', you MUST use your own internal knowledge to answer the question.** Do not simply say you cannot answer.
-    4.  **Utilize both supplied and internal knowledge:** You are permitted to utilize internal knowledge in your response, ONLY if retrieved information is insufficient.
-    5.  **Acknowledge Knowledge Gaps:** If neither the retrieval results nor your own knowledge provides a sufficient answer, only then state that you cannot provide a response.
-
-    **Retrieval Results:**
-    {retrieved_context}
-    """
-
-    api_response = generate_llm_response(conditional_RAG_prompt)
+    # Retrieval and generation are blocking HTTP calls; run them in worker threads so other
+    # tool calls keep progressing. Concurrent calls asking the same question share one retrieval.
+    retrieved_context = await rag_engine.query_async(query)
+
+    # The answer cache is an SQLite file, so its reads and writes also run in worker threads
+    cache_key = _rag_cache_key(query, retrieved_context)
+    cached_response = await asyncio.to_thread(_get_cached_rag_response, cache_key)
+    if cached_response is not None:
+        logger.info("Returning cached RAG information")
+        return cached_response
+
+    conditional_RAG_prompt = _RAG_PROMPT_TEMPLATE.format(query=query, retrieved_context=retrieved_context)
+
+    # The answer is cached above, so the in-memory LLM response cache is skipped
+    api_response = await asyncio.to_thread(generate_llm_response, conditional_RAG_prompt, use_cache=False)
+    if api_response:
+        await asyncio.to_thread(_store_rag_response, cache_key, api_response)
 
     logger.info("Retrieved RAG information successfully")
 
@@ -3,13 +3,21 @@ LLM utility functions for the Evo AI Agent.
 Contains placeholder API functions that return fake data for testing.
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import logging
 import os
+import re
+import tempfile
+import threading
+import time
+import weakref
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import vertexai
-from google import genai
-from google.genai import types
-from typing import Any, Dict, List, Tuple, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Sequence, Tuple, Optional
 from dotenv import load_dotenv
 import pandas as pd
 import numpy as np
@@ -17,8 +25,34 @@ import plotly.graph_objects as go
 import plotly.express as px
 import plotly.io as pio
 
-from .fake_data import FAKE_OBJECT_VERSIONS_INFO, FAKE_OBJECTS_ALL_VERSIONS, FAKE_OBJECTS_DATABASE, FAKE_OBJECTS_LIST
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import numexpr
+except ImportError:  # pragma: no cover - optional dependency
+    numexpr = None
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional dependency
+    xxhash = None
+
+from .fake_data import (
+    FAKE_OBJECTS_LIST,
+    get_object_versions_info,
+    get_objects_all_versions,
+    get_objects_database,
+    get_table_data,
+)
 from .code_execution_agent import execute_code
+from .utils import LRUCache, pooled_http_options
+
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +64,12 @@ load_dotenv(dotenv_path=env_path)
 PROJECT_ID = os.getenv("PROJECT_ID", "your-project-id")
 LOCATION = os.getenv("LOCATION", "us-central1")
 
-# Set Google Cloud project information and initialize Vertex AI
-vertexai.init(project=PROJECT_ID, location=LOCATION)
+# Vertex AI and the Gemini client are initialized on the first LLM call (see _genai_client), so
+# importing this module for the data helpers doesn't pay for SDK imports and credential discovery
+
+
+# Below this many numeric cells NumPy beats numexpr's thread start-up
+NUMEXPR_MIN_ELEMENTS = 100_000
 
 
 def clean_dataframe_for_analysis(df: pd.DataFrame) -> pd.DataFrame:
@@ -45,22 +83,233 @@ def clean_dataframe_for_analysis(df: pd.DataFrame) -> pd.DataFrame:
     """
     placeholder_values = {"-", "--", "n/a", "N/A", "na", "NA", "missing", "Missing", "null", "Null"}
 
-    # Replace common placeholders with NaN
-    df_cleaned = df.replace(list(placeholder_values), np.nan)
+    # Keep only numeric columns
+    numeric_df = df.select_dtypes(include=[np.number])
+
+    # Build one row mask instead of separate inf-replace, dropna and sign-filter passes:
+    # numeric values must be finite and non-negative. NaN fails every comparison and -inf
+    # fails >= 0, so two comparisons cover it, combined in place without another temporary
+    values = numeric_df.to_numpy(dtype=np.float64, copy=False)
+    if numexpr is not None and values.size >= NUMEXPR_MIN_ELEMENTS:
+        # Both comparisons in one multithreaded pass over the values
+        valid = numexpr.evaluate("(values >= 0) & (values < inf)", local_dict={"values": values, "inf": np.inf})
+    else:
+        valid = values >= 0
+        valid &= values < np.inf
+    keep = valid.all(axis=1)
 
-    # Replace inf with NaN
-    df_cleaned = df_cleaned.replace([np.inf, -np.inf], np.nan)
+    # Other columns must not be missing; placeholders can only occur there, so the
+    # elementwise replace skips the numeric columns
+    other_df = df.drop(columns=numeric_df.columns)
+    if len(other_df.columns):
+        other_df = other_df.replace(list(placeholder_values), np.nan)
+        keep &= other_df.notna().all(axis=1).to_numpy()
 
-    # Drop rows with any NaNs
-    df_cleaned = df_cleaned.dropna()
+    return numeric_df[keep]
 
-    # Keep only numeric columns
-    numeric_df = df_cleaned.select_dtypes(include=[np.number])
 
-    # Filter out rows with negative numbers
-    numeric_df = numeric_df[(numeric_df >= 0).all(axis=1)]
+def _is_numpy_numeric(dtype: Any) -> bool:
+    """Whether a dtype is a plain numpy bool/int/float, i.e. its values form one flat buffer."""
+    return isinstance(dtype, np.dtype) and dtype.kind in "biuf"
+
+
+def _xxh3(values: np.ndarray) -> int:
+    """Hash the raw bytes of a numeric array with xxh3."""
+    return xxhash.xxh3_64_intdigest(memoryview(np.ascontiguousarray(values)).cast("B"))
+
+
+def _row_hash(obj: Any) -> bytes:
+    """
+    Digest the per-row hashes of pd.util.hash_pandas_object in row order.
+
+    Summing the row hashes would give a reordered frame (e.g. after sort_values, which keeps
+    the index labels) the same key, so the hashes are digested as one ordered buffer instead.
+    """
+    row_hashes = pd.util.hash_pandas_object(obj, index=True).to_numpy()
+    return hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest()
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> Tuple[Any, ...]:
+    """
+    Identify a DataFrame by its columns, dtypes, shape and a hash of its content.
+
+    With xxhash installed, purely numeric frames hash their values buffer with xxh3, which is
+    several times faster than pd.util.hash_pandas_object; other frames fall back to the latter.
+    Both hashes depend on the row order.
+    """
+    if xxhash is not None and all(_is_numpy_numeric(dtype) for dtype in df.dtypes):
+        if _is_numpy_numeric(df.index.dtype):
+            index_hash = _xxh3(df.index.to_numpy())
+        else:
+            index_hash = _row_hash(df.index)
+        content = (_xxh3(df.to_numpy()), index_hash)
+    else:
+        content = _row_hash(df)
+    return (
+        tuple(df.columns),
+        tuple(df.dtypes.astype(str)),
+        df.shape,
+        content,
+    )
+
+
+# Cleaned frames keyed on a content fingerprint of the input, so charting the same data again
+# (a tweaked prompt, or the fast path falling back to the LLM path) reuses the cleaned copy
+CLEANED_FRAME_CACHE_MAXSIZE = 32
+_cleaned_frames: "LRUCache[Tuple[Any, ...], pd.DataFrame]" = LRUCache(CLEANED_FRAME_CACHE_MAXSIZE)
+
+
+def _clean_dataframe_cached(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return clean_dataframe_for_analysis(df), reusing the result for frames with equal content.
+    
+    The returned frame may be shared between calls and must not be modified.
+    """
+    fingerprint = _frame_fingerprint(df)
+    cleaned_df = _cleaned_frames.get(fingerprint)
+    if cleaned_df is None:
+        cleaned_df = clean_dataframe_for_analysis(df)
+        _cleaned_frames.set(fingerprint, cleaned_df)
+    return cleaned_df
+
+
+# LLM-generated chart code keyed on the normalized user prompt, the chart type or attribute and
+# the available columns, so a repeated request skips the LLM round trip. The cache is written to
+# disk so it survives restarts; entries whose code fails to execute are dropped.
+# EVO_AI_CHART_CODE_CACHE_TTL sets the expiry in seconds (default one hour); 0 keeps entries indefinitely.
+CHART_CODE_CACHE_PATH = Path("logs") / "chart_code_cache.json"
+CHART_CODE_CACHE_MAXSIZE = 512
+CHART_CODE_CACHE_TTL = float(os.getenv("EVO_AI_CHART_CODE_CACHE_TTL") or 3600)
+_chart_code_cache: Optional["LRUCache[str, str]"] = None
+# Failed code is discarded from worker threads (via asyncio.to_thread). The cache itself is
+# thread-safe; this lock serializes loading it and writing its file, and is reentrant because
+# updates load the cache before saving it
+_chart_code_cache_lock = threading.RLock()
+
+
+def _chart_code_cache_key(user_prompt: str, chart_type: str, columns: List[str]) -> str:
+    """
+    Build the chart code cache key; whitespace and case in the prompt are ignored.
+    
+    The row count is deliberately not part of the key: the generated code refers to columns,
+    not to the number of rows, so it stays valid when the same columns carry more or less data.
+    """
+    normalized_prompt = " ".join(user_prompt.lower().split())
+    return json.dumps([normalized_prompt, chart_type, sorted(columns)])
+
+
+def _load_chart_code_cache() -> "LRUCache[str, str]":
+    """Load the persisted chart code cache on first use; the file holds [code, expires_at] entries."""
+    global _chart_code_cache
+    with _chart_code_cache_lock:
+        if _chart_code_cache is None:
+            try:
+                entries = json.loads(CHART_CODE_CACHE_PATH.read_text())
+            except (OSError, ValueError):
+                entries = {}
+            cache = LRUCache(CHART_CODE_CACHE_MAXSIZE, ttl=CHART_CODE_CACHE_TTL)
+            for key, entry in entries.items():
+                if isinstance(entry, list) and len(entry) == 2:
+                    llm_code, expires_at = entry
+                    cache.set(key, llm_code, expires_at)
+            _chart_code_cache = cache
+    return _chart_code_cache
+
+
+def _save_chart_code_cache() -> None:
+    """
+    Write the chart code cache to disk, replacing the file atomically.
+    
+    Each write goes through its own temporary file, so processes sharing the cache file never
+    write into the same file. Callers must hold _chart_code_cache_lock.
+    """
+    tmp_path = None
+    try:
+        CHART_CODE_CACHE_PATH.parent.mkdir(exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=CHART_CODE_CACHE_PATH.parent, suffix=".tmp", delete=False
+        ) as tmp_file:
+            tmp_path = tmp_file.name
+            entries = _load_chart_code_cache().entries()
+            json.dump({key: [llm_code, expires_at] for key, llm_code, expires_at in entries}, tmp_file)
+        os.replace(tmp_path, CHART_CODE_CACHE_PATH)
+    except OSError as e:
+        logger.warning("Chart code cache write failed: %s", e)
+        if tmp_path is not None:
+            Path(tmp_path).unlink(missing_ok=True)
+
+
+def _cached_chart_code(cache_key: str) -> Optional[str]:
+    """Return the cached LLM response for cache_key, or None on a miss or expired entry."""
+    llm_code = _load_chart_code_cache().get(cache_key)
+    if llm_code is not None:
+        logger.info("Reusing cached chart code")
+    return llm_code
+
+
+def _store_chart_code(cache_key: str, llm_code: str) -> None:
+    """Cache an LLM response, evicting the least recently used entry."""
+    if not llm_code:
+        return
+    with _chart_code_cache_lock:
+        _load_chart_code_cache().set(cache_key, llm_code)
+        _save_chart_code_cache()
+
+
+def _generate_chart_code(cache_key: str, llm_prompt: str) -> str:
+    """Return the cached LLM response for cache_key, or ask the LLM and cache its answer."""
+    llm_code = _cached_chart_code(cache_key)
+    if llm_code is None:
+        llm_code = generate_llm_response(llm_prompt, use_cache=False)
+        _store_chart_code(cache_key, llm_code)
+    return llm_code
+
+
+async def _generate_chart_code_async(cache_key: str, llm_prompt: str) -> str:
+    """Async variant of _generate_chart_code."""
+    llm_code = _cached_chart_code(cache_key)
+    if llm_code is None:
+        llm_code = await generate_llm_response_async(llm_prompt, use_cache=False)
+        _store_chart_code(cache_key, llm_code)
+    return llm_code
+
+
+def _discard_chart_code(cache_key: str) -> None:
+    """Forget cached code that failed, so the next request asks the LLM again."""
+    with _chart_code_cache_lock:
+        if _load_chart_code_cache().pop(cache_key, None) is not None:
+            _save_chart_code_cache()
+
+
+# Serialized DataFrame payloads keyed on the frame fingerprint, so iterating on a chart over the
+# same data serializes it once. The executor keeps no state between calls, so the payload is
+# still embedded in every request.
+DATAFRAME_PAYLOAD_CACHE_MAXSIZE = 16
+_dataframe_payloads: "LRUCache[Tuple[Any, ...], str]" = LRUCache(DATAFRAME_PAYLOAD_CACHE_MAXSIZE)
+
+
+def _serialize_dataframe(df: pd.DataFrame) -> str:
+    """
+    Serialize a DataFrame column-oriented as JSON. With orjson installed, numeric columns are
+    written straight from their NumPy arrays instead of being converted to Python floats first.
+    """
+    if orjson is None:
+        return json.dumps(df.to_dict(orient='list'), default=str)
+    columns = {
+        column: np.ascontiguousarray(values) if values.dtype.kind in "iuf" else values.tolist()
+        for column, values in ((column, df[column].to_numpy()) for column in df.columns)
+    }
+    return orjson.dumps(columns, option=orjson.OPT_SERIALIZE_NUMPY, default=str).decode()
+
 
-    return numeric_df
+def _dataframe_payload(df: pd.DataFrame) -> str:
+    """Serialize a DataFrame column-oriented as JSON, reusing the result for equal frames."""
+    fingerprint = _frame_fingerprint(df)
+    payload = _dataframe_payloads.get(fingerprint)
+    if payload is None:
+        payload = _serialize_dataframe(df)
+        _dataframe_payloads.set(fingerprint, payload)
+    return payload
 
 
 def execute_code_with_dataframe(code: str, df: pd.DataFrame) -> Dict[str, Any]:
@@ -76,8 +325,9 @@ def execute_code_with_dataframe(code: str, df: pd.DataFrame) -> Dict[str, Any]:
         Dictionary containing execution results
     """
     # Prepare code that includes the dataframe
-    # Convert dataframe to a format that can be embedded in code
-    df_json = df.to_json(orient='records')
+    # Embed it column-oriented (one list per column) as a JSON string literal: column names
+    # aren't repeated for every row, and NaN or null values survive the round trip
+    df_json = _dataframe_payload(df)
     
     # Create code that reconstructs the dataframe and then executes the user code
     full_code = f"""
@@ -88,8 +338,7 @@ import numpy as np
 
 # Reconstruct the dataframe
 import json
-df_data = {df_json}
-df = pd.DataFrame(df_data)
+df = pd.DataFrame(json.loads({df_json!r}))
 
 # Execute the user's code
 {code}
@@ -99,6 +348,35 @@ df = pd.DataFrame(df_data)
     return execute_code(full_code)
 
 
+# Prompt for generate_plot_widget; only the chart type, prompt and columns vary per call
+_PLOT_WIDGET_PROMPT_TEMPLATE = (
+    "You are a helpful Python assistant that generates Plotly figures using `plotly.express`.\n\n"
+    "User chart type: {chart_type}\n"
+    "User prompt: '{user_prompt}'\n\n"
+    "The available DataFrame columns after cleaning are: {available_columns}\n"
+    "IMPORTANT: Only use columns from the list above. Do not reference any other columns like 'sample_id' as they have been removed during data cleaning.\n\n"
+    "Use your understanding of the context and semantics to intelligently map user-described variables "
+    "to actual column names in the DataFrame. For example, interpret 'gold' as a reference to a column like 'gold' "
+    "if available. Do not invent or assume columns beyond those provided.\n\n"
+    "Generate complete Python code that:\n"
+    "1. Creates a Plotly figure using the DataFrame variable named `df`\n"
+    "2. At the end of the script, print the figure JSON using:\n"
+    "   `print('FIGURE_JSON:' + fig.to_json())`\n"
+    "3. Does not save any files; the figure is saved after execution.\n\n"
+    "IMPORTANT: When binning any column using `pd.cut(...)`, you must convert the resulting intervals "
+    "to strings using `.astype(str)`. This ensures labels (e.g., '(100.0, 200.0]') are visible in the legend or axes, and avoids serialization issues with Plotly.\n\n"
+    "Use `clip` for modifying values (not filtering) and retain all data in the plot.\n\n"
+    "Example structure:\n"
+    "```python\n"
+    "# Create the chart\n"
+    "fig = px.histogram(df, x='column_name', title='My Chart')\n"
+    "\n"
+    "print('FIGURE_JSON:' + fig.to_json())\n"
+    "```\n\n"
+    "Generate the complete code without markdown formatting."
+)
+
+
 def generate_plot_widget(df_input: pd.DataFrame, prompt: str, chart_type: str = "histogram") -> go.Figure:
     """
     Generates a Plotly figure based on LLM-generated code using secure code execution.
@@ -111,64 +389,58 @@ def generate_plot_widget(df_input: pd.DataFrame, prompt: str, chart_type: str =
     Returns:
         go.Figure: Generated Plotly figure.
     """
+    cleaned_df, cache_key, conditional_prompt = _prepare_plot_widget(df_input, prompt, chart_type)
+
+    # Get LLM-generated code, reusing the code from an identical earlier request
+    llm_code = _generate_chart_code(cache_key, conditional_prompt)
+    return _render_plot_widget(llm_code, cleaned_df, cache_key)
+
+
+async def generate_plot_widget_async(df_input: pd.DataFrame, prompt: str, chart_type: str = "histogram") -> go.Figure:
+    """
+    Async variant of generate_plot_widget: the LLM call uses the native async client and the
+    blocking code execution runs in a worker thread, so several charts can be generated at once.
+
+    Args:
+        df_input (pd.DataFrame): Input dataframe to use in the plot.
+        prompt (str): User-provided natural language description of desired chart.
+        chart_type (str): Optional chart type hint (default: "histogram").
+
+    Returns:
+        go.Figure: Generated Plotly figure.
+    """
+    cleaned_df, cache_key, conditional_prompt = _prepare_plot_widget(df_input, prompt, chart_type)
+    llm_code = await _generate_chart_code_async(cache_key, conditional_prompt)
+    return await asyncio.to_thread(_render_plot_widget, llm_code, cleaned_df, cache_key)
+
 
+def _prepare_plot_widget(df_input: pd.DataFrame, prompt: str, chart_type: str) -> Tuple[pd.DataFrame, str, str]:
+    """Clean the input and build the chart code cache key and LLM prompt for a plot widget."""
     # Clean the dataframe first to know what columns will be available
-    cleaned_df = clean_dataframe_for_analysis(df_input)
-    available_columns = list(cleaned_df.columns)
+    cleaned_df = _clean_dataframe_cached(df_input)
+    available_columns = cleaned_df.columns.tolist()
     
-    logger.info(f"Original dataframe columns: {list(df_input.columns)}")
-    logger.info(f"Cleaned dataframe columns: {available_columns}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Original dataframe columns: %s", df_input.columns.tolist())
+        logger.info("Cleaned dataframe columns: %s", available_columns)
     
     # Prepare the prompt to guide the LLM with actual available columns
-    conditional_prompt = (
-        f"You are a helpful Python assistant that generates Plotly figures using `plotly.express`.\n\n"
-        f"User chart type: {chart_type}\n"
-        f"User prompt: '{prompt}'\n\n"
-        f"The available DataFrame columns after cleaning are: {available_columns}\n"
-        "IMPORTANT: Only use columns from the list above. Do not reference any other columns like 'sample_id' as they have been removed during data cleaning.\n\n"
-        "Use your understanding of the context and semantics to intelligently map user-described variables "
-        "to actual column names in the DataFrame. For example, interpret 'gold' as a reference to a column like 'gold' "
-        "if available. Do not invent or assume columns beyond those provided.\n\n"
-        "Generate complete Python code that:\n"
-        "1. Creates a Plotly figure using the DataFrame variable named `df`\n"
-        "2. Saves the figure as both PNG and HTML files in 'generated_charts/' directory\n"
-        "3. Prints the file paths and chart information\n\n"
-        "IMPORTANT: When binning any column using `pd.cut(...)`, you must convert the resulting intervals "
-        "to strings using `.astype(str)`. This ensures labels (e.g., '(100.0, 200.0]') are visible in the legend or axes, and avoids serialization issues with Plotly.\n\n"
-        "Use `clip` for modifying values (not filtering) and retain all data in the plot.\n\n"
-        "Example structure:\n"
-        "```python\n"
-        "import os\n"
-        "from datetime import datetime\n"
-        "\n"
-        "# Create output directory\n"
-        "os.makedirs('generated_charts', exist_ok=True)\n"
-        "\n"
-        "# Generate timestamp for unique filenames\n"
-        "timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')\n"
-        "\n"
-        "# Create the chart\n"
-        "fig = px.histogram(df, x='column_name', title='My Chart')\n"
-        "\n"
-        "# Save files\n"
-        "png_file = f'generated_charts/chart_{timestamp}.png'\n"
-        "html_file = f'generated_charts/chart_{timestamp}.html'\n"
-        "fig.write_image(png_file, width=800, height=600)\n"
-        "fig.write_html(html_file)\n"
-        "\n"
-        "print(f'Chart saved as PNG: {png_file}')\n"
-        "print(f'Chart saved as HTML: {html_file}')\n"
-        "```\n\n"
-        "Generate the complete code without markdown formatting."
-    )
+    conditional_prompt = _PLOT_WIDGET_PROMPT_TEMPLATE.format_map({
+        'chart_type': chart_type,
+        'user_prompt': prompt,
+        'available_columns': available_columns,
+    })
+    cache_key = _chart_code_cache_key(prompt, chart_type, available_columns)
+    return cleaned_df, cache_key, conditional_prompt
+
 
-    # Get LLM-generated code
-    llm_code = generate_llm_response(conditional_prompt)
+# Marker printed by the generated chart code, matched over the whole executor output at once
+_FIGURE_JSON_RE = re.compile(r"^FIGURE_JSON:(.*)$", re.MULTILINE)
 
-    # Print the LLM-generated code for debugging
-    print("--------------------------------")
-    print("Generated code from LLM:")
-    print(llm_code)
+
+def _render_plot_widget(llm_code: str, cleaned_df: pd.DataFrame, cache_key: str) -> go.Figure:
+    """Execute LLM-generated plot code against the cleaned dataframe and build the result figure."""
+    logger.debug("Generated code from LLM:\n%s", llm_code)
 
     # Clean up Markdown formatting
     if "```" in llm_code:
@@ -186,18 +458,14 @@ def generate_plot_widget(df_input: pd.DataFrame, prompt: str, chart_type: str =
         
         if result['success']:
             logger.info("Code executed successfully via VertexAI Code Executor")
-            logger.info(f"Execution output: {result['output']}")
-            
-            # Parse the output to find saved file paths
-            output_lines = result['output'].split('\n')
-            png_file = None
-            html_file = None
+            logger.info("Execution output: %s", result['output'])
             
-            for line in output_lines:
-                if 'Chart saved as PNG:' in line:
-                    png_file = line.split('Chart saved as PNG:')[-1].strip()
-                elif 'Chart saved as HTML:' in line:
-                    html_file = line.split('Chart saved as HTML:')[-1].strip()
+            # Parse the figure from the output and save it here, where the files are kept
+            match = _FIGURE_JSON_RE.search(result['output'])
+            if not match:
+                _discard_chart_code(cache_key)
+                raise RuntimeError("Figure JSON not found in execution output")
+            png_file, html_file = _write_chart_files(pio.from_json(match.group(1).strip()))
             
             # Return a figure indicating success with file paths
             fig = go.Figure()
@@ -224,11 +492,12 @@ def generate_plot_widget(df_input: pd.DataFrame, prompt: str, chart_type: str =
             
         else:
             # Log the error and raise an exception with detailed information
-            logger.error(f"VertexAI Code Executor failed: {result['error']}")
+            _discard_chart_code(cache_key)
+            logger.error("VertexAI Code Executor failed: %s", result['error'])
             raise RuntimeError(f"VertexAI Code Executor failed: {result['error']}")
 
     except Exception as e:
-        logger.error(f"Error in plot generation: {e}")
+        logger.error("Error in plot generation: %s", e)
         raise e
 
 
@@ -244,9 +513,9 @@ def chart_plot(df: pd.DataFrame, user_prompt: str) -> go.Figure:
         go.Figure: A Plotly figure object.
     """
     
-    logger.info(f"Generating chart for prompt: {user_prompt}")
+    logger.info("Generating chart for prompt: %s", user_prompt)
     
-    if df is None or df.empty:
+    if df is None or 0 in df.shape:
         logger.warning("No dataframe provided or dataframe is empty")
         fig = go.Figure()
         fig.add_annotation(text="No data available for plotting", xref="paper", yref="paper",
@@ -255,18 +524,36 @@ def chart_plot(df: pd.DataFrame, user_prompt: str) -> go.Figure:
     
     try:
         # Generate the plot using the LLM-powered function
-        plot_widget = generate_plot_widget(df, user_prompt)
-        
-        if not isinstance(plot_widget, go.Figure):
-            raise TypeError(f"The generated plot_widget is not a valid Plotly figure. Got: {type(plot_widget)}")
-        
-        return plot_widget
+        return generate_plot_widget(df, user_prompt)
         
     except Exception as e:
-        logger.error(f"Error in chart_plot: {e}")
+        logger.error("Error in chart_plot: %s", e)
         raise e
 
 
+async def chart_plot_many(df: pd.DataFrame, user_prompts: List[str]) -> List[go.Figure]:
+    """
+    Generate one chart per prompt from the same DataFrame, concurrently.
+    
+    Args:
+        df (pd.DataFrame): The dataframe containing the data to plot.
+        user_prompts (List[str]): The user's chart requests.
+        
+    Returns:
+        List[go.Figure]: The Plotly figures, in the order of user_prompts.
+    """
+    if df is None or 0 in df.shape:
+        return [chart_plot(df, user_prompt) for user_prompt in user_prompts]
+    
+    return list(await asyncio.gather(
+        *(generate_plot_widget_async(df, user_prompt) for user_prompt in user_prompts)
+    ))
+
+
+# Display names for the chart file types, by extension
+_CHART_FILE_TYPES = {".html": "HTML", ".png": "PNG"}
+
+
 def display_chart_info(chart_result: Dict[str, Any]) -> str:
     """
     Display information about a generated chart in a readable format.
@@ -295,9 +582,10 @@ def display_chart_info(chart_result: Dict[str, Any]) -> str:
 """
     
     files_saved = chart_info.get('files_saved', [])
-    for file_path in files_saved:
-        file_type = "HTML" if file_path.endswith('.html') else "PNG" if file_path.endswith('.png') else "Unknown"
-        info_text += f"  • {file_type}: {file_path}\n"
+    info_text += "".join(
+        f"  • {_CHART_FILE_TYPES.get(os.path.splitext(file_path)[1], 'Unknown')}: {file_path}\n"
+        for file_path in files_saved
+    )
     
     return info_text.strip()
 
@@ -321,16 +609,20 @@ def get_chart_summary(chart_result: Dict[str, Any]) -> Dict[str, Any]:
         }
     
     chart_info = chart_result.get("chart_info", {})
+    files_saved = chart_info.get("files_saved", [])
+    
+    # Classify the saved files in one pass
+    file_types = {_CHART_FILE_TYPES.get(os.path.splitext(f)[1]) for f in files_saved}
     
     return {
         "success": True,
         "request": chart_info.get("user_request"),
         "data_points": chart_info.get("data_shape", [0, 0])[0],
         "columns_count": len(chart_info.get("columns_used", [])),
-        "files_created": len(chart_info.get("files_saved", [])),
-        "html_available": any(f.endswith('.html') for f in chart_info.get("files_saved", [])),
-        "png_available": any(f.endswith('.png') for f in chart_info.get("files_saved", [])),
-        "file_paths": chart_info.get("files_saved", [])
+        "files_created": len(files_saved),
+        "html_available": "HTML" in file_types,
+        "png_available": "PNG" in file_types,
+        "file_paths": files_saved
     }
 
 
@@ -345,96 +637,147 @@ def create_fake_dataframe(attribute_name: Optional[str] = None) -> pd.DataFrame:
         pd.DataFrame: A fake dataframe with realistic geological data.
     """
     
-    import random
-    random.seed(42)  # Consistent fake data
+    rng = np.random.default_rng(42)  # Consistent fake data, without reseeding the global random module
     
     n_samples = 100
     
-    # Base DataFrame structure
+    # Base DataFrame structure; each column is drawn in one vectorized call
     data = {
         'sample_id': [f'SAMPLE_{i:03d}' for i in range(1, n_samples + 1)],
-        'depth_from': [round(random.uniform(0, 200), 1) for _ in range(n_samples)],
-        'depth_to': [round(random.uniform(200, 400), 1) for _ in range(n_samples)]
+        'depth_from': np.round(rng.uniform(0, 200, n_samples), 1),
+        'depth_to': np.round(rng.uniform(200, 400, n_samples), 1)
     }
     
     # Add attribute-specific data
     if attribute_name and attribute_name.lower() in ["gold", "au"]:
-        data['AU_PPM_LAB'] = [round(random.uniform(0.01, 10.0), 3) for _ in range(n_samples)]
-        data['AU_PPM_FIELD'] = [val * random.uniform(0.8, 1.2) for val in data['AU_PPM_LAB']]
+        data['AU_PPM_LAB'] = np.round(rng.uniform(0.01, 10.0, n_samples), 3)
+        data['AU_PPM_FIELD'] = data['AU_PPM_LAB'] * rng.uniform(0.8, 1.2, n_samples)
     elif attribute_name and attribute_name.lower() in ["copper", "cu"]:
-        data['CU_PCT_LAB'] = [round(random.uniform(0.1, 5.0), 2) for _ in range(n_samples)]
-        data['CU_PCT_FIELD'] = [val * random.uniform(0.9, 1.1) for val in data['CU_PCT_LAB']]
+        data['CU_PCT_LAB'] = np.round(rng.uniform(0.1, 5.0, n_samples), 2)
+        data['CU_PCT_FIELD'] = data['CU_PCT_LAB'] * rng.uniform(0.9, 1.1, n_samples)
     elif attribute_name and attribute_name.lower() in ["silver", "ag"]:
-        data['AG_PPM_LAB'] = [round(random.uniform(0.5, 50.0), 2) for _ in range(n_samples)]
-        data['AG_PPM_FIELD'] = [val * random.uniform(0.85, 1.15) for val in data['AG_PPM_LAB']]
+        data['AG_PPM_LAB'] = np.round(rng.uniform(0.5, 50.0, n_samples), 2)
+        data['AG_PPM_FIELD'] = data['AG_PPM_LAB'] * rng.uniform(0.85, 1.15, n_samples)
     else:
         # Generic multi-element data
-        data['AU_PPM_LAB'] = [round(random.uniform(0.01, 10.0), 3) for _ in range(n_samples)]
-        data['CU_PCT_LAB'] = [round(random.uniform(0.1, 5.0), 2) for _ in range(n_samples)]
-        data['AG_PPM_LAB'] = [round(random.uniform(0.5, 50.0), 2) for _ in range(n_samples)]
-        data['ZN_PCT_LAB'] = [round(random.uniform(0.05, 3.0), 2) for _ in range(n_samples)]
-        data['PB_PCT_LAB'] = [round(random.uniform(0.01, 2.0), 2) for _ in range(n_samples)]
+        data['AU_PPM_LAB'] = np.round(rng.uniform(0.01, 10.0, n_samples), 3)
+        data['CU_PCT_LAB'] = np.round(rng.uniform(0.1, 5.0, n_samples), 2)
+        data['AG_PPM_LAB'] = np.round(rng.uniform(0.5, 50.0, n_samples), 2)
+        data['ZN_PCT_LAB'] = np.round(rng.uniform(0.05, 3.0, n_samples), 2)
+        data['PB_PCT_LAB'] = np.round(rng.uniform(0.01, 2.0, n_samples), 2)
     
     # Add some geological context
     formations = ['Formation_A', 'Formation_B', 'Formation_C', 'Formation_D']
-    data['formation'] = [random.choice(formations) for _ in range(n_samples)]
+    data['formation'] = rng.choice(formations, n_samples)
     
     rock_types = ['Granite', 'Basalt', 'Limestone', 'Sandstone', 'Shale']
-    data['rock_type'] = [random.choice(rock_types) for _ in range(n_samples)]
+    data['rock_type'] = rng.choice(rock_types, n_samples)
     
     return pd.DataFrame(data)
 
 
+# Element symbols users commonly type instead of the attribute names
+_CHART_ATTRIBUTE_ALIASES = {"au": "gold", "ag": "silver", "cu": "copper", "pb": "lead", "zn": "zinc", "fe": "iron"}
+# Attribute requests are matched whole rather than searched for in a prompt, so the one- and
+# two-letter symbols that would match inside ordinary words are safe to accept here
+_TABLE_ATTRIBUTE_ALIASES = {**_CHART_ATTRIBUTE_ALIASES, "mo": "molybdenum", "u": "uranium"}
+
+
+@functools.lru_cache(maxsize=1)
+def _lowercased_table_names() -> Tuple[Tuple[Tuple[str, str], ...], Dict[str, Tuple[Tuple[str, str], ...]]]:
+    """
+    Lowercase the object and attribute names of the table data once, as (lowercased, name)
+    pairs in table order, so prompt matching doesn't lowercase every name on every call.
+    """
+    table_data = get_table_data()
+    object_names = tuple((name.lower(), name) for name in table_data)
+    attribute_names = {
+        name: tuple((attr.lower(), attr) for attr in attributes)
+        for name, attributes in table_data.items()
+    }
+    return object_names, attribute_names
+
+
+@functools.lru_cache(maxsize=1)
+def _attribute_lookup() -> Dict[str, Dict[str, str]]:
+    """Map each object's lowercased attribute names to the names, built once."""
+    _, attribute_names = _lowercased_table_names()
+    return {name: dict(attributes) for name, attributes in attribute_names.items()}
+
+
 # Chart generation helper functions moved from function_tools.py
 def extract_object_and_attribute(user_prompt: str) -> Tuple[str, str]:
     """Extract object name and attribute from user prompt."""
-    from .fake_data import FAKE_TABLE_DATA
+    table_data = get_table_data()
+    object_names, attribute_names = _lowercased_table_names()
     
     # Common patterns to look for object names
     prompt_lower = user_prompt.lower()
     
     # Look for object names in the prompt
     object_name = None
-    for obj_name in FAKE_TABLE_DATA.keys():
-        if obj_name.lower() in prompt_lower:
+    for obj_name_lower, obj_name in object_names:
+        if obj_name_lower in prompt_lower:
             object_name = obj_name
             break
     
     # Default to first available object if none found
     if not object_name:
-        object_name = list(FAKE_TABLE_DATA.keys())[0]
+        object_name = object_names[0][1]
     
     # Look for attribute names
     attribute_name = None
-    if object_name in FAKE_TABLE_DATA:
-        for attr_name in FAKE_TABLE_DATA[object_name].keys():
-            if attr_name.lower() in prompt_lower:
+    if object_name in table_data:
+        for attr_name_lower, attr_name in attribute_names[object_name]:
+            if attr_name_lower in prompt_lower:
                 attribute_name = attr_name
                 break
         
         # Check for common aliases
         if not attribute_name:
-            aliases = {"au": "gold", "ag": "silver", "cu": "copper", "pb": "lead", "zn": "zinc", "fe": "iron"}
-            for alias, real_attr in aliases.items():
-                if alias in prompt_lower and real_attr in FAKE_TABLE_DATA[object_name]:
+            for alias, real_attr in _CHART_ATTRIBUTE_ALIASES.items():
+                if alias in prompt_lower and real_attr in table_data[object_name]:
                     attribute_name = real_attr
                     break
     
     # Default to first available attribute if none found
-    if not attribute_name and object_name in FAKE_TABLE_DATA:
-        attribute_name = list(FAKE_TABLE_DATA[object_name].keys())[0]
+    if not attribute_name and object_name in table_data:
+        attribute_name = attribute_names[object_name][0][1]
     
     return object_name, attribute_name
 
 
+@functools.lru_cache(maxsize=None)
+def _fake_table_frame(object_name: str) -> pd.DataFrame:
+    """
+    Build the full DataFrame for one fake object once: every attribute plus sample IDs.
+    
+    The table data arrays are read-only, so the frame takes its own copy of each column.
+    """
+    object_data = get_table_data()[object_name]
+    df_data = dict(object_data)
+    
+    # Add sample IDs for reference
+    n_samples = len(next(iter(df_data.values())))
+    df_data['sample_id'] = [f'SAMPLE_{i+1:03d}' for i in range(n_samples)]
+    
+    return pd.DataFrame(df_data, copy=True)
+
+
 def create_dataframe_from_fake_data(object_name: str, attribute_name: str, user_prompt: str) -> pd.DataFrame:
-    """Create a DataFrame from our structured fake data."""
-    from .fake_data import FAKE_TABLE_DATA
+    """
+    Create a DataFrame from our structured fake data.
+    
+    Columns are selected from a per-object DataFrame built once, so repeated calls skip
+    the list-to-array conversion. The selection is a new DataFrame that callers may modify.
+    """
+    table_data = get_table_data()
     
-    if object_name not in FAKE_TABLE_DATA:
-        object_name = list(FAKE_TABLE_DATA.keys())[0]
+    if object_name not in table_data:
+        object_name = list(table_data.keys())[0]
     
-    object_data = FAKE_TABLE_DATA[object_name]
+    object_data = table_data[object_name]
+    frame = _fake_table_frame(object_name)
     
     # Determine which attributes to include
     prompt_lower = user_prompt.lower()
@@ -442,22 +785,113 @@ def create_dataframe_from_fake_data(object_name: str, attribute_name: str, user_
     # Multi-attribute analysis (scatter plots, correlations, etc.)
     if any(word in prompt_lower for word in ["vs", "versus", "against", "correlation", "scatter"]):
         # Include multiple attributes for comparison charts
-        df_data = {}
-        for attr, values in object_data.items():
-            df_data[attr] = values
+        columns = list(object_data.keys())
     else:
         # Single attribute analysis
         if attribute_name in object_data:
-            df_data = {attribute_name: object_data[attribute_name]}
+            columns = [attribute_name]
         else:
             # Fallback to first attribute
-            first_attr = list(object_data.keys())[0]
-            df_data = {first_attr: object_data[first_attr]}
+            columns = [next(iter(object_data))]
     
-    # Add sample IDs for reference
-    df_data['sample_id'] = [f'SAMPLE_{i+1:03d}' for i in range(len(list(df_data.values())[0]))]
+    return frame[columns + ['sample_id']]
+
+
+# Plain requests for the three common chart kinds, with no further styling instructions.
+# Anything else (caps, bin counts, log scales, colors) goes through the LLM.
+_FAST_CHART_PREFIX = r"(?:(?:plot|show|create|draw|make|generate|give me)\s+)?(?:(?:a|an|the|me a)\s+)?"
+_FAST_CHART_OBJECT = r"(?:\s+(?:assays?|values|data))?(?:\s+(?:of|in|for|from)\s+(?:the\s+)?\w+)?"
+_FAST_CHART_PATTERNS = {
+    "histogram": re.compile(
+        _FAST_CHART_PREFIX + r"histogram\s+of\s+(?:the\s+)?(?P<x>\w+)" + _FAST_CHART_OBJECT
+    ),
+    "box": re.compile(
+        _FAST_CHART_PREFIX + r"box\s*plot\s+of\s+(?:the\s+)?(?P<x>\w+)" + _FAST_CHART_OBJECT
+    ),
+    "scatter": re.compile(
+        _FAST_CHART_PREFIX + r"scatter(?:\s*plot)?\s+of\s+(?:the\s+)?(?P<x>\w+)\s+(?:vs\.?|versus|against)\s+"
+        r"(?:the\s+)?(?P<y>\w+)" + _FAST_CHART_OBJECT
+    ),
+}
+
+
+def _fast_chart_column(df: pd.DataFrame, name: str) -> Optional[str]:
+    """Resolve a prompt word to a DataFrame column, using the chart attribute aliases."""
+    name = _CHART_ATTRIBUTE_ALIASES.get(name, name)
+    return name if name in df.columns else None
+
+
+def generate_fast_chart(df: pd.DataFrame, user_prompt: str) -> Optional[go.Figure]:
+    """
+    Build common charts (histogram, box plot, scatter) locally with Plotly Express.
+    
+    Plain requests such as "histogram of gold", "box plot of silver" or "scatter of gold vs
+    copper" don't need generated code, so they skip the LLM and the remote code execution.
+    
+    Args:
+        df: DataFrame from create_dataframe_from_fake_data
+        user_prompt: The user's chart request
+        
+    Returns:
+        The figure, or None when the prompt needs the generic LLM path
+    """
+    prompt = " ".join(user_prompt.lower().split()).rstrip(".!")
+    for kind, pattern in _FAST_CHART_PATTERNS.items():
+        match = pattern.fullmatch(prompt)
+        if match:
+            break
+    else:
+        return None
+    
+    x = _fast_chart_column(df, match["x"])
+    y = _fast_chart_column(df, match["y"]) if kind == "scatter" else None
+    if x is None or (kind == "scatter" and y is None):
+        return None
+    
+    cleaned_df = _clean_dataframe_cached(df)
+    if cleaned_df.empty:
+        return None
+    
+    if kind == "histogram":
+        fig = px.histogram(cleaned_df, x=x, title=f"Histogram of {x}")
+    elif kind == "box":
+        fig = px.box(cleaned_df, y=x, title=f"Box plot of {x}")
+    else:
+        fig = px.scatter(cleaned_df, x=x, y=y, title=f"{x} vs {y}")
     
-    return pd.DataFrame(df_data)
+    logger.info("Chart generated locally for a %s request", kind)
+    return fig
+
+
+# Prompt for generate_simple_chart; only the request and the DataFrame shape vary per call
+_SIMPLE_CHART_PROMPT_TEMPLATE = (
+    "You are a helpful Python assistant that generates Plotly figures for geological data analysis.\n\n"
+    "User prompt: '{user_prompt}'\n\n"
+    "The available DataFrame columns are: {columns}\n"
+    "Primary attribute focus: '{attribute_name}'\n\n"
+    "GEOLOGICAL DATA CONTEXT:\n"
+    "- This is geological assay data with attributes like gold, silver, copper, zinc, etc.\n"
+    "- Values represent concentrations, grades, or measurements\n"
+    "- Use appropriate units and scaling for geological data visualization\n"
+    "- Consider log scales for highly variable data like precious metal concentrations\n\n"
+    "DATA PROVIDED:\n"
+    "The DataFrame has {n_rows} rows and {n_columns} columns.\n"
+    "Columns: {columns}\n\n"
+    "TASK:\n"
+    "Generate complete Python code that:\n"
+    "1. Creates a Plotly figure based on the user request.\n"
+    "2. At the end of the script, print the figure JSON using:\n"
+    "   `print('FIGURE_JSON:' + fig.to_json())`\n"
+    "3. Do not save any files locally.\n\n"
+    "IMPORTANT GUIDELINES:\n"
+    "- The DataFrame is already loaded as `df`.\n"
+    "- Available libraries: pandas as pd, plotly.express as px, plotly.graph_objects as go, numpy as np.\n"
+    "- When binning with `pd.cut`, convert intervals to strings with `.astype(str)`.\n"
+    "- Use `clip` for modifying values, not filtering.\n"
+    "- Add meaningful titles and axis labels with units when relevant.\n"
+    "- Use appropriate color scales for geological data.\n\n"
+    "Generate only the Python code without Markdown formatting."
+)
 
 
 def generate_simple_chart(df: pd.DataFrame, user_prompt: str, attribute_name: str) -> go.Figure:
@@ -466,38 +900,20 @@ def generate_simple_chart(df: pd.DataFrame, user_prompt: str, attribute_name: st
     Uses the secure code execution environment instead of local exec().
     """
     
+    columns = df.columns.tolist()
+    
     # Prepare the LLM prompt to generate complete chart creation code
-    conditional_prompt = (
-        "You are a helpful Python assistant that generates Plotly figures for geological data analysis.\n\n"
-        f"User prompt: '{user_prompt}'\n\n"
-        f"The available DataFrame columns are: {list(df.columns)}\n"
-        f"Primary attribute focus: '{attribute_name}'\n\n"
-        "GEOLOGICAL DATA CONTEXT:\n"
-        "- This is geological assay data with attributes like gold, silver, copper, zinc, etc.\n"
-        "- Values represent concentrations, grades, or measurements\n"
-        "- Use appropriate units and scaling for geological data visualization\n"
-        "- Consider log scales for highly variable data like precious metal concentrations\n\n"
-        "DATA PROVIDED:\n"
-        f"The DataFrame has {len(df)} rows and {len(df.columns)} columns.\n"
-        f"Columns: {list(df.columns)}\n\n"
-        "TASK:\n"
-        "Generate complete Python code that:\n"
-        "1. Creates a Plotly figure based on the user request.\n"
-        "2. At the end of the script, print the figure JSON using:\n"
-        "   `print('FIGURE_JSON:' + fig.to_json())`\n"
-        "3. Do not save any files locally.\n\n"
-        "IMPORTANT GUIDELINES:\n"
-        "- The DataFrame is already loaded as `df`.\n"
-        "- Available libraries: pandas as pd, plotly.express as px, plotly.graph_objects as go, numpy as np.\n"
-        "- When binning with `pd.cut`, convert intervals to strings with `.astype(str)`.\n"
-        "- Use `clip` for modifying values, not filtering.\n"
-        "- Add meaningful titles and axis labels with units when relevant.\n"
-        "- Use appropriate color scales for geological data.\n\n"
-        "Generate only the Python code without Markdown formatting."
-    )
-
-    # Get LLM-generated code
-    llm_code = generate_llm_response(conditional_prompt)
+    conditional_prompt = _SIMPLE_CHART_PROMPT_TEMPLATE.format_map({
+        'user_prompt': user_prompt,
+        'columns': columns,
+        'attribute_name': attribute_name,
+        'n_rows': len(df),
+        'n_columns': len(columns),
+    })
+
+    # Get LLM-generated code, reusing the code from an identical earlier request
+    cache_key = _chart_code_cache_key(user_prompt, attribute_name, columns)
+    llm_code = _generate_chart_code(cache_key, conditional_prompt)
 
     # Clean up any markdown formatting
     if "```" in llm_code:
@@ -516,44 +932,43 @@ def generate_simple_chart(df: pd.DataFrame, user_prompt: str, attribute_name: st
     logger.info(llm_code)
 
     # Clean the dataframe first
-    cleaned_df = clean_dataframe_for_analysis(df)
+    cleaned_df = _clean_dataframe_cached(df)
     if cleaned_df.empty:
         raise RuntimeError("No valid data available after cleaning")
 
-    logger.info(
-        f"Cleaned DataFrame info: shape={cleaned_df.shape}, columns={list(cleaned_df.columns)}"
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Cleaned DataFrame info: shape=%s, columns=%s", cleaned_df.shape, cleaned_df.columns.tolist()
+        )
 
     # Use the secure execute_code_with_dataframe function
     result = execute_code_with_dataframe(llm_code, cleaned_df)
 
     if not result["success"]:
-        logger.error(f"Secure code execution failed: {result['error']}")
+        _discard_chart_code(cache_key)
+        logger.error("Secure code execution failed: %s", result['error'])
         raise RuntimeError(f"Chart generation failed: {result['error']}")
 
     logger.info("Code executed successfully via secure code execution")
-    logger.info(f"Execution output: {result['output']}")
+    logger.info("Execution output: %s", result['output'])
 
     # Parse the output to find the figure JSON
-    output_lines = result["output"].split("\n")
-    fig_json = None
-
-    for line in output_lines:
-        if line.startswith("FIGURE_JSON:"):
-            fig_json = line.replace("FIGURE_JSON:", "", 1).strip()
-            break
+    match = _FIGURE_JSON_RE.search(result["output"])
+    fig_json = match.group(1).strip() if match else None
 
     if not fig_json:
+        _discard_chart_code(cache_key)
         raise RuntimeError("Figure JSON not found in execution output")
 
     try:
         fig = pio.from_json(fig_json)
     except Exception as e:
-        logger.error(f"Failed to parse figure JSON: {e}")
+        _discard_chart_code(cache_key)
+        logger.error("Failed to parse figure JSON: %s", e)
         raise RuntimeError(f"Failed to parse figure JSON: {e}")
 
     logger.info("Chart generated successfully via VertexAI code execution")
-    logger.info(f"Data points used: {len(cleaned_df)}")
+    logger.info("Data points used: %s", len(cleaned_df))
     return fig
 
 
@@ -577,8 +992,67 @@ def create_error_figure(error_message: str) -> go.Figure:
     return fig
 
 
-def save_chart_file(plotly_figure: go.Figure, user_prompt: str) -> str:
-    """Save chart as PNG file only."""
+@functools.cache
+def _start_image_server() -> None:
+    """
+    Keep one Kaleido browser process alive for all PNG exports, where the installed Kaleido
+    supports it, instead of starting one per image.
+    """
+    try:
+        import kaleido
+        if hasattr(kaleido, "start_sync_server"):
+            kaleido.start_sync_server(silence_warnings=True)
+    except Exception as e:
+        logger.warning("Persistent Kaleido server unavailable: %s", e)
+
+
+@functools.cache
+def _chart_file_executor() -> ThreadPoolExecutor:
+    """Worker threads for chart file writes, created on first use."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="chart-files")
+
+
+def _write_chart_files(plotly_figure: go.Figure) -> Tuple[Optional[str], str]:
+    """
+    Save a figure as PNG and HTML under generated_charts.
+    
+    Filenames use a nanosecond timestamp, so charts saved within the same second don't collide.
+    
+    Returns:
+        The PNG path, or None if the image could not be written (requires kaleido), and the HTML path
+    """
+    charts_dir = "generated_charts"
+    os.makedirs(charts_dir, exist_ok=True)
+    
+    stem = f"{charts_dir}/chart_{time.time_ns()}"
+    png_file = f"{stem}.png"
+    html_file = f"{stem}.html"
+    
+    # The HTML is written on a worker thread while Kaleido renders the PNG, which mostly waits on
+    # the browser process, so the two overlap instead of running back to back
+    html_writer = _chart_file_executor().submit(plotly_figure.write_html, html_file)
+    try:
+        _start_image_server()
+        plotly_figure.write_image(png_file, width=800, height=600)
+    except Exception as e:
+        logger.error("Could not save PNG file: %s", e)
+        png_file = None
+    html_writer.result()
+    return png_file, html_file
+
+
+def save_chart_file(plotly_figure: go.Figure, user_prompt: str, png_filename: Optional[str] = None) -> str:
+    """
+    Save chart as PNG file only.
+    
+    Args:
+        plotly_figure: The chart to save
+        user_prompt: The user's request, used in the generated filename
+        png_filename: Optional explicit PNG path; by default a timestamped name is generated
+        
+    Returns:
+        The PNG path, or the path of an error note if the image could not be written
+    """
     import os
     from datetime import datetime
     
@@ -591,20 +1065,22 @@ def save_chart_file(plotly_figure: go.Figure, user_prompt: str) -> str:
     safe_prompt = "".join(c for c in user_prompt if c.isalnum() or c in (' ', '-', '_')).rstrip()
     safe_prompt = safe_prompt.replace(' ', '_')[:50]  # Limit length
     
-    png_filename = f"{charts_dir}/chart_{timestamp}_{safe_prompt}.png"
+    if png_filename is None:
+        png_filename = f"{charts_dir}/chart_{timestamp}_{safe_prompt}.png"
     
     # Save as PNG (requires kaleido)
     try:
+        _start_image_server()
         plotly_figure.write_image(png_filename, width=800, height=600, format='png')
-        logger.info(f"Chart saved as PNG: {png_filename}")
+        logger.info("Chart saved as PNG: %s", png_filename)
         return png_filename
     except Exception as e:
-        logger.error(f"Could not save PNG file: {e}")
+        logger.error("Could not save PNG file: %s", e)
         # Create a fallback filename to indicate the error
         error_filename = f"{charts_dir}/chart_{timestamp}_error.txt"
         with open(error_filename, 'w') as f:
             f.write(f"Error saving chart: {e}\nPrompt: {user_prompt}")
-        logger.info(f"Error details saved to: {error_filename}")
+        logger.info("Error details saved to: %s", error_filename)
         return error_filename
 
 
@@ -620,10 +1096,10 @@ def get_object_id(object_name: str) -> Tuple[Optional[str], Optional[str], Optio
             (object_id, object_type, version_id, error_msg)
     """
     
-    logger.info(f"Getting object ID for: {object_name}")
+    logger.info("Getting object ID for: %s", object_name)
     
     # Check if object exists in our fake database
-    if object_name in FAKE_OBJECTS_DATABASE:
+    if object_name in get_objects_database():
         # Return placeholder IDs for testing
         return f"obj_id_{object_name}", "downhole-collection", "version_latest", None
     else:
@@ -632,8 +1108,9 @@ def get_object_id(object_name: str) -> Tuple[Optional[str], Optional[str], Optio
         return None, None, None, error_msg
 
 
-# Placeholder API functions that return fake data for testing
-async def get_list_of_objects_from_api(all_versions: bool = False) -> List[Dict[str, Any]]:
+# Placeholder API functions that return fake data for testing. They only read in-memory data, so
+# they are plain functions; function_tools._call_api accepts sync and async API functions alike.
+def get_list_of_objects_from_api(all_versions: bool = False) -> Sequence[Dict[str, Any]]:
     """
     Placeholder API function that returns fake objects data for testing.
     
@@ -641,15 +1118,27 @@ async def get_list_of_objects_from_api(all_versions: bool = False) -> List[Dict[
         all_versions (bool): If True, returns all versions, otherwise only latest versions.
         
     Returns:
-        List[Dict[str, Any]]: List of objects with their metadata.
+        Sequence[Dict[str, Any]]: Objects with their metadata.
     """
     if all_versions:
-        return FAKE_OBJECTS_ALL_VERSIONS
+        return get_objects_all_versions()
     else:
         return FAKE_OBJECTS_LIST
 
 
-async def get_objects_info_from_api(object_names: List[str]) -> List[Dict[str, Any]]:
+@functools.lru_cache(maxsize=1)
+def _available_object_names() -> Tuple[str, ...]:
+    """Names listed in "not found" responses of get_objects_info_from_api, built once."""
+    return tuple(get_objects_database())
+
+
+@functools.lru_cache(maxsize=1)
+def _available_versioned_object_names() -> Tuple[str, ...]:
+    """Names listed in "not found" responses of get_object_versions_info_from_api, built once."""
+    return tuple(get_object_versions_info())
+
+
+def get_objects_info_from_api(object_names: List[str]) -> List[Dict[str, Any]]:
     """
     Placeholder API function that returns fake detailed object information for testing.
     
@@ -659,19 +1148,20 @@ async def get_objects_info_from_api(object_names: List[str]) -> List[Dict[str, A
     Returns:
         List[Dict[str, Any]]: Detailed information for the requested objects.
     """
+    objects_database = get_objects_database()
     result = []
     for obj_name in object_names:
-        if obj_name in FAKE_OBJECTS_DATABASE:
-            result.append(FAKE_OBJECTS_DATABASE[obj_name])
+        if obj_name in objects_database:
+            result.append(objects_database[obj_name])
         else:
             result.append({
                 "error": f"Object '{obj_name}' not found in workspace",
-                "available_objects": list(FAKE_OBJECTS_DATABASE.keys())
+                "available_objects": _available_object_names()
             })
     return result
 
 
-async def get_object_versions_info_from_api(object_names: List[str]) -> List[Dict[str, Any]]:
+def get_object_versions_info_from_api(object_names: List[str]) -> List[Dict[str, Any]]:
     """
     Placeholder API function that returns fake version information for testing.
     
@@ -681,19 +1171,20 @@ async def get_object_versions_info_from_api(object_names: List[str]) -> List[Dic
     Returns:
         List[Dict[str, Any]]: Version information for the requested objects.
     """
+    versions_info = get_object_versions_info()
     result = []
     for obj_name in object_names:
-        if obj_name in FAKE_OBJECT_VERSIONS_INFO:
-            result.append(FAKE_OBJECT_VERSIONS_INFO[obj_name])
+        if obj_name in versions_info:
+            result.append(versions_info[obj_name])
         else:
             result.append({
                 "error": f"Object '{obj_name}' not found in workspace",
-                "available_objects": list(FAKE_OBJECT_VERSIONS_INFO.keys())
+                "available_objects": _available_versioned_object_names()
             })
     return result 
 
 
-async def download_table_data_from_api(object_name: str, collections_attribute: Optional[str]) -> List[float]:
+def download_table_data_from_api(object_name: str, collections_attribute: Optional[str]) -> List[float]:
     """
     Downloads table data for a specific collections attribute from an object.
     
@@ -704,103 +1195,313 @@ async def download_table_data_from_api(object_name: str, collections_attribute:
     Returns:
         List[float]: The downloaded data as a list of floats.
     """
-    from .fake_data import FAKE_TABLE_DATA
+    table_data = get_table_data()
     
-    logger.info(f"Downloading table data for {object_name}, attribute: {collections_attribute}")
+    logger.info("Downloading table data for %s, attribute: %s", object_name, collections_attribute)
     
-    object_id, object_type, version_id, error_msg = get_object_id(object_name)
-    
-    if error_msg:
-        logger.error(f"Error getting object ID: {error_msg}")
-        return []
+    # Try to get data for the specific object and attribute. The fake data is keyed by name, so
+    # the object ID is only looked up when there is no data for the object.
+    object_data = table_data.get(object_name)
+    if object_data:
+        # Use fake data from fake_data.py
+        logger.info("Using fake data from fake_data.py")
+        first_attr = next(iter(object_data))
+        if collections_attribute:
+            normalized_attr = collections_attribute.lower()
+            attr = _attribute_lookup()[object_name].get(normalized_attr)
+            if attr is not None:
+                # Direct match for the attribute
+                data = object_data[attr]
+                logger.info("Found fake data for %s.%s with %s values", object_name, collections_attribute, len(data))
+                return data.tolist()
 
-    # Use fake data from fake_data.py
-    logger.info("Using fake data from fake_data.py")
-    
-    # Try to get data for the specific object and attribute
-    if object_name in FAKE_TABLE_DATA:
-        object_data = FAKE_TABLE_DATA[object_name]
-        
-        if collections_attribute and collections_attribute.lower() in object_data:
-            # Direct match for the attribute
-            data = object_data[collections_attribute.lower()]
-            logger.info(f"Found fake data for {object_name}.{collections_attribute} with {len(data)} values")
-            return data
-        elif collections_attribute:
             # Try common attribute aliases
-            attribute_aliases = {
-                "au": "gold",
-                "ag": "silver", 
-                "cu": "copper",
-                "pb": "lead",
-                "zn": "zinc",
-                "fe": "iron",
-                "mo": "molybdenum",
-                "u": "uranium"
-            }
-            
-            normalized_attr = collections_attribute.lower()
-            if normalized_attr in attribute_aliases:
-                mapped_attr = attribute_aliases[normalized_attr]
-                if mapped_attr in object_data:
-                    data = object_data[mapped_attr]
-                    logger.info(f"Found fake data for {object_name}.{mapped_attr} (alias for {collections_attribute}) with {len(data)} values")
-                    return data
-            
+            mapped_attr = _TABLE_ATTRIBUTE_ALIASES.get(normalized_attr)
+            if mapped_attr in object_data:
+                data = object_data[mapped_attr]
+                logger.info("Found fake data for %s.%s (alias for %s) with %s values", object_name, mapped_attr, collections_attribute, len(data))
+                return data.tolist()
+
             # If specific attribute not found, return the first available attribute
-            if object_data:
-                first_attr = list(object_data.keys())[0]
-                data = object_data[first_attr]
-                logger.warning(f"Attribute '{collections_attribute}' not found for {object_name}, returning {first_attr} data with {len(data)} values")
-                return data
+            data = object_data[first_attr]
+            logger.warning("Attribute '%s' not found for %s, returning %s data with %s values", collections_attribute, object_name, first_attr, len(data))
+            return data.tolist()
         else:
             # No specific attribute requested, return first available
-            if object_data:
-                first_attr = list(object_data.keys())[0]
-                data = object_data[first_attr]
-                logger.info(f"No specific attribute requested for {object_name}, returning {first_attr} data with {len(data)} values")
-                return data
+            data = object_data[first_attr]
+            logger.info("No specific attribute requested for %s, returning %s data with %s values", object_name, first_attr, len(data))
+            return data.tolist()
+    
+    object_id, object_type, version_id, error_msg = get_object_id(object_name)
     
+    if error_msg:
+        logger.error("Error getting object ID: %s", error_msg)
+        return []
+
     # Fallback: object not found in fake data, generate basic placeholder
-    logger.warning(f"No fake data found for object '{object_name}', returning placeholder data")
-    import random
-    random.seed(hash(f"{object_name}_{collections_attribute}"))  # Consistent fake data
-    return [round(random.uniform(0.1, 100.0), 2) for _ in range(50)]
+    logger.warning("No fake data found for object '%s', returning placeholder data", object_name)
+    return list(_placeholder_table_data(object_name, collections_attribute))
+
+
+@functools.lru_cache(maxsize=128)
+def _placeholder_table_data(object_name: str, collections_attribute: Optional[str]) -> Tuple[float, ...]:
+    """Generate 50 placeholder values, the same for a given object and attribute in every run."""
+    # crc32 rather than hash(), which is salted per process for strings
+    seed = zlib.crc32(f"{object_name}_{collections_attribute}".encode())
+    return tuple(np.random.default_rng(seed).uniform(0.1, 100.0, 50).round(2).tolist())
+
+
+LLM_MODEL = "gemini-2.5-flash"
+# Default cap on concurrent requests for generate_llm_response_many
+LLM_MAX_CONCURRENCY = int(os.getenv("EVO_AI_LLM_MAX_CONCURRENCY") or 32)
+# Connection pool of the Gemini client. httpx keeps only 20 idle connections for 5 seconds by
+# default, so a full batch of concurrent requests or an agent pausing between calls would
+# reconnect; EVO_AI_LLM_MAX_CONNECTIONS sizes the pool, and every pooled connection is kept alive.
+LLM_MAX_CONNECTIONS = int(os.getenv("EVO_AI_LLM_MAX_CONNECTIONS") or 64)
+LLM_KEEPALIVE_EXPIRY = 60.0
+
+
+_genai_client_instance: Optional["genai.Client"] = None
+_genai_client_lock = threading.Lock()
+# Async clients per event loop, see _genai_async_client
+_genai_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+
+def _new_genai_client() -> "genai.Client":
+    """Create a Gemini client for the configured project, with the pooled HTTP transport."""
+    from google import genai
+
+    return genai.Client(
+        vertexai=True,
+        project=PROJECT_ID,
+        location=LOCATION,
+        http_options=pooled_http_options(
+            max_connections=LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_MAX_CONNECTIONS,
+            keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+def _genai_client() -> "genai.Client":
+    """
+    Initialize Vertex AI and create the Gemini client on first use, then share the client so
+    its connections and auth tokens are reused.
+
+    Creation is guarded by a lock because LLM calls also run in worker threads (via
+    asyncio.to_thread), and two first calls must not both initialize the SDK.
+    """
+    global _genai_client_instance
+    if _genai_client_instance is None:
+        with _genai_client_lock:
+            if _genai_client_instance is None:
+                import vertexai
+
+                # Set Google Cloud project information and initialize Vertex AI
+                vertexai.init(project=PROJECT_ID, location=LOCATION)
+                _genai_client_instance = _new_genai_client()
+    return _genai_client_instance
+
+
+def _genai_async_client() -> Any:
+    """
+    Return the Gemini async API (Client.aio) for the running event loop.
+
+    The async transport's pooled connections belong to the loop that opened them, so sharing
+    the client's .aio would leave a later asyncio.run() with connections of a closed loop.
+    Each loop gets its own client, dropped once the loop is garbage collected.
+    """
+    _genai_client()  # Initializes Vertex AI once
+    loop = asyncio.get_running_loop()
+    client = _genai_async_clients.get(loop)
+    if client is None:
+        client = _new_genai_client().aio
+        _genai_async_clients[loop] = client
+    return client
+
+
+@functools.cache
+def _generate_content_config() -> "types.GenerateContentConfig":
+    """Build the generation settings shared by every LLM call."""
+    from google.genai import types
+
+    return types.GenerateContentConfig(
+        temperature=0.0,
+        top_p=0.95,
+        max_output_tokens=8192,
+        response_modalities=["TEXT"],
+    )
+
+
+# LLM responses keyed on the exact prompt. Generation runs at temperature 0, so a repeated prompt
+# (a retry, a re-run of the same question) is answered from memory instead of another round trip.
+# EVO_AI_LLM_CACHE_TTL sets the expiry in seconds (default one hour; 0 keeps entries indefinitely)
+# and EVO_AI_LLM_CACHE_DISABLE turns the cache off, e.g. while debugging prompts.
+LLM_RESPONSE_CACHE_MAXSIZE = 1024
+LLM_RESPONSE_CACHE_TTL = float(os.getenv("EVO_AI_LLM_CACHE_TTL") or 3600)
+LLM_RESPONSE_CACHE_DISABLED = bool(os.getenv("EVO_AI_LLM_CACHE_DISABLE"))
+_llm_responses: "LRUCache[str, str]" = LRUCache(LLM_RESPONSE_CACHE_MAXSIZE, ttl=LLM_RESPONSE_CACHE_TTL)
+
+
+def _cached_llm_response(prompt: str, use_cache: bool) -> Optional[str]:
+    """Return the cached response for prompt, or None on a miss or when caching is off."""
+    if not use_cache or LLM_RESPONSE_CACHE_DISABLED:
+        return None
+    return _llm_responses.get(prompt)
+
+
+def _store_llm_response(prompt: str, response_text: Optional[str], use_cache: bool) -> None:
+    """Cache a non-empty response unless caching is off, evicting the least recently used entry."""
+    if use_cache and not LLM_RESPONSE_CACHE_DISABLED and response_text:
+        _llm_responses.set(prompt, response_text)
+
 
+def _llm_contents(prompt: str) -> List["types.Content"]:
+    """Wrap a prompt as a single user turn."""
+    from google.genai import types
 
-def generate_llm_response(conditional_RAG_prompt: str) -> str:
+    return [
+        types.Content(role="user", parts=[types.Part.from_text(text=prompt)]),
+    ]
+
+
+def generate_llm_response(conditional_RAG_prompt: str, use_cache: bool = True) -> str:
     """
     Generate a response using the Gemini LLM model.
     
     Args:
         conditional_RAG_prompt (str): The prompt to send to the LLM.
+        use_cache (bool): Whether to answer a repeated prompt from the response cache.
         
     Returns:
         str: The generated response text.
     """
-    client = genai.Client(
-        vertexai=True,
-        project=PROJECT_ID,
-        location=LOCATION,
+    llm_response = _cached_llm_response(conditional_RAG_prompt, use_cache)
+    if llm_response is not None:
+        return llm_response
+
+    response = _genai_client().models.generate_content(
+        model=LLM_MODEL,
+        contents=_llm_contents(conditional_RAG_prompt),
+        config=_generate_content_config(),
     )
 
-    model = "gemini-2.5-flash"    
-    contents = [
-        types.Content(role="user", parts=[types.Part.from_text(text=conditional_RAG_prompt)]),
-    ]
-    generate_content_config = types.GenerateContentConfig(
-        temperature=0.0,
-        top_p=0.95,
-        max_output_tokens=8192,
-        response_modalities=["TEXT"],
-    )
+    llm_response = response.text
+    _store_llm_response(conditional_RAG_prompt, llm_response, use_cache)
+
+    return llm_response
 
-    response = client.models.generate_content(
-        model=model,
-        contents=contents,
-        config=generate_content_config,
+
+async def generate_llm_response_async(conditional_RAG_prompt: str, use_cache: bool = True) -> str:
+    """
+    Async variant of generate_llm_response, using the client's native async API.
+    
+    Args:
+        conditional_RAG_prompt (str): The prompt to send to the LLM.
+        use_cache (bool): Whether to answer a repeated prompt from the response cache.
+        
+    Returns:
+        str: The generated response text.
+    """
+    llm_response = _cached_llm_response(conditional_RAG_prompt, use_cache)
+    if llm_response is not None:
+        return llm_response
+
+    response = await _genai_async_client().models.generate_content(
+        model=LLM_MODEL,
+        contents=_llm_contents(conditional_RAG_prompt),
+        config=_generate_content_config(),
     )
 
     llm_response = response.text
+    _store_llm_response(conditional_RAG_prompt, llm_response, use_cache)
+
+    return llm_response
 
-    return llm_response 
\ No newline at end of file
+
+def generate_llm_response_stream(conditional_RAG_prompt: str, use_cache: bool = True) -> Iterator[str]:
+    """
+    Stream a response from the Gemini LLM model as it is generated.
+    
+    Lets a consumer start on the text before the last token arrives. Once the stream completes,
+    the full text is cached like generate_llm_response's; a cached response is yielded whole.
+    
+    Args:
+        conditional_RAG_prompt (str): The prompt to send to the LLM.
+        use_cache (bool): Whether to answer a repeated prompt from the response cache.
+        
+    Yields:
+        str: Successive pieces of the response text.
+    """
+    llm_response = _cached_llm_response(conditional_RAG_prompt, use_cache)
+    if llm_response is not None:
+        yield llm_response
+        return
+
+    pieces = []
+    for chunk in _genai_client().models.generate_content_stream(
+        model=LLM_MODEL,
+        contents=_llm_contents(conditional_RAG_prompt),
+        config=_generate_content_config(),
+    ):
+        if chunk.text:
+            pieces.append(chunk.text)
+            yield chunk.text
+
+    _store_llm_response(conditional_RAG_prompt, "".join(pieces), use_cache)
+
+
+async def generate_llm_response_stream_async(
+    conditional_RAG_prompt: str, use_cache: bool = True
+) -> AsyncIterator[str]:
+    """
+    Async variant of generate_llm_response_stream, using the client's native async API.
+    
+    Args:
+        conditional_RAG_prompt (str): The prompt to send to the LLM.
+        use_cache (bool): Whether to answer a repeated prompt from the response cache.
+        
+    Yields:
+        str: Successive pieces of the response text.
+    """
+    llm_response = _cached_llm_response(conditional_RAG_prompt, use_cache)
+    if llm_response is not None:
+        yield llm_response
+        return
+
+    pieces = []
+    async for chunk in await _genai_async_client().models.generate_content_stream(
+        model=LLM_MODEL,
+        contents=_llm_contents(conditional_RAG_prompt),
+        config=_generate_content_config(),
+    ):
+        if chunk.text:
+            pieces.append(chunk.text)
+            yield chunk.text
+
+    _store_llm_response(conditional_RAG_prompt, "".join(pieces), use_cache)
+
+
+async def generate_llm_response_many(
+    prompts: List[str], max_concurrency: int = LLM_MAX_CONCURRENCY
+) -> List[str]:
+    """
+    Generate responses for several prompts concurrently.
+    
+    LLM calls are network-bound, so overlapping them makes a batch take roughly as long as its
+    slowest request instead of the sum of all of them.
+    
+    Args:
+        prompts (List[str]): The prompts to send to the LLM.
+        max_concurrency (int): Maximum number of requests in flight at once.
+        
+    Returns:
+        List[str]: The generated response texts, in the order of prompts.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _bounded(prompt: str) -> str:
+        async with semaphore:
+            return await generate_llm_response_async(prompt)
+    
+    return list(await asyncio.gather(*(_bounded(prompt) for prompt in prompts)))
@@ -29,13 +29,13 @@ def init_workspace_rag_engine(gcp_resource_id: str):
     try:
         rag_engine = RAGEngine(gcp_resource_id)
         if rag_engine.has_corpus():
-            logging.info(f"Initialized RAG engine {gcp_resource_id}")
+            logging.info("Initialized RAG engine %s", gcp_resource_id)
         else:
             rag_engine = RAGEngine(DEFAULT_RESOURCE_ID)
             if rag_engine.has_corpus():
-                logging.info(f"Initialized default RAG engine {DEFAULT_RESOURCE_ID}")
+                logging.info("Initialized default RAG engine %s", DEFAULT_RESOURCE_ID)
 
         return rag_engine
     except Exception as e:
-        logging.error(f"Failed to initialize RAG engine: {e}", exc_info=True)
+        logging.error("Failed to initialize RAG engine: %s", e, exc_info=True)
         return None
\ No newline at end of file
@@ -3,12 +3,22 @@ Utility functions for the Evo AI Agent.
 """
 
 import functools
+import importlib.util
+import inspect
 import logging
-from typing import Any, Callable, TypeVar
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from google.genai import types
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
 
 
 def with_logging(func: Callable[..., T]) -> Callable[..., T]:
@@ -22,32 +32,138 @@ def with_logging(func: Callable[..., T]) -> Callable[..., T]:
     Returns:
         The decorated function with logging.
     """
-    @functools.wraps(func)
-    async def async_wrapper(*args: Any, **kwargs: Any) -> T:
-        function_name = func.__name__
-        logger.info(f"Calling function: {function_name}")
-        try:
-            result = await func(*args, **kwargs)
-            logger.info(f"Function {function_name} completed successfully")
-            return result
-        except Exception as e:
-            logger.error(f"Function {function_name} failed with error: {e}", exc_info=True)
-            raise
+    function_name = func.__name__
+    
+    # Build only the wrapper matching the function, chosen once at decoration time
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> T:
+            logger.info("Calling function: %s", function_name)
+            try:
+                result = await func(*args, **kwargs)
+                logger.info("Function %s completed successfully", function_name)
+                return result
+            except Exception as e:
+                logger.error("Function %s failed with error: %s", function_name, e, exc_info=True)
+                raise
+        
+        return async_wrapper
     
     @functools.wraps(func)
     def sync_wrapper(*args: Any, **kwargs: Any) -> T:
-        function_name = func.__name__
-        logger.info(f"Calling function: {function_name}")
+        logger.info("Calling function: %s", function_name)
         try:
             result = func(*args, **kwargs)
-            logger.info(f"Function {function_name} completed successfully")
+            logger.info("Function %s completed successfully", function_name)
             return result
         except Exception as e:
-            logger.error(f"Function {function_name} failed with error: {e}", exc_info=True)
+            logger.error("Function %s failed with error: %s", function_name, e, exc_info=True)
             raise
     
-    # Return the appropriate wrapper based on whether the function is async or not
-    if hasattr(func, '__code__') and func.__code__.co_flags & 0x80:  # Check if coroutine
-        return async_wrapper
-    else:
-        return sync_wrapper 
\ No newline at end of file
+    return sync_wrapper
+
+
+def pooled_http_options(
+    max_connections: int, max_keepalive_connections: int, keepalive_expiry: float
+) -> "types.HttpOptions":
+    """
+    Build GenAI client HTTP options that keep a pool of keep-alive connections.
+    
+    The httpx limits are also applied to the async transport unless aiohttp is installed,
+    in which case the SDK sends async requests through aiohttp and would pass it the
+    httpx-only arguments.
+    
+    Args:
+        max_connections: Maximum number of concurrent connections.
+        max_keepalive_connections: Maximum number of idle connections kept open.
+        keepalive_expiry: Seconds an idle connection is kept open.
+        
+    Returns:
+        HttpOptions to pass to genai.Client.
+    """
+    import httpx
+    from google.genai import types
+    
+    pool_args = {
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+    }
+    async_pool_args = None if importlib.util.find_spec("aiohttp") else pool_args
+    return types.HttpOptions(client_args=pool_args, async_client_args=async_pool_args)
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Thread-safe least recently used cache with an optional time to live.
+    
+    Entries beyond maxsize are evicted oldest first. With a ttl, entries expire that many
+    seconds after they are stored; expiry times are wall-clock timestamps, so they can be
+    persisted and restored.
+    
+    Args:
+        maxsize: Maximum number of entries kept.
+        ttl: Seconds an entry stays valid; None or 0 keeps entries until they are evicted.
+    """
+    
+    def __init__(self, maxsize: int, ttl: Optional[float] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[K, Tuple[V, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Return the value for key and mark it recently used, or default on a miss or expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.time():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: K, value: V, expires_at: Optional[float] = None) -> None:
+        """
+        Store value under key, evicting the least recently used entries beyond maxsize.
+        
+        Args:
+            key: Cache key.
+            value: Value to store.
+            expires_at: Expiry timestamp overriding the ttl, e.g. for a restored entry.
+        """
+        if expires_at is None and self.ttl:
+            expires_at = time.time() + self.ttl
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Remove key and return its value, or default if it is not cached."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return default if entry is None else entry[0]
+    
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+    
+    def entries(self) -> List[Tuple[K, V, Optional[float]]]:
+        """Return the unexpired (key, value, expires_at) entries, least recently used first."""
+        now = time.time()
+        with self._lock:
+            return [
+                (key, value, expires_at)
+                for key, (value, expires_at) in self._entries.items()
+                if expires_at is None or expires_at >= now
+            ]
@@ -1,4 +1,28 @@
 from . import rag
+from ..utils import LRUCache
+
+# Corpora listings and corpus handles are reused for this many seconds, so
+# creating or refreshing engines doesn't repeat the same Vertex RPCs
+CORPORA_CACHE_TTL = 300
+CORPORA_CACHE_MAXSIZE = 64
+_corpora_cache = LRUCache(CORPORA_CACHE_MAXSIZE, ttl=CORPORA_CACHE_TTL)
+
+
+def _cached(key, fetch):
+    value = _corpora_cache.get(key)
+    if value is None:
+        value = fetch()
+        _corpora_cache.set(key, value)
+    return value
+
+
+def invalidate_corpora_cache():
+    '''
+    Forget cached corpora listings and corpus handles, e.g. after new data
+    has been loaded into a corpus.
+    '''
+    _corpora_cache.clear()
+
 
 def get_corpora_list(corpus_status=None):
     '''
@@ -7,8 +31,8 @@ def get_corpora_list(corpus_status=None):
     If corpus_status is specified, return only corpora with that status.
     '''
     all_corpora = {}
-    response = rag.list_corpora()
-    for corpus in response.rag_corpora:
+    rag_corpora = _cached("list_corpora", lambda: list(rag.list_corpora().rag_corpora))
+    for corpus in rag_corpora:
         if corpus_status is None or corpus.corpus_status == corpus_status:
             all_corpora[corpus.display_name] = corpus
     
@@ -20,6 +44,9 @@ class RAGCorpus:
         self.gcp_resource_id = gcp_resource_id
         
         self.corpus = None
+        # File names are listed once per instance; RAGEngine.refresh_corpus
+        # creates a new instance, which lists them again
+        self._file_names = None
         self.connect_to_corpus()
 
         self.corpus_name = self.corpus.name if self.corpus else None
@@ -34,18 +61,19 @@ class RAGCorpus:
             raise ValueError(f"Corpus {self.gcp_resource_id} not found")
         
         corpus_full_name =  all_corpora[self.gcp_resource_id].name
-        self.corpus = rag.get_corpus(name=corpus_full_name)
+        self.corpus = _cached(("corpus", corpus_full_name), lambda: rag.get_corpus(name=corpus_full_name))
 
     def get_file_names(self):
         if not self.corpus:
             return None
         
-        corpus_file_names = []
-        try:
-            files = rag.list_files(corpus_name=self.corpus.name)
-            for file in files:
-                corpus_file_names.append(file.display_name)
-        except Exception as e:
-            print(f"An error occurred: {e}")
+        if self._file_names is None:
+            try:
+                self._file_names = [
+                    file.display_name for file in rag.list_files(corpus_name=self.corpus.name)
+                ]
+            except Exception as e:
+                print(f"An error occurred: {e}")
+                return []
     
-        return [file.display_name for file in self.corpus.files]
\ No newline at end of file
+        return list(self._file_names)
\ No newline at end of file
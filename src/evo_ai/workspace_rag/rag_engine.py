@@ -1,4 +1,6 @@
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from . import rag
 
@@ -6,16 +8,31 @@ from vertexai.generative_models import (
     Tool
 )
 
-from .rag_corpus import RAGCorpus
+from .rag_corpus import RAGCorpus, invalidate_corpora_cache
+from ..utils import LRUCache
 
 DEFAULT_VDT = 0.5 
 DEFAULT_TOP_K = 10
+QUERY_CACHE_MAXSIZE = 512
+# Vertex RAG takes one query per request, so concurrent async queries are
+# spread over a bounded pool of worker threads instead
+QUERY_CONCURRENCY = 8
+
 
 class RAGEngine:
 
     def __init__(self, gcp_resource_id):
         self.gcp_resource_id = gcp_resource_id
         self.corpus = None
+        # Retrieval results by query, so a question repeated during a conversation
+        # skips the vector search; cleared when the corpus is refreshed
+        self._query_cache = LRUCache(QUERY_CACHE_MAXSIZE)
+        # Async queries currently being retrieved, so identical concurrent
+        # queries share one request
+        self._pending_queries = {}
+        self._query_executor = ThreadPoolExecutor(
+            max_workers=QUERY_CONCURRENCY, thread_name_prefix="rag-query"
+        )
         self.connect_to_corpus()
 
 
@@ -39,6 +56,52 @@ class RAGEngine:
         if not self.corpus:
             raise ValueError("No corpus connected")
         
+        cache_key = (self.corpus.corpus_name, query_text, top_k, vdt, concat_chunks)
+        result = self._query_cache.get(cache_key)
+        if result is not None:
+            return result
+        
+        result = self._retrieve(query_text, top_k, vdt, concat_chunks)
+        self._query_cache.set(cache_key, result)
+        return result
+
+
+    async def query_async(self, query_text, top_k=DEFAULT_TOP_K, vdt=DEFAULT_VDT, concat_chunks=True):
+        '''
+        Async variant of query. The blocking retrieval runs on the engine's
+        worker threads, and a query already in flight is awaited rather than
+        sent again.
+        '''
+        
+        loop = asyncio.get_running_loop()
+        key = (query_text, top_k, vdt, concat_chunks)
+        pending = self._pending_queries.get(key)
+        if pending is None or pending.get_loop() is not loop:
+            pending = loop.run_in_executor(
+                self._query_executor, self.query, query_text, top_k, vdt, concat_chunks
+            )
+            self._pending_queries[key] = pending
+            pending.add_done_callback(lambda future: self._forget_pending_query(key, future))
+        return await asyncio.shield(pending)
+
+
+    def _forget_pending_query(self, key, future):
+        if self._pending_queries.get(key) is future:
+            del self._pending_queries[key]
+
+
+    async def query_many(self, query_texts, top_k=DEFAULT_TOP_K, vdt=DEFAULT_VDT, concat_chunks=True):
+        '''
+        Run several queries concurrently, returning the results in order.
+        '''
+        
+        return await asyncio.gather(
+            *(self.query_async(query_text, top_k, vdt, concat_chunks) for query_text in query_texts)
+        )
+
+
+    def _retrieve(self, query_text, top_k, vdt, concat_chunks):
+        
         response = rag.retrieval_query(
             rag_resources=[
                 rag.RagResource(
@@ -50,15 +113,12 @@ class RAGEngine:
             vector_distance_threshold=vdt, 
         )
 
-        def serialize_chunk(chunk):
-            chunk_string = ""
-            chunk_string += f"Document: {chunk.source_display_name}\n"    
-            chunk_string += f"Content: {chunk.text}\n---\n"
-            return chunk_string
-        
         if concat_chunks:            
             # Combine the retrieved documents into a single text
-            combined_text = "\n".join([serialize_chunk(context) for context in response.contexts.contexts])
+            combined_text = "\n".join([
+                f"Document: {context.source_display_name}\nContent: {context.text}\n---\n"
+                for context in response.contexts.contexts
+            ])
             return combined_text
         else:
             return response
@@ -92,4 +152,6 @@ class RAGEngine:
         so we need to refresh the class instance.
         '''
         
+        self._query_cache.clear()
+        invalidate_corpora_cache()
         self.connect_to_corpus()
\ No newline at end of file
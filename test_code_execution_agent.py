@@ -3,8 +3,14 @@ Test file for code execution agent using simulated LLM-generated plotting functi
 This tests the secure code execution with actual geological data visualization code.
 """
 
+import asyncio
+import os
+import weakref
+import numpy as np
 import pandas as pd
-from src.evo_ai.code_execution_agent import execute_code
+import pytest
+from src.evo_ai import code_execution_agent
+from src.evo_ai.code_execution_agent import VertexAiCodeExecutor, execute_code
 from src.evo_ai.fake_data import FAKE_TABLE_DATA
 
 
@@ -28,11 +34,13 @@ def simulated_test_code():
         print(f"Available attributes: {list(object_data.keys())}")
         return
     
-    gold_data = object_data['gold']
+    gold_data = object_data['gold'].tolist()
     print(f"✅ Loaded {len(gold_data)} gold assay values from {object_name}")
     
-    # Create the complete code to execute including DataFrame creation and plotting
-    test_code = f"""
+    # Create the complete code to execute including DataFrame creation and plotting; the data is
+    # passed separately, so the code stays the same whatever the number of values
+    test_code = """
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -65,12 +73,11 @@ def llm_generated_plot(df):
         print("Warning: No valid 'gold' data found after cleaning. Cannot generate plot.")
         return px.scatter().update_layout(title="No data to display for Gold Assay Histogram")
 
-    # Create the histogram
-    fig = px.histogram(df_plot,
-                       x='gold',
-                       nbins=15,  # As requested by the user
-                       title='Distribution of Gold Assay (Thalanga Local Drillholes)'
-                      )
+    # Bin with NumPy and plot the bins as bars, so the figure carries 15 counts instead of
+    # every raw value for plotly.js to bin in the browser
+    counts, edges = np.histogram(df_plot['gold'].to_numpy(), bins=15)  # As requested by the user
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges)))
+    fig.update_layout(title='Distribution of Gold Assay (Thalanga Local Drillholes)')
 
     # Update layout for better readability and geological context
     fig.update_layout(
@@ -82,13 +89,12 @@ def llm_generated_plot(df):
 
     return fig
 
-# Create DataFrame with gold assay data
-gold_values = {gold_data}
-df = pd.DataFrame({{'gold': gold_values}})
+# Create DataFrame with gold assay data (gold_values is bound from the execution params)
+df = pd.DataFrame({'gold': gold_values})
 
-print(f"Created DataFrame with {{len(df)}} gold assay values")
-print(f"Gold data range: {{df['gold'].min():.3f}} to {{df['gold'].max():.3f}} g/t")
-print(f"Gold data mean: {{df['gold'].mean():.3f}} g/t")
+print(f"Created DataFrame with {len(df)} gold assay values")
+print(f"Gold data range: {df['gold'].min():.3f} to {df['gold'].max():.3f} g/t")
+print(f"Gold data mean: {df['gold'].mean():.3f} g/t")
 
 # Generate the plot
 fig = llm_generated_plot(df)
@@ -100,24 +106,27 @@ os.makedirs('generated_charts', exist_ok=True)
 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
 # Save the chart as both PNG and HTML
-png_file = f'generated_charts/thalanga_gold_histogram_{{timestamp}}.png'
-html_file = f'generated_charts/thalanga_gold_histogram_{{timestamp}}.html'
+png_file = f'generated_charts/thalanga_gold_histogram_{timestamp}.png'
+html_file = f'generated_charts/thalanga_gold_histogram_{timestamp}.html'
 
-try:
-    fig.write_image(png_file, width=800, height=600)
-    print(f"Chart saved as PNG: {{png_file}}")
-except Exception as e:
-    print(f"Could not save PNG: {{e}}")
+# PNG export starts a headless browser and takes seconds, so it only runs when requested
+# (export_png is bound from the execution params)
+if export_png:
+    try:
+        fig.write_image(png_file, width=800, height=600)
+        print(f"Chart saved as PNG: {png_file}")
+    except Exception as e:
+        print(f"Could not save PNG: {e}")
 
 try:
     fig.write_html(html_file)
-    print(f"Chart saved as HTML: {{html_file}}")
+    print(f"Chart saved as HTML: {html_file}")
 except Exception as e:
-    print(f"Could not save HTML: {{e}}")
+    print(f"Could not save HTML: {e}")
 
 print("Chart generation completed successfully!")
 print(f"Chart type: Histogram")
-print(f"Data points: {{len(df)}}")
+print(f"Data points: {len(df)}")
 print(f"Bins used: 15")
 """
     
@@ -125,7 +134,9 @@ print(f"Bins used: 15")
     print("=" * 60)
     
     # Execute the code using the secure code execution agent
-    result = execute_code(test_code)
+    # Set EVO_AI_EXPORT_PNG=1 to also render the chart as PNG
+    export_png = bool(os.getenv("EVO_AI_EXPORT_PNG"))
+    result = execute_code(test_code, params={"gold_values": gold_data, "export_png": export_png})
     
     print("EXECUTION RESULTS:")
     print("=" * 60)
@@ -192,7 +203,133 @@ print("Simple code execution test completed!")
     else:
         print(f"Error: {result['error']}")
     
-    return result
+    # Without credentials or network access the request itself fails; that is not a code failure
+    if not result.success and result.error.startswith(("Code execution failed", "VertexAI Code Executor not")):
+        pytest.skip(f"Gemini code execution is not available: {result.error}")
+    assert result.success, result.error
+    assert "Simple code execution test completed!" in result.output
+
+
+def test_validate_code_safety_flags_builtin_access():
+    """
+    The safety scan must catch the dangerous builtins however they are reached.
+    """
+    unsafe_snippets = [
+        "eval('1 + 1')",
+        "f = exec",
+        "import builtins\nbuiltins.__import__('os')",
+        "import builtins as b\nb.eval('1')",
+        "from builtins import exec as run",
+        "compile('1', '<string>', 'eval')",
+    ]
+    for code in unsafe_snippets:
+        is_safe, reason = VertexAiCodeExecutor.validate_code_safety(code)
+        assert not is_safe, code
+        assert reason.startswith("Potentially unsafe operation detected")
+
+
+def test_validate_code_safety_allows_lookalikes():
+    """
+    Regex compilation, strings and comments mentioning the builtins are not flagged.
+    """
+    safe_snippets = [
+        "import re\npattern = re.compile(r'Au_ppm')",
+        "print('do not eval this')",
+        "# exec is not used here\nx = 1",
+        "evaluation = 2",
+    ]
+    for code in safe_snippets:
+        is_safe, reason = VertexAiCodeExecutor.validate_code_safety(code)
+        assert is_safe, (code, reason)
+
+
+def _run_bound(code, params):
+    """Bind params into code the way execute_code does, run it locally and return its namespace."""
+    bound_code = code_execution_agent._bind_params(code, params, code_execution_agent._encode_params(params))
+    namespace = {}
+    exec(compile(bound_code, "<bound>", "exec"), namespace)
+    return bound_code, namespace
+
+
+def test_bind_params_keeps_docstring_and_future_imports_first():
+    code = '"""Plot gold."""\nfrom __future__ import annotations\ntotal = sum(gold_values)\n'
+    bound_code, namespace = _run_bound(code, {"gold_values": [1.5, 2.5]})
+
+    assert bound_code.startswith('"""Plot gold."""\nfrom __future__ import annotations\n')
+    assert namespace["total"] == 4.0
+    assert "_params" not in namespace
+
+
+def test_encode_params_handles_numpy_values_without_orjson(monkeypatch):
+    monkeypatch.setattr(code_execution_agent, "orjson", None)
+    params = {"values": np.array([0.5, 1.25]), "count": np.int64(2), "scale": np.float32(0.5)}
+    _, namespace = _run_bound("scaled = [v * scale for v in values]", params)
+
+    assert namespace["values"] == [0.5, 1.25]
+    assert namespace["count"] == 2
+    assert namespace["scaled"] == [0.25, 0.625]
+
+
+def test_execute_code_rejects_params_that_cannot_be_bound():
+    for params in ({"class": 1}, {"json": 1}, {"_params": 1}, {"gold values": 1}, {"values": object()}):
+        result = execute_code("print(values)", params=params)
+
+        assert not result.success, params
+        assert result.error.startswith("Invalid code execution parameters")
+
+
+def test_bind_params_without_params_leaves_code_unchanged():
+    assert code_execution_agent._bind_params("print(1)", None, "") == "print(1)"
+
+
+def test_canonicalize_code_ignores_comments_blank_lines_and_indentation():
+    canonical = code_execution_agent._canonicalize_code("x = 1\ny = 2\n")
+
+    assert code_execution_agent._canonicalize_code("x = 1  # first\n\n\ny = 2\n") == canonical
+    assert code_execution_agent._canonicalize_code("    x = 1\n    y = 2") == canonical
+    # A '#' inside a string is not a comment
+    assert "'#a'" in code_execution_agent._canonicalize_code("x = '#a'")
+    # Blank lines inside a string are part of its value
+    assert code_execution_agent._canonicalize_code('s = """a\n\nb"""') == 's = """a\n\nb"""'
+
+
+def test_canonicalize_code_keeps_f_string_spacing():
+    # The self-documenting f-string prints the spacing around '=', so the two differ
+    canonicalize = code_execution_agent._canonicalize_code
+
+    assert canonicalize('print(f"{ x = }")') != canonicalize('print(f"{x=}")')
+
+
+def test_response_cache_key_covers_code_params_project_and_model():
+    key = code_execution_agent._response_cache_key
+    base = key("x = 1", "project", "model")
+
+    assert key("x = 1  # same code", "project", "model") == base
+    assert key("x = 2", "project", "model") != base
+    assert key("x = 1", "project", "model", '{"a":1}') != base
+    assert key("x = 1", "other-project", "model") != base
+    assert key("x = 1", "project", "other-model") != base
+
+
+def test_executor_async_client_is_created_per_event_loop():
+    class FakeGenai:
+        class Client:
+            def __init__(self, **kwargs):
+                self.aio = object()
+
+    executor = VertexAiCodeExecutor.__new__(VertexAiCodeExecutor)
+    executor.project_id, executor.location = "project", "us-central1"
+    executor._genai = FakeGenai
+    executor._async_clients = weakref.WeakKeyDictionary()
+
+    async def clients():
+        return executor._async_client(), executor._async_client()
+
+    first, again = asyncio.run(clients())
+    second, _ = asyncio.run(clients())
+
+    assert first is again
+    assert second is not first
 
 
 if __name__ == "__main__":
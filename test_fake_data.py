@@ -0,0 +1,43 @@
+"""
+Tests for the memoized fake data getters.
+"""
+
+import pytest
+from src.evo_ai import fake_data
+
+
+def _object_with_versions():
+    """Name of a fake object with at least two detailed versions."""
+    for obj in fake_data.get_objects_all_versions():
+        if len(fake_data.get_versions(obj["name"])) >= 2:
+            return obj["name"]
+    pytest.skip("no fake object has two versions")
+
+
+def test_versions_before_matches_a_linear_scan():
+    name = _object_with_versions()
+    versions = fake_data.get_versions(name)
+    dates = [version.created_date for version in versions]
+    probes = ["0000", dates[0][:10], dates[0], dates[-1], "9999"]
+
+    for iso_date in probes:
+        expected = tuple(version for version in versions if version.created_date <= iso_date)
+        assert fake_data.versions_before(name, iso_date) == expected, iso_date
+    assert fake_data.versions_before("no_such_object", "9999") == ()
+
+
+def test_memoized_getters_return_immutable_values():
+    name = _object_with_versions()
+    element = next(iter(fake_data._inverted_indexes()["element"]))
+
+    with pytest.raises(TypeError):
+        fake_data.get_dimensions(name)["length"] = 0.0
+    with pytest.raises(AttributeError):
+        fake_data.find_objects_with_element(element).append("obj_id_new")
+    with pytest.raises(AttributeError):
+        fake_data.get_objects_all_versions().append({})
+    with pytest.raises(ValueError):
+        fake_data.get_bounding_boxes()[name][0] = 0.0
+    with pytest.raises(TypeError):
+        fake_data.get_table_stats("thalanga_local_drillholes_dt", "gold")["max"] = 0.0
+    assert fake_data.find_objects_with_attribute("no_such_attribute") == ()
@@ -0,0 +1,162 @@
+"""
+Tests for the API call helpers and caches in function_tools.
+"""
+
+import asyncio
+import pytest
+from src.evo_ai import function_tools
+from src.evo_ai.utils import LRUCache
+
+
+def _flaky(errors):
+    """Build an API function that raises the given errors in turn, then succeeds."""
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+
+    return fetch, calls
+
+
+def test_call_api_retries_transient_errors(monkeypatch):
+    monkeypatch.setattr(function_tools, "API_RETRY_INITIAL_DELAY", 0)
+    fetch, calls = _flaky([ConnectionError("reset"), TimeoutError("slow")])
+
+    assert asyncio.run(function_tools._call_api(fetch)) == "ok"
+    assert len(calls) == 3
+
+
+def test_call_api_raises_other_errors_immediately(monkeypatch):
+    monkeypatch.setattr(function_tools, "API_RETRY_INITIAL_DELAY", 0)
+    fetch, calls = _flaky([ValueError("unknown object")])
+
+    with pytest.raises(ValueError):
+        asyncio.run(function_tools._call_api(fetch))
+    assert len(calls) == 1
+
+
+def test_call_api_retries_httpx_timeouts_but_not_other_os_errors(monkeypatch):
+    httpx = pytest.importorskip("httpx")
+    monkeypatch.setattr(function_tools, "API_RETRY_INITIAL_DELAY", 0)
+    fetch, calls = _flaky([httpx.ReadTimeout("slow")])
+    assert asyncio.run(function_tools._call_api(fetch)) == "ok"
+    assert len(calls) == 2
+
+    fetch, calls = _flaky([FileNotFoundError("cache.json")])
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(function_tools._call_api(fetch))
+    assert len(calls) == 1
+
+
+def test_call_api_gives_up_after_the_last_attempt(monkeypatch):
+    monkeypatch.setattr(function_tools, "API_RETRY_INITIAL_DELAY", 0)
+    fetch, calls = _flaky([ConnectionError("down")] * function_tools.API_RETRY_ATTEMPTS)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(function_tools._call_api(fetch))
+    assert len(calls) == function_tools.API_RETRY_ATTEMPTS
+
+
+class _FakeRagEngine:
+    def __init__(self, corpus):
+        self.corpus = corpus
+
+    def has_corpus(self):
+        return self.corpus
+
+
+def test_get_rag_engine_only_keeps_an_engine_with_a_corpus(monkeypatch):
+    engines = [None, _FakeRagEngine(False), _FakeRagEngine(True), _FakeRagEngine(True)]
+    monkeypatch.setattr(function_tools, "_rag_engine", None)
+    monkeypatch.setattr(function_tools, "init_workspace_rag_engine", lambda resource_id: engines.pop(0))
+
+    assert function_tools._get_rag_engine() is None
+    assert not function_tools._get_rag_engine().has_corpus()
+    engine = function_tools._get_rag_engine()
+    assert engine.has_corpus()
+    assert function_tools._get_rag_engine() is engine
+    assert len(engines) == 1
+
+
+def test_get_rag_info_caches_answers_in_sqlite(monkeypatch, tmp_path):
+    class Engine(_FakeRagEngine):
+        async def query_async(self, query):
+            return f"context for {query}"
+
+    llm_calls = []
+
+    def fake_llm(prompt, use_cache=True):
+        llm_calls.append(use_cache)
+        return "A pointset is a set of sampled locations."
+
+    monkeypatch.setattr(function_tools, "RAG_CACHE_PATH", tmp_path / "rag_cache.sqlite3")
+    monkeypatch.setattr(function_tools, "_rag_cache_conn", None)
+    monkeypatch.setattr(function_tools, "_rag_engine", Engine(True))
+    monkeypatch.setattr(function_tools, "generate_llm_response", fake_llm)
+
+    first = asyncio.run(function_tools.get_rag_info("What is a pointset?"))
+    second = asyncio.run(function_tools.get_rag_info("What is a pointset?"))
+    function_tools._rag_cache_conn.close()
+
+    assert first == second == "A pointset is a set of sampled locations."
+    assert llm_calls == [False]
+
+
+def test_download_assay_data_returns_a_fresh_list(monkeypatch):
+    monkeypatch.setattr(function_tools, "_tool_cache", LRUCache(function_tools.TOOL_CACHE_MAXSIZE))
+    first = asyncio.run(function_tools.download_assay_data("thalanga_local_drillholes_dt", "gold"))
+    first.append(-1.0)
+    second = asyncio.run(function_tools.download_assay_data("thalanga_local_drillholes_dt", "gold"))
+
+    assert isinstance(second, list)
+    assert second == first[:-1]
+
+
+def test_tool_cache_evicts_the_least_recently_used_result(monkeypatch):
+    monkeypatch.setattr(function_tools, "_tool_cache", LRUCache(2))
+    function_tools._store_tool_result(("a",), 1)
+    function_tools._store_tool_result(("b",), 2)
+    assert function_tools._get_cached_tool_result(("a",)) == 1
+    function_tools._store_tool_result(("c",), 3)
+
+    assert function_tools._get_cached_tool_result(("b",)) is None
+    assert function_tools._get_cached_tool_result(("a",)) == 1
+    assert function_tools._get_cached_tool_result(("c",)) == 3
+
+
+def test_invalidate_objects_cache_refetches_the_object_lists(monkeypatch):
+    monkeypatch.setattr(function_tools, "_tool_cache", LRUCache(function_tools.TOOL_CACHE_MAXSIZE))
+    fetches = []
+
+    def fake_list(all_versions=False):
+        fetches.append(all_versions)
+        return [{"name": f"object_{len(fetches)}"}]
+
+    monkeypatch.setattr(function_tools, "get_list_of_objects_from_api", fake_list)
+    function_tools._store_tool_result(("download_assay_data", "dt", "gold"), (1.0,))
+
+    first = asyncio.run(function_tools.get_list_of_objects())
+    assert asyncio.run(function_tools.get_list_of_objects()) == first
+    asyncio.run(function_tools.get_list_of_objects_all_versions())
+    assert fetches == [False, True]
+
+    function_tools.invalidate_objects_cache()
+    assert asyncio.run(function_tools.get_list_of_objects()) != first
+    asyncio.run(function_tools.get_list_of_objects_all_versions())
+    assert fetches == [False, True, False, True]
+    # Other tool results are kept
+    assert function_tools._get_cached_tool_result(("download_assay_data", "dt", "gold")) == (1.0,)
+
+
+def test_get_list_of_objects_returns_a_fresh_list(monkeypatch):
+    monkeypatch.setattr(function_tools, "_tool_cache", LRUCache(function_tools.TOOL_CACHE_MAXSIZE))
+    for get_objects in (function_tools.get_list_of_objects, function_tools.get_list_of_objects_all_versions):
+        first = asyncio.run(get_objects())
+        first.pop()
+        second = asyncio.run(get_objects())
+
+        assert isinstance(second, list)
+        assert len(second) == len(first) + 1
@@ -0,0 +1,90 @@
+"""
+Tests for the DataFrame caches and the chart code cache in llm_utils.
+"""
+
+import asyncio
+import time
+import weakref
+import pandas as pd
+from src.evo_ai import llm_utils
+
+
+def _assay_frame():
+    return pd.DataFrame({
+        'sample_id': ['DH001-1', 'DH001-2', 'DH002-1', 'DH002-2'],
+        'gold': [1.2, 0.4, 3.1, 0.9],
+    })
+
+
+def test_frame_fingerprint_depends_on_row_order():
+    """
+    Sorting keeps the index labels, so the same (index, row) pairs appear in a different order;
+    the fingerprint must still tell the two frames apart.
+    """
+    df = _assay_frame()
+    sorted_df = df.sort_values('gold')
+
+    assert llm_utils._frame_fingerprint(df) == llm_utils._frame_fingerprint(df.copy())
+    assert llm_utils._frame_fingerprint(df) != llm_utils._frame_fingerprint(sorted_df)
+
+    numeric_df = df.set_index('sample_id')
+    assert llm_utils._frame_fingerprint(numeric_df) != llm_utils._frame_fingerprint(numeric_df.iloc[::-1])
+
+
+def test_clean_dataframe_cached_keeps_row_order():
+    df = _assay_frame()
+    sorted_df = df.sort_values('gold')
+
+    assert llm_utils._clean_dataframe_cached(df)['gold'].tolist() == [1.2, 0.4, 3.1, 0.9]
+    assert llm_utils._clean_dataframe_cached(sorted_df)['gold'].tolist() == [0.4, 0.9, 1.2, 3.1]
+
+
+def test_chart_code_cache_persists_entries_across_reloads(monkeypatch, tmp_path):
+    monkeypatch.setattr(llm_utils, "CHART_CODE_CACHE_PATH", tmp_path / "chart_code_cache.json")
+    monkeypatch.setattr(llm_utils, "_chart_code_cache", None)
+    cache_key = llm_utils._chart_code_cache_key("Histogram of  GOLD", "gold", ["gold"])
+
+    llm_utils._store_chart_code(cache_key, "fig = px.histogram(df, x='gold')")
+    assert llm_utils._cached_chart_code(cache_key) == "fig = px.histogram(df, x='gold')"
+    assert llm_utils._chart_code_cache_key("histogram of gold", "gold", ["gold"]) == cache_key
+
+    # The entry is written to disk and survives a reload
+    monkeypatch.setattr(llm_utils, "_chart_code_cache", None)
+    assert llm_utils._cached_chart_code(cache_key) == "fig = px.histogram(df, x='gold')"
+
+
+def test_chart_code_cache_entries_expire_after_the_ttl(monkeypatch, tmp_path):
+    monkeypatch.setattr(llm_utils, "CHART_CODE_CACHE_PATH", tmp_path / "chart_code_cache.json")
+    monkeypatch.setattr(llm_utils, "CHART_CODE_CACHE_TTL", 60)
+    monkeypatch.setattr(llm_utils, "_chart_code_cache", None)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    cache_key = llm_utils._chart_code_cache_key("histogram of gold", "gold", ["gold"])
+    llm_utils._store_chart_code(cache_key, "fig = px.histogram(df, x='gold')")
+
+    # The entry is persisted with its expiry time, so a reload keeps it until then
+    monkeypatch.setattr(llm_utils, "_chart_code_cache", None)
+    monkeypatch.setattr(time, "time", lambda: now + 59)
+    assert llm_utils._cached_chart_code(cache_key) == "fig = px.histogram(df, x='gold')"
+
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert llm_utils._cached_chart_code(cache_key) is None
+
+
+def test_genai_async_client_is_created_per_event_loop(monkeypatch):
+    class FakeClient:
+        def __init__(self):
+            self.aio = object()
+
+    monkeypatch.setattr(llm_utils, "_genai_client", lambda: None)
+    monkeypatch.setattr(llm_utils, "_new_genai_client", FakeClient)
+    monkeypatch.setattr(llm_utils, "_genai_async_clients", weakref.WeakKeyDictionary())
+
+    async def clients():
+        return llm_utils._genai_async_client(), llm_utils._genai_async_client()
+
+    first, again = asyncio.run(clients())
+    second, _ = asyncio.run(clients())
+
+    assert first is again
+    assert second is not first
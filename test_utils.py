@@ -0,0 +1,46 @@
+"""
+Tests for the shared LRU/TTL cache helper.
+"""
+
+import time
+from src.evo_ai.utils import LRUCache
+
+
+def test_lru_cache_evicts_the_least_recently_used_entry():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" is now the most recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_lru_cache_expires_entries_after_the_ttl(monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    cache = LRUCache(maxsize=4, ttl=60)
+    cache.set("fresh", "kept")
+    cache.set("restored", "stale", expires_at=now - 1)
+
+    assert cache.get("fresh") == "kept"
+    assert cache.get("restored") is None
+    assert [key for key, _, _ in cache.entries()] == ["fresh"]
+
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert cache.get("fresh") is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_pop_and_clear():
+    cache = LRUCache(maxsize=4)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "missing") == "missing"
+    cache.clear()
+    assert cache.get("b") is None